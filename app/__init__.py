@@ -3,23 +3,25 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
 from config import Config
-import logging
 import os
 
 db = SQLAlchemy()
 migrate = Migrate()
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__, template_folder='templates', static_folder='static')
     app.config.from_object(Config)
     
-    # Configurar logging
-    log_level = getattr(logging, app.config.get('LOG_LEVEL', 'INFO'))
-    logging.basicConfig(level=log_level)
-    app.logger.setLevel(log_level)
+    # Valores que substituem os do ambiente (testes e benchmarks com banco próprio)
+    if config:
+        app.config.update(config)
+    
+    # Configurar logging (fila + thread de escrita, JSON estruturado, amostragem por rota)
+    from app.utils.log import configure_logging
+    configure_logging(app)
     
     # Log da configuração do banco
-    app.logger.info(f'Conectando ao banco: {app.config["SQLALCHEMY_DATABASE_URI"][:50]}...')
+    app.logger.info('Conectando ao banco: %s...', app.config['SQLALCHEMY_DATABASE_URI'][:50])
     
     db.init_app(app)
     migrate.init_app(app, db)
@@ -27,61 +29,49 @@ def create_app():
     # Configurar CORS para permitir requisições do frontend
     CORS(app, origins=['*'])
 
+    # Cache das respostas da listagem, invalidado pela versão dos dados
+    from app.utils.response_cache import ResponseCache
+    app.extensions['list_cache'] = ResponseCache(
+        max_entries=app.config['LIST_CACHE_MAX_ENTRIES'],
+        ttl=app.config['LIST_CACHE_TTL']
+    )
+
+    # Tokens JWT já verificados, com o tamanho configurado para esta aplicação
+    from app.utils.auth import verified_tokens
+    verified_tokens.init_app(app)
+
     # Importar modelos para que o Flask-Migrate os reconheça
-    from app.models import user, employee, document
+    from app.models import user, employee, document, data_version, idempotency_key, refresh_token
+
+    # Perfil por endpoint (opcional): hooks e eventos só são registrados se ativado
+    from app.utils.profiling import request_profiler
+    request_profiler.init_app(app)
+
+    # Aviso de statements repetidos na mesma requisição (N+1), para desenvolvimento
+    from app.utils.query_counter import query_detector
+    query_detector.init_app(app)
 
     from app.routes import bp
     app.register_blueprint(bp)
+
+    # Amostragem de logs configurada para rotas inexistentes não tem efeito
+    from app.utils.log import parse_sample_rates
+    parse_sample_rates(app.config['LOG_SAMPLE_RATES'], app.view_functions)
     
-    # Verificar conexão e criar tabelas se necessário
-    with app.app_context():
-        try:
-            from sqlalchemy import text, inspect
-            
-            # Testar conexão
-            db.session.execute(text('SELECT 1'))
-            app.logger.info('Conexão com banco de dados estabelecida com sucesso')
-            
-            # Verificar se tabelas existem
-            inspector = inspect(db.engine)
-            existing_tables = inspector.get_table_names()
-            app.logger.info(f'Tabelas existentes: {existing_tables}')
-            
-            # Verificar se todas as tabelas necessárias existem
-            required_tables = ['users', 'employees', 'documents']
-            missing_tables = [table for table in required_tables if table not in existing_tables]
-            
-            if missing_tables:
-                app.logger.warning(f'Tabelas faltando: {missing_tables}. Criando todas as tabelas...')
-                
-                # Tentar executar migrations primeiro
-                try:
-                    from flask_migrate import upgrade
-                    upgrade()
-                    app.logger.info('✅ Migrations executadas - todas as tabelas criadas!')
-                except Exception as migrate_error:
-                    app.logger.warning(f'Erro nas migrations: {migrate_error}')
-                    app.logger.info('Criando todas as tabelas manualmente...')
-                    
-                    # Fallback: criar tabelas manualmente
-                    db.create_all()
-                    app.logger.info('✅ Todas as tabelas criadas manualmente!')
-                
-                # Verificar novamente todas as tabelas
-                inspector = inspect(db.engine)
-                final_tables = inspector.get_table_names()
-                app.logger.info(f'Tabelas após criação: {final_tables}')
-                
-                # Verificar cada tabela individualmente
-                for table in required_tables:
-                    if table in final_tables:
-                        app.logger.info(f'✅ Tabela {table} criada com sucesso!')
-                    else:
-                        app.logger.error(f'❌ Falha ao criar tabela {table}!')
-            else:
-                app.logger.info(f'✅ Todas as tabelas já existem: {required_tables}')
-                
-        except Exception as e:
-            app.logger.error(f'Erro ao conectar com banco de dados: {str(e)}')
+    # Schema verificado em uma consulta; migrations rodam na etapa de release (manage.py release)
+    from app.services.schema_service import init_schema_check
+    init_schema_check(app)
+
+    # Iniciar atualização agendada do status dos documentos (após garantir as tabelas)
+    from app.services.document_status_service import status_scheduler
+    status_scheduler.init_app(app)
+
+    # Pool limitada para os hashes de senha (login e cadastro)
+    from app.services.password_service import password_pool
+    password_pool.init_app(app)
+
+    # Filtro de CPFs cadastrados, construído em segundo plano
+    from app.services.cpf_filter_service import cpf_filter
+    cpf_filter.init_app(app)
 
     return app
@@ -0,0 +1,57 @@
+from contextlib import asynccontextmanager
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.routing import Match
+from app import create_app
+from app.asgi.database import create_session_factory
+from app.asgi.routes import routes
+
+
+class AsyncDispatcher:
+    """Envia as rotas assíncronas ao Starlette e todas as demais ao Flask via WSGI.
+
+    Assim as rotas quentes da API rodam no event loop sem bloquear em I/O,
+    enquanto páginas, importação, exportação e administração continuam
+    atendidas pelo mesmo código Flask em um pool de threads.
+    """
+
+    def __init__(self, async_app, wsgi_app):
+        self.async_app = async_app
+        self.wsgi_app = wsgi_app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan' or (scope['type'] == 'http' and self._is_async(scope)):
+            await self.async_app(scope, receive, send)
+        else:
+            await self.wsgi_app(scope, receive, send)
+
+    @staticmethod
+    def _is_async(scope):
+        return any(route.matches(scope)[0] == Match.FULL for route in routes)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await app.state.engine.dispose()
+
+
+def create_asgi_app(flask_app=None):
+    """Aplicação ASGI: rotas da API com SQLAlchemy asyncio e o restante no Flask"""
+    flask_app = flask_app or create_app()
+    engine, session_factory = create_session_factory(flask_app.config)
+
+    async_app = Starlette(
+        routes=routes,
+        middleware=[Middleware(CORSMiddleware, allow_origins=['*'])],
+        lifespan=lifespan
+    )
+    async_app.state.flask_app = flask_app
+    async_app.state.engine = engine
+    async_app.state.session_factory = session_factory
+    async_app.state.dialect = engine.dialect.name
+
+    wsgi_app = WSGIMiddleware(flask_app, workers=flask_app.config['ASGI_WSGI_THREADS'])
+    return AsyncDispatcher(async_app, wsgi_app)
@@ -0,0 +1,73 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.models.data_version import DataVersion
+from app.services.data_version_service import (
+    EMPLOYEES,
+    bump_data_version_statement,
+    cached_data_version,
+    create_data_version_statement,
+    data_version_query,
+    mark_data_version_bumped,
+    remember_data_version
+)
+
+# Driver asyncio equivalente a cada banco suportado
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite'
+}
+
+
+def async_database_url(url):
+    """Troca o driver síncrono da DATABASE_URL pelo equivalente asyncio.
+
+    Retorna (url, connect_args); o sslmode da libpq vira o parâmetro ssl do asyncpg.
+    """
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f'Banco sem driver assíncrono: {url.get_backend_name()}')
+
+    connect_args = {}
+    if driver == 'postgresql+asyncpg' and 'sslmode' in url.query:
+        connect_args['ssl'] = url.query['sslmode']
+        url = url.difference_update_query(['sslmode'])
+
+    return url.set(drivername=driver), connect_args
+
+
+def create_session_factory(config):
+    """Engine asyncio e fábrica de sessões com as mesmas opções do engine síncrono"""
+    url, connect_args = async_database_url(config['SQLALCHEMY_DATABASE_URI'])
+
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    if url.get_backend_name() == 'postgresql':
+        options['pool_size'] = config['ASYNC_DB_POOL_SIZE']
+        options['max_overflow'] = config['ASYNC_DB_MAX_OVERFLOW']
+
+    engine = create_async_engine(url, connect_args=connect_args, **options)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def get_data_version(session, name=EMPLOYEES, max_age=0):
+    """Equivalente assíncrono de data_version_service.get_data_version (mesmo cache do processo)"""
+    version = cached_data_version(name, max_age)
+    if version is not None:
+        return version
+
+    version = (await session.execute(data_version_query(name))).scalar() or 0
+    remember_data_version(name, version)
+    return version
+
+
+async def bump_data_version(session, name=EMPLOYEES):
+    """Equivalente assíncrono de data_version_service.bump_data_version"""
+    statement = bump_data_version_statement(name).returning(DataVersion.version)
+    version = (await session.execute(statement)).scalar()
+
+    if version is None:
+        await session.execute(create_data_version_statement(name, session.bind.dialect.name))
+        version = (await session.execute(statement)).scalar()
+
+    mark_data_version_bumped(session.sync_session, name)
+    return version
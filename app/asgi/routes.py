@@ -0,0 +1,421 @@
+import asyncio
+from datetime import datetime
+from functools import wraps
+from urllib.parse import parse_qs
+from sqlalchemy import insert, select
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.routing import Match, Route
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_etags
+from app.asgi.database import bump_data_version, get_data_version
+from app.models.document import Document
+from app.models.employee import Employee
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.services.cpf_filter_service import cpf_filter
+from app.services.data_version_service import EMPLOYEE_CPFS
+from app.services.document_status_service import status_scheduler
+from app.services.password_service import PASSWORD_POOL_BUSY, PasswordPoolBusy, password_pool
+from app.services.refresh_token_service import new_refresh_token
+from app.services.employee_service import (
+    SEARCH_LIMIT,
+    build_employee_rows,
+    cpf_exists_query,
+    employee_detail_item,
+    employee_detail_query,
+    employee_list_item,
+    employee_version_query,
+    employees_page,
+    existing_cpfs_query,
+    list_employees_query,
+    search_employees_query
+)
+from app.utils.auth import parse_authorization, token_pair
+from app.utils.cpf import format_cpf, normalize_cpf
+from app.utils.pagination import cursor_text, cursor_uuid, decode_cursor, encode_cursor, parse_limit
+from app.utils.sql import insert_ignoring_conflicts
+from app.utils.validation import parse_cpf_batch, parse_employee_payload, validate_new_user
+
+DOCUMENT_STATUSES = ('expired', 'expiring', 'valid')
+
+
+class AsyncRoute(Route):
+    """Rota assíncrona; requisições em que sync_when(scope) é verdadeiro seguem para o Flask"""
+
+    def __init__(self, path, endpoint, methods, sync_when=None):
+        super().__init__(path, endpoint, methods=methods)
+        self.sync_when = sync_when
+
+    def matches(self, scope):
+        match, child_scope = super().matches(scope)
+        if match == Match.FULL and self.sync_when is not None and self.sync_when(scope):
+            return Match.NONE, {}
+        return match, child_scope
+
+
+def _has_idempotency_key(scope):
+    # Respostas gravadas por Idempotency-Key ficam a cargo do decorator @idempotent do Flask
+    return 'idempotency-key' in Headers(scope=scope)
+
+
+def _wants_stream(scope):
+    # Listagem em streaming continua no Flask (cursor do servidor com yield_per)
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    if query.get('stream', [None])[0] == '1':
+        return True
+    accept = parse_accept_header(Headers(scope=scope).get('accept'), MIMEAccept)
+    return accept.best_match(['application/json', 'application/x-ndjson']) == 'application/x-ndjson'
+
+
+def _json(request, data, status_code=200):
+    # Mesmo corpo gerado pelo jsonify do Flask, para o cache de respostas ser compartilhado
+    return Response(_dumps(request, data), status_code=status_code, media_type='application/json')
+
+
+def _dumps(request, data):
+    return request.app.state.flask_app.json.dumps(data, indent=None, separators=(',', ':')) + '\n'
+
+
+def _message(request, message, status_code):
+    return _json(request, {'message': message}, status_code)
+
+
+def _password_pool_busy(request):
+    response = _message(request, PASSWORD_POOL_BUSY, 503)
+    response.headers['Retry-After'] = '1'
+    return response
+
+
+def _logger(request):
+    return request.app.state.flask_app.logger
+
+
+def _config(request):
+    return request.app.state.flask_app.config
+
+
+async def _read_json(request):
+    """Corpo JSON da requisição, ou None se o Content-Type não for JSON ou o corpo for inválido"""
+    content_type = request.headers.get('content-type', '').split(';')[0].strip()
+    if content_type != 'application/json' and not content_type.endswith('+json'):
+        return None
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+def _not_modified(request, etag):
+    if parse_etags(request.headers.get('if-none-match')).contains(etag):
+        return _with_etag(Response(status_code=304), etag)
+    return None
+
+
+def _with_etag(response, etag):
+    response.headers['ETag'] = f'"{etag}"'
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def authenticated(handler):
+    @wraps(handler)
+    async def decorated(request):
+        user_id, error = parse_authorization(request.headers.get('authorization'))
+        if error:
+            message, status_code = error
+            return _message(request, message, status_code)
+
+        request.state.user_id = user_id
+        return await handler(request)
+
+    return decorated
+
+
+@authenticated
+async def create_employee(request):
+    try:
+        data = await _read_json(request)
+        if data is None:
+            return _message(request, 'Content-Type deve ser application/json', 400)
+
+        fields, error = parse_employee_payload(data)
+        if error:
+            return _message(request, error, 400)
+
+        employee_row, document_rows, error = build_employee_rows(**fields)
+        if error:
+            return _message(request, error, 400)
+
+        async with request.app.state.session_factory() as session:
+            # ON CONFLICT (cpf) DO NOTHING: a unicidade é decidida pelo próprio INSERT
+            statement = insert_ignoring_conflicts(Employee, Employee.cpf, dialect=request.app.state.dialect)
+            inserted = (await session.execute(
+                statement.values(employee_row).returning(Employee.cpf)
+            )).first()
+            if inserted is None:
+                return _message(request, 'CPF já cadastrado', 400)
+
+            if document_rows:
+                await session.execute(insert(Document).values(document_rows))
+
+            await bump_data_version(session)
+            cpfs_version = await bump_data_version(session, EMPLOYEE_CPFS)
+            await session.commit()
+
+        status_scheduler.schedule(employee_row['next_status_change_at'])
+        cpf_filter.add([employee_row['cpf']], cpfs_version)
+
+        _logger(request).info('Funcionário criado com sucesso: %s (CPF: %s)', fields['employee_name'], format_cpf(fields['cpf']))
+        return _json(request, {'message': 'Funcionário criado com sucesso', 'employeeId': employee_row['id']}, 201)
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao criar funcionário: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+@authenticated
+async def list_employees(request):
+    try:
+        try:
+            limit = parse_limit(request.query_params.get('limit'))
+            cursor = request.query_params.get('cursor')
+            after = decode_cursor(cursor, cursor_text, cursor_uuid) if cursor else None
+        except ValueError as e:
+            return _message(request, str(e), 400)
+
+        status = request.query_params.get('status')
+        if status and status not in DOCUMENT_STATUSES:
+            return _message(request, f'Status inválido. Use: {", ".join(DOCUMENT_STATUSES)}', 400)
+
+        async with request.app.state.session_factory() as session:
+            # Requisição condicional: responde 304 sem consultar os funcionários
+            version = await get_data_version(session, max_age=_config(request)['DATA_VERSION_MAX_AGE'])
+            # Streaming e NDJSON ficam no Flask; aqui só a representação 'json' (mesmo ETag)
+            etag = f'employees-{version}-json'
+            unchanged = _not_modified(request, etag)
+            if unchanged:
+                unchanged.headers['Vary'] = 'Accept'
+                return unchanged
+
+            # Mesmo cache de respostas do Flask (mesma chave e mesmo corpo)
+            cache = request.app.state.flask_app.extensions['list_cache']
+            cache_key = (datetime.utcnow().date(), tuple(sorted(request.query_params.multi_items())))
+            body = cache.get(etag, cache_key)
+
+            if body is None:
+                rows = (await session.execute(list_employees_query(limit, after, status))).all()
+                employees, next_key = employees_page(rows, limit)
+                body = _dumps(request, {
+                    'items': employees,
+                    'next_cursor': encode_cursor(*next_key) if next_key else None
+                }).encode()
+                cache.set(etag, cache_key, body)
+
+        response = _with_etag(Response(body, media_type='application/json'), etag)
+        response.headers['Vary'] = 'Accept'
+        return response
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao listar funcionários: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+@authenticated
+async def search_employees(request):
+    try:
+        term = (request.query_params.get('q') or '').strip()
+        if len(term) < 2:
+            return _message(request, 'Informe pelo menos 2 caracteres para a busca', 400)
+
+        try:
+            limit = parse_limit(request.query_params.get('limit'), default=SEARCH_LIMIT, maximum=SEARCH_LIMIT)
+        except ValueError as e:
+            return _message(request, str(e), 400)
+
+        async with request.app.state.session_factory() as session:
+            rows = (await session.execute(search_employees_query(term, limit, request.app.state.dialect))).all()
+
+        return _json(request, {'items': [employee_list_item(row) for row in rows]})
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao buscar funcionários: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+@authenticated
+async def check_employee_cpf(request):
+    cpf = request.path_params['cpf']
+    try:
+        # CPF inválido é rejeitado sem consultar o banco
+        key = normalize_cpf(cpf)
+        if key is None:
+            return _message(request, 'CPF inválido', 400)
+
+        async with request.app.state.session_factory() as session:
+            # Negativo do filtro é definitivo; None significa filtro desatualizado
+            cpfs_version = await get_data_version(session, EMPLOYEE_CPFS, _config(request)['DATA_VERSION_MAX_AGE'])
+            might_exist = cpf_filter.lookup(key, cpfs_version)
+
+            exists = False
+            if might_exist is not False:
+                exists = (await session.execute(cpf_exists_query(key))).first() is not None
+                if might_exist and not exists:
+                    cpf_filter.record_false_positive()
+
+        if exists:
+            return _message(request, 'Funcionário já cadastrado', 409)
+        return _message(request, 'CPF disponível', 200)
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao verificar CPF {cpf}: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+@authenticated
+async def check_employee_cpfs_batch(request):
+    try:
+        data = await _read_json(request)
+        if data is None:
+            return _message(request, 'Content-Type deve ser application/json', 400)
+
+        # Mantém a ordem de entrada, sem repetições; inválidos não chegam ao banco
+        keys, error = parse_cpf_batch(data)
+        if error:
+            return _message(request, error, 400)
+
+        async with request.app.state.session_factory() as session:
+            cpfs_version = await get_data_version(session, EMPLOYEE_CPFS, _config(request)['DATA_VERSION_MAX_AGE'])
+            candidates = [
+                key for key in set(keys.values())
+                if key is not None and cpf_filter.lookup(key, cpfs_version) is not False
+            ]
+
+            existing = set()
+            if candidates:
+                existing = set((await session.execute(
+                    existing_cpfs_query(candidates, request.app.state.dialect)
+                )).scalars())
+
+        return _json(request, {
+            'taken': [cpf for cpf, key in keys.items() if key is not None and key in existing],
+            'available': [cpf for cpf, key in keys.items() if key is not None and key not in existing],
+            'invalid': [cpf for cpf, key in keys.items() if key is None]
+        })
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao verificar CPFs em lote: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+@authenticated
+async def get_employee_detail(request):
+    id = str(request.path_params['id'])
+    try:
+        async with request.app.state.session_factory() as session:
+            version = (await session.execute(employee_version_query(id))).scalar()
+            if version is None:
+                return _message(request, 'Funcionário não encontrado', 404)
+
+            etag = f'employee-{version}'
+            unchanged = _not_modified(request, etag)
+            if unchanged:
+                return unchanged
+
+            employee = (await session.execute(employee_detail_query(id))).unique().scalar_one_or_none()
+            if employee is None:
+                return _message(request, 'Funcionário não encontrado', 404)
+            employee_data = employee_detail_item(employee)
+
+        return _with_etag(_json(request, employee_data), etag)
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao buscar funcionário {id}: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+async def register(request):
+    try:
+        data = await _read_json(request)
+        if data is None:
+            return _message(request, 'Content-Type deve ser application/json', 400)
+        if not data or not isinstance(data, dict):
+            return _message(request, 'Dados não fornecidos', 400)
+
+        email = data.get('email')
+        password = data.get('password')
+
+        error = validate_new_user(email, password)
+        if error:
+            return _message(request, error, 400)
+
+        async with request.app.state.session_factory() as session:
+            existing_user = (await session.execute(select(User.id).where(User.email == email))).first()
+            if existing_user:
+                return _message(request, 'Usuário já existe com este email', 400)
+
+            # Hash da senha é CPU intensivo: na pool limitada, fora do event loop
+            user = User(email=email)
+            await asyncio.wrap_future(password_pool.submit(user.set_password, password))
+
+            session.add(user)
+            await session.commit()
+
+        _logger(request).info('Usuário criado com sucesso: %s', email)
+        return _message(request, 'Usuário criado com sucesso', 201)
+
+    except PasswordPoolBusy:
+        return _password_pool_busy(request)
+
+    except Exception as e:
+        _logger(request).error(f'Erro ao criar usuário: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+async def login(request):
+    try:
+        data = await _read_json(request)
+        if data is None:
+            return _message(request, 'Content-Type deve ser application/json', 400)
+        if not data or not isinstance(data, dict):
+            return _message(request, 'Dados não fornecidos', 400)
+
+        email = data.get('email')
+        password = data.get('password')
+
+        if not email or not password:
+            return _message(request, 'Email e senha são obrigatórios', 400)
+
+        async with request.app.state.session_factory() as session:
+            user = (await session.execute(select(User).where(User.email == email))).scalar_one_or_none()
+
+            # Verificação do hash na pool limitada, fora do event loop
+            if not user or not await asyncio.wrap_future(password_pool.submit(user.check_password, password)):
+                return _message(request, 'Credenciais inválidas', 401)
+
+            refresh_token, row = new_refresh_token(user.id)
+            await session.execute(insert(RefreshToken).values(row))
+            await session.commit()
+
+        _logger(request).info('Login realizado com sucesso: %s', email)
+        return _json(request, token_pair(user.id, refresh_token))
+
+    except PasswordPoolBusy:
+        return _password_pool_busy(request)
+
+    except Exception as e:
+        _logger(request).error(f'Erro no login: {str(e)}')
+        return _message(request, 'Erro interno do servidor', 500)
+
+
+routes = [
+    AsyncRoute('/employee/register_employee', create_employee, methods=['POST'], sync_when=_has_idempotency_key),
+    AsyncRoute('/employee/list', list_employees, methods=['GET'], sync_when=_wants_stream),
+    AsyncRoute('/employee/search', search_employees, methods=['GET']),
+    AsyncRoute('/employee/check_register/batch', check_employee_cpfs_batch, methods=['POST']),
+    AsyncRoute('/employee/check_register/{cpf}', check_employee_cpf, methods=['GET']),
+    # Só ids UUID: caminhos como /employee/export.csv continuam no Flask
+    AsyncRoute('/employee/{id:uuid}', get_employee_detail, methods=['GET']),
+    AsyncRoute('/auth/register', register, methods=['POST']),
+    AsyncRoute('/auth/login', login, methods=['POST'])
+]
@@ -1,9 +1,10 @@
 from flask import request, jsonify, current_app
 from app.models.user import User
 from app import db
-import jwt
-from datetime import datetime, timedelta
-from config import Config
+from app.services.password_service import PASSWORD_POOL_BUSY, PasswordPoolBusy, password_pool
+from app.services.refresh_token_service import issue_refresh_token, revoke_refresh_token, rotate_refresh_token
+from app.utils.auth import token_pair
+from app.utils.validation import validate_new_user
 import logging
 
 def register():
@@ -21,33 +22,28 @@ def register():
         email = data.get('email')
         password = data.get('password')
 
-        # Validar campos obrigatórios
-        if not email or not password:
-            return jsonify({'message': 'Email e senha são obrigatórios'}), 400
-
-        # Validar formato do email
-        if '@' not in email or '.' not in email:
-            return jsonify({'message': 'Formato de email inválido'}), 400
-
-        # Validar tamanho da senha
-        if len(password) < 6:
-            return jsonify({'message': 'Senha deve ter pelo menos 6 caracteres'}), 400
+        error = validate_new_user(email, password)
+        if error:
+            return jsonify({'message': error}), 400
 
         # Verificar se usuário já existe
         existing_user = User.query.filter_by(email=email).first()
         if existing_user:
             return jsonify({'message': 'Usuário já existe com este email'}), 400
 
-        # Criar novo usuário
+        # Criar novo usuário (hash da senha na pool limitada)
         user = User(email=email)
-        user.set_password(password)
+        password_pool.run(user.set_password, password)
 
         db.session.add(user)
         db.session.commit()
 
-        current_app.logger.info(f'Usuário criado com sucesso: {email}')
+        current_app.logger.info('Usuário criado com sucesso: %s', email)
         return jsonify({'message': 'Usuário criado com sucesso'}), 201
 
+    except PasswordPoolBusy:
+        return jsonify({'message': PASSWORD_POOL_BUSY}), 503, {'Retry-After': '1'}
+
     except Exception as e:
         # Rollback em caso de erro
         db.session.rollback()
@@ -80,18 +76,64 @@ def login():
 
         user = User.query.filter_by(email=email).first()
 
-        if not user or not user.check_password(password):
+        if not user or not password_pool.run(user.check_password, password):
             return jsonify({'message': 'Credenciais inválidas'}), 401
 
-        payload = {
-            'user_id': str(user.id),
-            'exp': datetime.utcnow() + timedelta(hours=24)
-        }
-        token = jwt.encode(payload, Config.SECRET_KEY, algorithm='HS256')
+        refresh_token = issue_refresh_token(user.id)
+
+        current_app.logger.info('Login realizado com sucesso: %s', email)
+        return jsonify(token_pair(user.id, refresh_token)), 200
 
-        current_app.logger.info(f'Login realizado com sucesso: {email}')
-        return jsonify({'token': token}), 200
+    except PasswordPoolBusy:
+        return jsonify({'message': PASSWORD_POOL_BUSY}), 503, {'Retry-After': '1'}
 
     except Exception as e:
         current_app.logger.error(f'Erro no login: {str(e)}')
         return jsonify({'message': 'Erro interno do servidor'}), 500
+
+
+def refresh():
+    """Troca o refresh token por um novo par de tokens, sem verificar a senha"""
+    try:
+        refresh_token, error = _refresh_token_from_request()
+        if error:
+            return jsonify({'message': error}), 400
+
+        user_id, new_refresh_token = rotate_refresh_token(refresh_token)
+        if user_id is None:
+            return jsonify({'message': 'Sessão expirada. Faça login novamente'}), 401
+
+        return jsonify(token_pair(user_id, new_refresh_token)), 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f'Erro ao renovar token: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+
+def logout():
+    """Revoga o refresh token e os demais da mesma sessão de login"""
+    try:
+        refresh_token, error = _refresh_token_from_request()
+        if error:
+            return jsonify({'message': error}), 400
+
+        revoke_refresh_token(refresh_token)
+        return jsonify({'message': 'Sessão encerrada'}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f'Erro ao encerrar sessão: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+
+def _refresh_token_from_request():
+    if not request.is_json:
+        return None, 'Content-Type deve ser application/json'
+
+    data = request.get_json(silent=True)
+    refresh_token = data.get('refresh_token') if isinstance(data, dict) else None
+    if not refresh_token or not isinstance(refresh_token, str):
+        return None, 'Refresh token obrigatório'
+
+    return refresh_token, None
@@ -0,0 +1,42 @@
+from flask import request, jsonify, current_app
+from datetime import datetime, timedelta
+from app.services.document_service import list_expiring_documents
+from app.services.document_status_service import EXPIRING_WINDOW_DAYS
+from app.utils.pagination import encode_cursor, decode_cursor, cursor_date, cursor_uuid, parse_limit
+
+def expiring_documents():
+    try:
+        try:
+            today = datetime.utcnow().date()
+            start = _parse_date(request.args.get('from'), today)
+            end = _parse_date(request.args.get('to'), start + timedelta(days=EXPIRING_WINDOW_DAYS))
+            limit = parse_limit(request.args.get('limit'))
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor, cursor_date, cursor_uuid) if cursor else None
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        if start > end:
+            return jsonify({'message': 'Data inicial deve ser anterior ou igual à data final'}), 400
+
+        company = request.args.get('company')
+
+        current_app.logger.info('Listando documentos a vencer entre %s e %s', start, end)
+        documents, next_key = list_expiring_documents(start, end, company, limit, after)
+        return jsonify({
+            'items': documents,
+            'next_cursor': encode_cursor(*next_key) if next_key else None
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao listar documentos a vencer: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+def _parse_date(value, default):
+    """Converte uma data no formato YYYY-MM-DD"""
+    if not value:
+        return default
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        raise ValueError(f'Data inválida: {value}. Use o formato YYYY-MM-DD')
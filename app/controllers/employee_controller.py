@@ -1,11 +1,33 @@
-from flask import request, jsonify, current_app
+from flask import request, jsonify, current_app, Response, stream_with_context
+from datetime import datetime
+import io
 from app.services.employee_service import (
     create_employee_with_documents,
     list_employees_with_document_status,
+    iter_employees_with_document_status,
+    iter_employee_documents,
+    EXPORT_HEADER,
     check_cpf_exists,
+    find_existing_cpfs,
     get_employee_detail,
-    update_employee
+    update_employee,
+    patch_employee,
+    PATCHABLE_FIELDS,
+    EMPLOYEE_NOT_FOUND,
+    VERSION_CONFLICT,
+    search_employees,
+    get_employee_version,
+    SEARCH_LIMIT
 )
+from app.services.data_version_service import get_data_version
+from app.services.import_service import import_employees, read_csv_records, read_jsonl_records
+from app.utils.http_cache import not_modified, with_etag
+from app.utils.streaming import ndjson_stream, json_array_stream, csv_stream
+from app.utils.pagination import encode_cursor, decode_cursor, cursor_text, cursor_uuid, parse_limit
+from app.utils.cpf import format_cpf, normalize_cpf
+from app.utils.validation import parse_cpf_batch, parse_employee_payload
+
+DOCUMENT_STATUSES = ('expired', 'expiring', 'valid')
 
 def create_employee():
     try:
@@ -16,57 +38,145 @@ def create_employee():
         data = request.get_json()
         
         # Validar se os dados foram enviados
-        if not data:
-            return jsonify({'message': 'Dados não fornecidos'}), 400
-
-        cpf = data.get('cpf')
-        employee_name = data.get('employee_name')
-        company_name = data.get('company_name')
-        documents = data.get('documents', [])
-        address = data.get('address')
-        phone = data.get('phone')
-        emergency_phone = data.get('emergency_phone')
-
-        # Validar campos obrigatórios
-        if not all([cpf, company_name, employee_name]):
-            return jsonify({'message': 'Campos obrigatórios: cpf, company_name, employee_name'}), 400
-        
-        # Validar endereço se fornecido
-        if address and not _validate_address(address):
-            return jsonify({'message': 'Formato de endereço inválido'}), 400
+        fields, error = parse_employee_payload(data)
+        if error:
+            return jsonify({'message': error}), 400
         
         # Criar funcionário
-        employee, error = create_employee_with_documents(cpf, employee_name, company_name, documents, address, phone, emergency_phone)
+        employee_id, error = create_employee_with_documents(**fields)
 
         if error:
             return jsonify({'message': error}), 400
         
-        current_app.logger.info(f'Funcionário criado com sucesso: {employee_name} (CPF: {cpf})')
-        return jsonify({'message': 'Funcionário criado com sucesso', 'employeeId': employee.id}), 201
+        current_app.logger.info('Funcionário criado com sucesso: %s (CPF: %s)', fields['employee_name'], format_cpf(fields['cpf']))
+        return jsonify({'message': 'Funcionário criado com sucesso', 'employeeId': employee_id}), 201
         
     except Exception as e:
         current_app.logger.error(f'Erro ao criar funcionário: {str(e)}')
         return jsonify({'message': 'Erro interno do servidor'}), 500
 
+def import_employees_file():
+    try:
+        # Corpo lido em streaming: CSV (text/csv) ou um JSON por linha (application/x-ndjson)
+        lines = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+
+        if request.mimetype == 'text/csv':
+            records = read_csv_records(lines)
+        elif request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+            records = read_jsonl_records(lines)
+        else:
+            return jsonify({'message': 'Content-Type deve ser text/csv ou application/x-ndjson'}), 415
+
+        summary = import_employees(records)
+
+        current_app.logger.info('Importação concluída: %s funcionários, %s erros', summary['imported'], summary['error_count'])
+        return jsonify(summary), 200
+
+    except UnicodeDecodeError:
+        return jsonify({'message': 'Arquivo deve estar codificado em UTF-8'}), 400
+    except Exception as e:
+        current_app.logger.error(f'Erro ao importar funcionários: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
 def list_employees():
     try:
-        current_app.logger.info('Listando funcionários...')
-        employees = list_employees_with_document_status()
-        current_app.logger.info(f'Encontrados {len(employees)} funcionários')
-        return jsonify(employees), 200
+        try:
+            limit = parse_limit(request.args.get('limit'))
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor, cursor_text, cursor_uuid) if cursor else None
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        status = request.args.get('status')
+        if status and status not in DOCUMENT_STATUSES:
+            return jsonify({'message': f'Status inválido. Use: {", ".join(DOCUMENT_STATUSES)}'}), 400
+
+        # Requisição condicional: responde 304 sem consultar os funcionários.
+        # Cada representação tem seu ETag, para um cache não trocar NDJSON por JSON
+        representation = _list_representation()
+        etag = f'employees-{get_data_version()}-{representation}'
+        unchanged = not_modified(etag)
+        if unchanged:
+            unchanged.vary.add('Accept')
+            return unchanged
+
+        # Modo streaming: todos os funcionários, sem montar a lista inteira em memória
+        if representation != 'json':
+            current_app.logger.info('Listando funcionários em streaming...')
+            rows = iter_employees_with_document_status(status)
+            if representation == 'ndjson':
+                response = Response(stream_with_context(ndjson_stream(rows)), mimetype='application/x-ndjson')
+            else:
+                response = Response(stream_with_context(json_array_stream(rows)), mimetype='application/json')
+            response.vary.add('Accept')
+            return with_etag(response, etag), 200
+
+        # Corpo já serializado em cache para esta versão dos dados, dia e parâmetros
+        cache = current_app.extensions['list_cache']
+        cache_key = (datetime.utcnow().date(), tuple(sorted(request.args.items(multi=True))))
+        body = cache.get(etag, cache_key)
+
+        if body is None:
+            current_app.logger.info('Listando funcionários...')
+            employees, next_key = list_employees_with_document_status(limit, after, status)
+            current_app.logger.info('Encontrados %s funcionários', len(employees))
+            body = jsonify({
+                'items': employees,
+                'next_cursor': encode_cursor(*next_key) if next_key else None
+            }).get_data()
+            cache.set(etag, cache_key, body)
+
+        response = current_app.response_class(body, mimetype='application/json')
+        response.vary.add('Accept')
+        return with_etag(response, etag), 200
         
     except Exception as e:
         current_app.logger.error(f'Erro ao listar funcionários: {str(e)}')
         return jsonify({'message': 'Erro interno do servidor'}), 500
 
+def export_employees_csv():
+    try:
+        current_app.logger.info('Exportando funcionários e documentos em CSV...')
+        rows = iter_employee_documents()
+        response = Response(stream_with_context(csv_stream(EXPORT_HEADER, rows)), mimetype='text/csv')
+        response.headers['Content-Disposition'] = 'attachment; filename=funcionarios.csv'
+        return response, 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao exportar funcionários: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+def search_employees_by_term():
+    try:
+        term = (request.args.get('q') or '').strip()
+        if len(term) < 2:
+            return jsonify({'message': 'Informe pelo menos 2 caracteres para a busca'}), 400
+
+        try:
+            limit = parse_limit(request.args.get('limit'), default=SEARCH_LIMIT, maximum=SEARCH_LIMIT)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        employees = search_employees(term, limit)
+        return jsonify({'items': employees}), 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao buscar funcionários: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
 def check_employee_cpf(cpf):
     try:
         if not cpf:
             return jsonify({'message': 'CPF é obrigatório'}), 400
 
-        current_app.logger.info(f'Verificando CPF: {cpf}')
+        # CPF inválido é rejeitado sem consultar o banco
+        key = normalize_cpf(cpf)
+        if key is None:
+            return jsonify({'message': 'CPF inválido'}), 400
+
+        current_app.logger.info('Verificando CPF: %s', cpf)
         
-        if check_cpf_exists(cpf):
+        if check_cpf_exists(key):
             return jsonify({'message': 'Funcionário já cadastrado'}), 409
         else:
             return jsonify({'message': 'CPF disponível'}), 200
@@ -75,18 +185,52 @@ def check_employee_cpf(cpf):
         current_app.logger.error(f'Erro ao verificar CPF {cpf}: {str(e)}')
         return jsonify({'message': 'Erro interno do servidor'}), 500
     
+def check_employee_cpfs_batch():
+    try:
+        # Validar se o request tem JSON
+        if not request.is_json:
+            return jsonify({'message': 'Content-Type deve ser application/json'}), 400
+
+        # Mantém a ordem de entrada, sem repetições; inválidos não chegam ao banco
+        keys, error = parse_cpf_batch(request.get_json())
+        if error:
+            return jsonify({'message': error}), 400
+
+        current_app.logger.info('Verificando %s CPFs em lote', len(keys))
+        existing = find_existing_cpfs((key for key in keys.values() if key is not None), use_filter=True)
+
+        return jsonify({
+            'taken': [cpf for cpf, key in keys.items() if key is not None and key in existing],
+            'available': [cpf for cpf, key in keys.items() if key is not None and key not in existing],
+            'invalid': [cpf for cpf, key in keys.items() if key is None]
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao verificar CPFs em lote: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
 def get_employee_detail_by_id(id):
     try:
         if not id:
             return jsonify({'message': 'ID é obrigatório'}), 400
             
-        current_app.logger.info(f'Buscando detalhes do funcionário: {id}')
+        version = get_employee_version(id)
+        if version is not None:
+            etag = f'employee-{version}'
+            unchanged = not_modified(etag)
+            if unchanged:
+                return unchanged
+
+        current_app.logger.info('Buscando detalhes do funcionário: %s', id)
         employee_data, error = get_employee_detail(id)
 
         if error:
             return jsonify({'message': error}), 404
 
-        return jsonify(employee_data), 200
+        response = jsonify(employee_data)
+        if version is not None:
+            with_etag(response, etag)
+        return response, 200
         
     except Exception as e:
         current_app.logger.error(f'Erro ao buscar funcionário {id}: {str(e)}')
@@ -107,32 +251,99 @@ def update_employee_data(id):
         if not id:
             return jsonify({'message': 'ID é obrigatório'}), 400
             
-        current_app.logger.info(f'Atualizando funcionário: {id}')
+        current_app.logger.info('Atualizando funcionário: %s', id)
         updated, error = update_employee(id, data)
 
         if error:
             return jsonify({'message': error}), 404
 
-        current_app.logger.info(f'Funcionário {id} atualizado com sucesso')
+        current_app.logger.info('Funcionário %s atualizado com sucesso', id)
         return jsonify({'message': 'Funcionário atualizado com sucesso', 'employee': updated}), 200
         
     except Exception as e:
         current_app.logger.error(f'Erro ao atualizar funcionário {id}: {str(e)}')
         return jsonify({'message': 'Erro interno do servidor'}), 500
 
-def _validate_address(address):
-    """Valida a estrutura do endereço JSON"""
-    if not isinstance(address, dict):
-        return False
-    
-    valid_fields = {'street', 'number', 'neighborhood', 'city', 'complement', 'zip_code'}
-    
-    for field in address.keys():
-        if field not in valid_fields:
-            return False
-    
-    for key, value in address.items():
-        if value is not None and not isinstance(value, str):
-            return False
-    
-    return True
+def patch_employee_data(id):
+    try:
+        # JSON Merge Patch (RFC 7386): só os campos enviados são alterados, null limpa o campo
+        if request.mimetype not in ('application/merge-patch+json', 'application/json'):
+            return jsonify({'message': 'Content-Type deve ser application/merge-patch+json'}), 415
+
+        patch = request.get_json(force=True, silent=True)
+        if not isinstance(patch, dict):
+            return jsonify({'message': 'Corpo deve ser um objeto JSON'}), 400
+
+        error = _validate_employee_patch(patch)
+        if error:
+            return jsonify({'message': error}), 400
+
+        expected_versions = _if_match_versions()
+        if expected_versions == []:
+            return jsonify({'message': VERSION_CONFLICT}), 412
+
+        current_app.logger.info('Alterando funcionário: %s', id)
+        employee, error = patch_employee(id, patch, expected_versions)
+
+        if error:
+            status = {EMPLOYEE_NOT_FOUND: 404, VERSION_CONFLICT: 412}.get(error, 400)
+            return jsonify({'message': error}), status
+
+        etag = f'employee-{employee.pop("version")}'
+
+        # Prefer: return=minimal dispensa o corpo; o novo ETag basta para a próxima edição
+        if 'return=minimal' in request.headers.get('Prefer', ''):
+            response = current_app.response_class(status=204)
+            # Sem corpo, sem Content-Type (o response_class sempre define o padrão text/html)
+            del response.headers['Content-Type']
+            response.headers['Preference-Applied'] = 'return=minimal'
+        else:
+            response = jsonify(employee)
+
+        current_app.logger.info('Funcionário %s alterado com sucesso', id)
+        return with_etag(response, etag)
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao alterar funcionário {id}: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+def _validate_employee_patch(patch):
+    unknown = [field for field in patch if field not in PATCHABLE_FIELDS]
+    if unknown:
+        return f'Campos não alteráveis via PATCH: {", ".join(unknown)}. Use: {", ".join(PATCHABLE_FIELDS)}'
+
+    for field in ('employee_name', 'company_name'):
+        if field in patch and (not isinstance(patch[field], str) or not patch[field].strip() or len(patch[field]) > 255):
+            return f'Campo {field} deve ser um texto não vazio de até 255 caracteres'
+
+    for field in ('phone', 'emergency_phone'):
+        if patch.get(field) is not None and (not isinstance(patch[field], str) or len(patch[field]) > 20):
+            return f'Campo {field} deve ser um texto de até 20 caracteres'
+
+    if patch.get('address') is not None and not isinstance(patch['address'], dict):
+        return 'Formato de endereço inválido'
+
+    return None
+
+def _if_match_versions():
+    """Versões aceitas pelo If-Match: None sem a condição (ou com *), lista vazia se nenhuma ETag é do funcionário"""
+    if 'If-Match' not in request.headers or request.if_match.star_tag:
+        return None
+
+    versions = []
+    for tag in request.if_match.as_set():
+        prefix, _, version = tag.partition('-')
+        if prefix == 'employee' and version.isdigit():
+            versions.append(int(version))
+    return versions
+
+def _wants_ndjson():
+    return request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson']) == 'application/x-ndjson'
+
+def _list_representation():
+    """Formato da listagem: 'ndjson' (Accept), 'stream' (array JSON completo) ou 'json' (página)"""
+    if _wants_ndjson():
+        return 'ndjson'
+    if request.args.get('stream') == '1':
+        return 'stream'
+    return 'json'
@@ -0,0 +1,25 @@
+from flask import jsonify, current_app
+from sqlalchemy import text
+from app import db
+from app.services.schema_service import check_schema
+
+def liveness():
+    # Sem acesso ao banco: indica apenas que o processo responde
+    return jsonify({'status': 'ok'}), 200
+
+def readiness():
+    try:
+        if current_app.config['SCHEMA_CHECK_MODE'] == 'skip':
+            db.session.execute(text('SELECT 1'))
+            return jsonify({'status': 'ready'}), 200
+
+        # Uma consulta confirma a conexão e a revisão do schema
+        ok, details = check_schema()
+        if not ok:
+            return jsonify({'status': 'not_ready', 'message': 'Banco de dados não está na revisão das migrations', 'schema': details}), 503
+
+        return jsonify({'status': 'ready', 'schema': details}), 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro na verificação de prontidão: {str(e)}')
+        return jsonify({'status': 'not_ready', 'message': 'Banco de dados indisponível'}), 503
@@ -0,0 +1,36 @@
+from flask import jsonify, current_app
+from app.services.cpf_filter_service import cpf_filter
+from app.services.password_service import password_pool
+from app.utils.auth import verified_tokens
+from app.utils.log import logging_stats
+from app.utils.profiling import request_profiler
+
+def get_metrics():
+    try:
+        return jsonify({
+            'cpf_filter': cpf_filter.metrics(),
+            'list_cache': current_app.extensions['list_cache'].stats(),
+            'token_cache': verified_tokens.stats(),
+            'logging': logging_stats(),
+            'password_pool': password_pool.metrics()
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao coletar métricas: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+def get_endpoint_metrics():
+    try:
+        return jsonify({
+            'enabled': request_profiler.enabled,
+            'sample_rate': request_profiler.sample_rate,
+            'endpoints': request_profiler.snapshot()
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f'Erro ao coletar métricas por endpoint: {str(e)}')
+        return jsonify({'message': 'Erro interno do servidor'}), 500
+
+def reset_endpoint_metrics():
+    request_profiler.reset()
+    return jsonify({'message': 'Métricas por endpoint zeradas'}), 200
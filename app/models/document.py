@@ -4,6 +4,12 @@ from app import db
 
 class Document(db.Model):
     __tablename__ = 'documents'
+    __table_args__ = (
+        # Suporta o MIN(expiration_date) por funcionário usado no status da listagem
+        db.Index('ix_documents_employee_id_expiration_date', 'employee_id', 'expiration_date'),
+        # Varredura por intervalo de vencimento no relatório de documentos a vencer
+        db.Index('ix_documents_expiration_date_id', 'expiration_date', 'id'),
+    )
 
     id = db.Column(db.String, primary_key=True, default=lambda: str(uuid.uuid4()))
     employee_id = db.Column(db.String, db.ForeignKey('employees.id'), nullable=False)
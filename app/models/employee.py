@@ -5,15 +5,25 @@ from sqlalchemy.dialects.postgresql import JSON
 
 class Employee(db.Model):
     __tablename__ = 'employees'
+    __table_args__ = (
+        # Suporta o ORDER BY employee_name, id da listagem paginada por chave
+        db.Index('ix_employees_employee_name_id', 'employee_name', 'id'),
+        # Filtro por status na listagem, mantendo a mesma ordenação
+        db.Index('ix_employees_document_status_name_id', 'document_status', 'employee_name', 'id'),
+    )
 
     id = db.Column(db.String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    cpf = db.Column(db.String(14), unique=True, nullable=False)
+    # Chave canônica de 11 dígitos (ver app.utils.cpf); formatada apenas na saída da API
+    cpf = db.Column(db.BigInteger, unique=True, nullable=False)
     employee_name = db.Column(db.String(255), nullable=False)
     company_name = db.Column(db.String(255), nullable=False)
     address = db.Column(JSON, nullable=True)
     phone = db.Column(db.String(20), nullable=True)
     emergency_phone = db.Column(db.String(20), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    document_status = db.Column(db.String(10), nullable=False, default='valid', server_default='valid')
+    next_status_change_at = db.Column(db.Date, nullable=True, index=True)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     documents = db.relationship('Document', backref='employee', lazy=True)
@@ -0,0 +1,14 @@
+from datetime import datetime
+from app import db
+
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+
+    user_id = db.Column(db.String(36), primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    # sha256 de método, caminho e corpo: a mesma chave não pode ser usada em outra requisição
+    request_hash = db.Column(db.String(64), nullable=False)
+    # Nulos enquanto a requisição original está em processamento
+    status_code = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(db.LargeBinary, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
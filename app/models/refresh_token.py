@@ -0,0 +1,15 @@
+from datetime import datetime
+from app import db
+
+class RefreshToken(db.Model):
+    __tablename__ = 'refresh_tokens'
+
+    # sha256 do token: o valor original só existe no cliente
+    token_hash = db.Column(db.LargeBinary(32), primary_key=True)
+    user_id = db.Column(db.String, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    # Tokens gerados pela mesma sessão de login; reutilizar um token já trocado revoga a família inteira
+    family_id = db.Column(db.String(36), nullable=False, index=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    # Preenchido quando o token é trocado por um novo ou revogado no logout
+    revoked_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
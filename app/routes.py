@@ -1,13 +1,22 @@
 from flask import Blueprint, render_template
 from app.controllers.employee_controller import (
     create_employee,
+    import_employees_file,
     list_employees,
+    export_employees_csv,
+    search_employees_by_term,
     check_employee_cpf,
+    check_employee_cpfs_batch,
     get_employee_detail_by_id,
-    update_employee_data
+    update_employee_data,
+    patch_employee_data
 )
-from app.controllers.auth_controller import register, login
-from app.utils.auth import token_required
+from app.controllers.document_controller import expiring_documents
+from app.controllers.auth_controller import register, login, refresh, logout
+from app.controllers.metrics_controller import get_metrics, get_endpoint_metrics, reset_endpoint_metrics
+from app.controllers.health_controller import liveness, readiness
+from app.utils.auth import admin_required, token_required
+from app.utils.idempotency import idempotent
 
 bp = Blueprint('routes', __name__)
 
@@ -43,14 +52,35 @@ def cadastro_usuario():
 # Rotas da API
 @bp.route('/employee/register_employee', methods=['POST'])
 @token_required
+@idempotent
 def register_employee():
     return create_employee()
 
+@bp.route('/employee/import', methods=['POST'])
+@token_required
+def importEmployees():
+    return import_employees_file()
+
 @bp.route('/employee/list', methods=['GET'])
 @token_required
 def list():
     return list_employees()
 
+@bp.route('/employee/export.csv', methods=['GET'])
+@token_required
+def exportEmployees():
+    return export_employees_csv()
+
+@bp.route('/employee/search', methods=['GET'])
+@token_required
+def search():
+    return search_employees_by_term()
+
+@bp.route('/employee/check_register/batch', methods=['POST'])
+@token_required
+def checkRegisterBatch():
+    return check_employee_cpfs_batch()
+
 @bp.route('/employee/check_register/<cpf>', methods=['GET'])
 @token_required
 def checkRegister(cpf):
@@ -63,9 +93,38 @@ def registerDetail(id):
 
 @bp.route('/employee/<id>', methods=['PUT'])
 @token_required
+@idempotent
 def registerUpdate(id):
     return update_employee_data(id)
 
+@bp.route('/employee/<id>', methods=['PATCH'])
+@token_required
+def registerPatch(id):
+    return patch_employee_data(id)
+
+@bp.route('/documents/expiring', methods=['GET'])
+@token_required
+def documentsExpiring():
+    return expiring_documents()
+
+@bp.route('/admin/metrics', methods=['GET'])
+@token_required
+@admin_required
+def adminMetrics():
+    return get_metrics()
+
+@bp.route('/admin/metrics/endpoints', methods=['GET'])
+@token_required
+@admin_required
+def adminEndpointMetrics():
+    return get_endpoint_metrics()
+
+@bp.route('/admin/metrics/endpoints', methods=['DELETE'])
+@token_required
+@admin_required
+def adminEndpointMetricsReset():
+    return reset_endpoint_metrics()
+
 @bp.route('/auth/register', methods=['POST'])
 def registerUser():
     return register()
@@ -73,3 +132,20 @@ def registerUser():
 @bp.route('/auth/login', methods=['POST'])
 def loginUser():
     return login()
+
+@bp.route('/auth/refresh', methods=['POST'])
+def refreshToken():
+    return refresh()
+
+@bp.route('/auth/logout', methods=['POST'])
+def logoutUser():
+    return logout()
+
+# Verificações do orquestrador: processo vivo e pronto para receber tráfego
+@bp.route('/healthz', methods=['GET'])
+def healthz():
+    return liveness()
+
+@bp.route('/readyz', methods=['GET'])
+def readyz():
+    return readiness()
@@ -0,0 +1,206 @@
+from datetime import datetime, timedelta
+import threading
+import time
+from app import db
+from app.models.employee import Employee
+from app.services.data_version_service import EMPLOYEE_CPFS, get_data_version
+from app.utils.bloom import BloomFilter
+from sqlalchemy import func, select
+
+# Folga de capacidade para absorver novos cadastros sem reconstruir
+CAPACITY_GROWTH = 2
+MIN_CAPACITY = 10000
+
+# Linhas buscadas por vez do cursor do servidor durante a reconstrução
+REBUILD_BATCH_SIZE = 10000
+
+
+class CpfFilter:
+    """Filtro de Bloom com os CPFs cadastrados, consultado antes do banco.
+
+    Uma resposta negativa é definitiva e dispensa a consulta; positivos
+    continuam sendo confirmados em SQL. O filtro pertence a uma versão do
+    contador EMPLOYEE_CPFS: quando cadastros de outros workers mudam a versão,
+    uma atualização em segundo plano acrescenta apenas os funcionários com
+    created_at a partir do maior já lido (menos CPF_FILTER_CATCH_UP_OVERLAP).
+    Todos os CPFs só são lidos na primeira construção e quando o filtro
+    excede a capacidade.
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._filter = None
+        self._version = None
+        # Maior created_at lido do banco: início da próxima atualização incremental
+        self._seen_until = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        self.rebuilds = 0
+        self.catch_ups = 0
+        self.rebuild_seconds = None
+        self.rebuilt_at = None
+        self.negatives = 0
+        self.positives = 0
+        self.false_positives = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        if app.config.get('CPF_FILTER_ENABLED') and app.config.get('CPF_FILTER_WARM_ON_START'):
+            # Construção inicial em segundo plano para não atrasar o boot
+            self._refresh_in_background()
+
+    def enabled(self):
+        return self.app is not None and self.app.config.get('CPF_FILTER_ENABLED', False)
+
+    def lookup(self, cpf, version):
+        """Consulta sem acessar o banco: False apenas quando o CPF certamente não está cadastrado.
+
+        version é o contador EMPLOYEE_CPFS lido pelo chamador. Retorna None se o
+        filtro não está nessa versão (cadastro em outro worker): a atualização
+        é disparada em segundo plano e o chamador consulta o banco, sem que a
+        requisição espere a leitura dos CPFs novos.
+        """
+        if not self.enabled():
+            return None
+
+        bloom = self._filter
+        if bloom is None or version != self._version:
+            self._refresh_in_background()
+            return None
+
+        if cpf in bloom:
+            self.positives += 1
+            return True
+        self.negatives += 1
+        return False
+
+    def record_false_positive(self):
+        self.false_positives += 1
+
+    def add(self, cpfs, version):
+        """Inclui CPFs recém-cadastrados; version é o valor retornado por bump_data_version"""
+        with self._lock:
+            if self._filter is None:
+                return
+            for cpf in cpfs:
+                self._filter.add(cpf)
+            # Só avança a versão se nenhum outro worker cadastrou no meio tempo
+            if self._version == version - 1 and self._filter.count <= self._filter.capacity:
+                self._version = version
+
+    def refresh(self):
+        """Leva o filtro à versão atual: incremental quando possível, senão reconstrução completa"""
+        with self._lock:
+            if not self._catch_up():
+                self._rebuild()
+            return self._filter
+
+    def rebuild(self):
+        with self._lock:
+            self._rebuild()
+            return self._filter
+
+    def metrics(self):
+        bloom = self._filter
+        checks = self.positives + self.negatives
+        return {
+            'enabled': self.enabled(),
+            'built': bloom is not None,
+            'version': self._version,
+            'items': bloom.count if bloom else 0,
+            'capacity': bloom.capacity if bloom else 0,
+            'size_bytes': bloom.size_bytes if bloom else 0,
+            'hash_functions': bloom.num_hashes if bloom else 0,
+            'estimated_false_positive_rate': bloom.false_positive_rate if bloom else None,
+            'observed_false_positive_rate': self.false_positives / self.positives if self.positives else None,
+            'checks': checks,
+            'definite_negatives': self.negatives,
+            'false_positives': self.false_positives,
+            'rebuilds': self.rebuilds,
+            'catch_ups': self.catch_ups,
+            'seen_until': self._seen_until.isoformat() if self._seen_until else None,
+            'rebuild_seconds': self.rebuild_seconds,
+            'rebuilt_at': self.rebuilt_at
+        }
+
+    def _catch_up(self):
+        """Acrescenta os CPFs cadastrados desde a última leitura; False se é preciso reconstruir"""
+        bloom = self._filter
+        if bloom is None or self._seen_until is None:
+            return False
+
+        version = get_data_version(EMPLOYEE_CPFS, fresh=True)
+        # created_at vem do relógio do worker que montou a linha, antes do commit: a folga
+        # cobre transações mais lentas e diferenças de relógio entre workers
+        overlap = timedelta(seconds=self.app.config.get('CPF_FILTER_CATCH_UP_OVERLAP', 300))
+        rows = db.session.execute(
+            select(Employee.cpf, Employee.created_at).where(Employee.created_at >= self._seen_until - overlap)
+        )
+
+        seen_until = self._seen_until
+        for cpf, created_at in rows:
+            # Linhas da folga já estão no filtro; não contam de novo para a capacidade
+            if cpf not in bloom:
+                bloom.add(cpf)
+            seen_until = max(seen_until, created_at)
+
+        if bloom.count > bloom.capacity:
+            return False
+
+        self._version = version
+        self._seen_until = seen_until
+        self.catch_ups += 1
+        return True
+
+    def _rebuild(self):
+        started = time.perf_counter()
+
+        # A versão é lida antes dos CPFs: cadastros durante a leitura forçam nova atualização
+        version = get_data_version(EMPLOYEE_CPFS, fresh=True)
+        seen_until = datetime.utcnow()
+        count = db.session.execute(select(func.count()).select_from(Employee)).scalar()
+        bloom = BloomFilter(
+            max(count * CAPACITY_GROWTH, MIN_CAPACITY),
+            self.app.config.get('CPF_FILTER_ERROR_RATE', 0.001)
+        )
+
+        rows = db.session.execute(
+            select(Employee.cpf, Employee.created_at).execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+        for cpf, created_at in rows:
+            bloom.add(cpf)
+            if created_at is not None and created_at > seen_until:
+                seen_until = created_at
+
+        self._filter = bloom
+        self._version = version
+        self._seen_until = seen_until
+        self.rebuilds += 1
+        self.rebuild_seconds = round(time.perf_counter() - started, 4)
+        self.rebuilt_at = datetime.utcnow().isoformat()
+
+    def _refresh_in_background(self):
+        # Sem o lock da reconstrução: quem chama não pode esperar a leitura dos CPFs
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._warm, name='cpf-filter-refresh', daemon=True).start()
+
+    def _warm(self):
+        with self.app.app_context():
+            try:
+                self.refresh()
+                self.app.logger.debug('Filtro de CPFs atualizado: %s CPFs na versão %s', self._filter.count, self._version)
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f'Erro ao atualizar filtro de CPFs: {str(e)}')
+            finally:
+                self._refreshing = False
+                db.session.remove()
+
+
+cpf_filter = CpfFilter()
@@ -0,0 +1,107 @@
+import time
+from flask import current_app
+from app import db
+from app.models.data_version import DataVersion
+from app.utils.sql import insert_ignoring_conflicts
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+# Contador global incrementado a cada escrita que altera a listagem de funcionários
+EMPLOYEES = 'employees'
+
+# Contador incrementado apenas quando novos CPFs são cadastrados
+EMPLOYEE_CPFS = 'employee_cpfs'
+
+# Última versão lida do banco por este processo: nome -> (versão, instante da leitura)
+_known_versions = {}
+
+
+def get_data_version(name=EMPLOYEES, fresh=False):
+    """Lê o contador de versão em uma única busca por chave primária.
+
+    A leitura é reaproveitada por DATA_VERSION_MAX_AGE segundos, de modo que
+    escritas de outros workers aparecem com no máximo esse atraso.
+    """
+    if not fresh:
+        version = cached_data_version(name, current_app.config.get('DATA_VERSION_MAX_AGE', 0))
+        if version is not None:
+            return version
+
+    version = db.session.execute(data_version_query(name)).scalar() or 0
+    remember_data_version(name, version)
+    return version
+
+
+def cached_data_version(name, max_age):
+    """Versão lida por este processo há menos de max_age segundos (None se expirada)"""
+    known = _known_versions.get(name)
+    if known and time.monotonic() - known[1] < max_age:
+        return known[0]
+    return None
+
+
+def remember_data_version(name, version):
+    _known_versions[name] = (version, time.monotonic())
+
+
+def data_version_query(name):
+    return select(DataVersion.version).where(DataVersion.name == name)
+
+
+def bump_data_version_statement(name):
+    return (
+        update(DataVersion)
+        .where(DataVersion.name == name)
+        .values(version=DataVersion.version + 1)
+    )
+
+
+def create_data_version_statement(name, dialect):
+    """INSERT do contador na versão 0, sem erro se outra transação já criou a linha"""
+    statement = insert_ignoring_conflicts(DataVersion, DataVersion.name, dialect=dialect)
+    if statement is None:
+        statement = insert(DataVersion)
+    return statement.values(name=name, version=0)
+
+
+def mark_data_version_bumped(session, name):
+    """Registra na sessão o contador alterado, esquecido deste processo após o commit"""
+    session.info.setdefault('bumped_versions', set()).add(name)
+
+
+def bump_data_version(name=EMPLOYEES):
+    """Incrementa o contador na transação corrente (chamar antes do commit).
+
+    Retorna a nova versão, válida após o commit.
+    """
+    version = _increment_data_version(name)
+
+    if version is None:
+        # As linhas vêm das migrations; bases criadas sem elas ganham a linha aqui
+        db.session.execute(create_data_version_statement(name, db.engine.dialect.name))
+        version = _increment_data_version(name)
+
+    mark_data_version_bumped(db.session, name)
+    return version
+
+
+def _increment_data_version(name):
+    statement = bump_data_version_statement(name)
+
+    if db.engine.dialect.update_returning:
+        return db.session.execute(statement.returning(DataVersion.version)).scalar()
+
+    result = db.session.execute(statement)
+    return get_data_version(name, fresh=True) if result.rowcount else None
+
+
+@event.listens_for(Session, 'after_commit')
+def _forget_bumped_versions(session):
+    # Escritas deste processo ficam visíveis imediatamente na próxima leitura
+    for name in session.info.pop('bumped_versions', ()):
+        _known_versions.pop(name, None)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_bumped_versions(session):
+    session.info.pop('bumped_versions', None)
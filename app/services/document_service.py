@@ -0,0 +1,54 @@
+from app import db
+from app.models.employee import Employee
+from app.models.document import Document
+from app.utils.cpf import format_cpf
+from app.utils.pagination import DEFAULT_PAGE_SIZE
+from sqlalchemy import select, tuple_
+
+def list_expiring_documents(start, end, company=None, limit=DEFAULT_PAGE_SIZE, after=None):
+    """Retorna uma página de documentos com vencimento entre start e end (inclusive).
+
+    Ordenados por (expiration_date, id), varridos pelo índice ix_documents_expiration_date_id.
+    `after` é a chave (expiration_date, id) do último item da página anterior.
+    """
+    try:
+        query = (
+            select(
+                Document.id,
+                Document.name,
+                Document.expiration_date,
+                Document.employee_id,
+                Employee.employee_name,
+                Employee.company_name,
+                Employee.cpf
+            )
+            .join(Employee, Employee.id == Document.employee_id)
+            .where(Document.expiration_date.between(start, end))
+            .order_by(Document.expiration_date.asc(), Document.id.asc())
+        )
+
+        if company:
+            query = query.where(Employee.company_name == company)
+
+        if after:
+            query = query.where(tuple_(Document.expiration_date, Document.id) > tuple_(*after))
+
+        rows = db.session.execute(query.limit(limit + 1)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        result = [expiring_document_item(row) for row in rows]
+
+        next_key = (rows[-1].expiration_date, rows[-1].id) if has_more else None
+        return result, next_key
+
+    except Exception as e:
+        print(f"Erro ao listar documentos a vencer: {e}")
+        raise e
+
+def expiring_document_item(row):
+    """Converte uma linha do relatório em dicionário, com data ISO e CPF formatado"""
+    item = dict(row._mapping)
+    item['expiration_date'] = row.expiration_date.strftime('%Y-%m-%d')
+    item['cpf'] = format_cpf(item['cpf'])
+    return item
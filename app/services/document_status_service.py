@@ -0,0 +1,200 @@
+from datetime import datetime, time, timedelta
+import heapq
+import threading
+from app import db
+from app.models.employee import Employee
+from app.models.document import Document
+from app.services.data_version_service import bump_data_version
+from sqlalchemy import func, select, update
+
+EXPIRING_WINDOW_DAYS = 30
+
+# Tempo máximo entre sincronizações com o banco, para capturar escritas de outros workers
+MAX_SLEEP_SECONDS = 3600
+
+# Advisory lock (PostgreSQL) que elege o único processo que roda o agendador
+SCHEDULER_LOCK_KEY = 720301
+# Intervalo entre tentativas de assumir o agendador nos processos sem o lock
+LEADER_RETRY_SECONDS = 300
+
+
+def compute_document_status(expiration_dates, today=None):
+    """Calcula o status dos documentos e a data da próxima transição.
+
+    O status depende apenas do vencimento mais próximo: passa a 'expiring'
+    EXPIRING_WINDOW_DAYS dias antes dele e a 'expired' no dia seguinte.
+    """
+    today = today or datetime.utcnow().date()
+    dates = [d for d in expiration_dates if d is not None]
+
+    if not dates:
+        return 'valid', None
+
+    first_expiration = min(dates)
+
+    if first_expiration < today:
+        return 'expired', None
+    if first_expiration <= today + timedelta(days=EXPIRING_WINDOW_DAYS):
+        return 'expiring', first_expiration + timedelta(days=1)
+    return 'valid', first_expiration - timedelta(days=EXPIRING_WINDOW_DAYS)
+
+
+def refresh_due_document_status(today=None):
+    """Recalcula o status apenas dos funcionários com transição vencida"""
+    today = today or datetime.utcnow().date()
+
+    rows = db.session.execute(
+        select(Employee.id, func.min(Document.expiration_date))
+        .outerjoin(Document, Document.employee_id == Employee.id)
+        .where(Employee.next_status_change_at <= today)
+        .group_by(Employee.id)
+    ).all()
+
+    if not rows:
+        return 0
+
+    changes = []
+    for employee_id, first_expiration in rows:
+        status, next_change = compute_document_status([first_expiration], today)
+        changes.append({
+            'id': employee_id,
+            'document_status': status,
+            'next_status_change_at': next_change
+        })
+
+    # UPDATE em lote por chave primária (executemany)
+    db.session.execute(update(Employee), changes)
+    bump_data_version()
+    db.session.commit()
+    return len(changes)
+
+
+def next_document_status_change():
+    """Retorna a próxima data em que algum status muda"""
+    return db.session.execute(select(func.min(Employee.next_status_change_at))).scalar()
+
+
+class DocumentStatusScheduler:
+    """Thread que acorda na próxima transição de status e atualiza só as linhas afetadas.
+
+    As transições conhecidas ficam em um min-heap de datas; escritas no
+    serviço de funcionários empurram novas datas com schedule().
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._heap = []
+        self._scheduled = set()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._lock_connection = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        if app.config.get('DOCUMENT_STATUS_SCHEDULER_ENABLED'):
+            self.start()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='document-status-scheduler', daemon=True)
+        self._thread.start()
+
+    def schedule(self, when):
+        """Registra uma data de transição; acorda a thread se for a mais próxima"""
+        if when is None or self._thread is None:
+            return
+        with self._condition:
+            if self._push(when) and self._heap[0] == when:
+                self._condition.notify()
+
+    def _push(self, when):
+        if when in self._scheduled:
+            return False
+        self._scheduled.add(when)
+        heapq.heappush(self._heap, when)
+        return True
+
+    def _acquire_leadership(self):
+        """Garante um único agendador entre os workers.
+
+        No PostgreSQL, só o processo que obtém o advisory lock continua; o lock
+        é de sessão, mantido por uma conexão dedicada enquanto o processo vive,
+        e liberado pelo banco se ele morrer. Outros bancos (SQLite local) não
+        têm o lock: vale apenas DOCUMENT_STATUS_SCHEDULER_ENABLED.
+        """
+        with self.app.app_context():
+            engine = db.engine
+
+        if engine.dialect.name != 'postgresql':
+            return True
+
+        connection = engine.connect()
+        try:
+            acquired = connection.execute(select(func.pg_try_advisory_lock(SCHEDULER_LOCK_KEY))).scalar()
+            # Encerra a transação; o lock de sessão continua com a conexão
+            connection.commit()
+        except Exception as e:
+            connection.close()
+            self.app.logger.error(f'Erro ao obter o lock do agendador de status: {str(e)}')
+            return False
+
+        if not acquired:
+            connection.close()
+            return False
+
+        self._lock_connection = connection
+        self.app.logger.info('Agendador de status de documentos ativo neste processo')
+        return True
+
+    def _run(self):
+        # Sem o lock, outro worker já atualiza os status; tenta de novo mais tarde
+        while not self._acquire_leadership():
+            with self._condition:
+                self._condition.wait(LEADER_RETRY_SECONDS)
+
+        while True:
+            with self.app.app_context():
+                try:
+                    updated = refresh_due_document_status()
+                    if updated:
+                        self.app.logger.info('Status de documentos atualizado para %s funcionários', updated)
+                    next_change = next_document_status_change()
+                except Exception as e:
+                    db.session.rollback()
+                    self.app.logger.error(f'Erro ao atualizar status de documentos: {str(e)}')
+                    next_change = None
+                finally:
+                    db.session.remove()
+
+            with self._condition:
+                if next_change is not None:
+                    self._push(next_change)
+                self._wait_for_next_change()
+
+    def _wait_for_next_change(self):
+        deadline = datetime.utcnow() + timedelta(seconds=MAX_SLEEP_SECONDS)
+
+        while True:
+            now = datetime.utcnow()
+            today = now.date()
+
+            if self._heap and self._heap[0] <= today:
+                while self._heap and self._heap[0] <= today:
+                    self._scheduled.discard(heapq.heappop(self._heap))
+                return
+
+            if now >= deadline:
+                return
+
+            timeout = (deadline - now).total_seconds()
+            if self._heap:
+                wake_at = datetime.combine(self._heap[0], time.min)
+                timeout = min(timeout, (wake_at - now).total_seconds())
+
+            self._condition.wait(max(timeout, 0))
+
+
+status_scheduler = DocumentStatusScheduler()
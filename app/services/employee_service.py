@@ -1,143 +1,371 @@
-from datetime import datetime, timedelta
+from datetime import datetime
+import json
 import uuid
 from app import db
 from app.models.employee import Employee
 from app.models.document import Document
+from app.services.cpf_filter_service import cpf_filter
+from app.services.data_version_service import EMPLOYEE_CPFS, bump_data_version, get_data_version
+from app.services.document_status_service import compute_document_status, status_scheduler
+from app.utils.cpf import cpf_search_digits, format_cpf, normalize_cpf
+from app.utils.merge_patch import apply_merge_patch
+from app.utils.pagination import DEFAULT_PAGE_SIZE
+from app.utils.sql import insert_ignoring_conflicts
+from app.utils.validation import validate_address
+from sqlalchemy import any_, bindparam, cast, desc, func, insert, literal_column, or_, select, tuple_, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import joinedload
 
+# Colunas retornadas pela listagem e pela busca de funcionários
+LIST_COLUMNS = (
+    Employee.id,
+    Employee.employee_name,
+    Employee.company_name,
+    Employee.cpf,
+    Employee.phone,
+    Employee.emergency_phone,
+    Employee.document_status.label('status')
+)
+
+SEARCH_LIMIT = 20
+
+# Campos alteráveis via PATCH e colunas devolvidas após a alteração
+PATCHABLE_FIELDS = ('employee_name', 'company_name', 'address', 'phone', 'emergency_phone')
+PATCH_COLUMNS = (
+    Employee.id,
+    Employee.employee_name,
+    Employee.company_name,
+    Employee.cpf,
+    Employee.address,
+    Employee.phone,
+    Employee.emergency_phone,
+    Employee.document_status.label('status'),
+    Employee.version
+)
+
+EMPLOYEE_NOT_FOUND = 'Funcionário não encontrado'
+VERSION_CONFLICT = 'Funcionário alterado por outra requisição; recarregue e tente novamente'
+
+# Colunas da exportação CSV: uma linha por documento (ou por funcionário sem documentos)
+EXPORT_HEADER = (
+    'employee_id', 'cpf', 'employee_name', 'company_name', 'phone', 'emergency_phone',
+    'address', 'document_status', 'document_id', 'document_name', 'expiration_date'
+)
+
+# Linhas buscadas por vez do cursor do servidor na listagem em streaming
+STREAM_BATCH_SIZE = 1000
+
+def employee_list_item(row):
+    """Converte uma linha de colunas do funcionário em dicionário, com o CPF formatado"""
+    item = dict(row._mapping)
+    item['cpf'] = format_cpf(item['cpf'])
+    return item
+
 def check_cpf_exists(cpf):
+    """Verifica um CPF já normalizado (chave canônica de normalize_cpf)"""
     try:
-        employee = Employee.query.filter_by(cpf=cpf).first()
-        return employee is not None
+        # Negativo do filtro é definitivo: responde sem consultar o banco
+        might_exist = cpf_filter.lookup(cpf, get_data_version(EMPLOYEE_CPFS)) if cpf_filter.enabled() else None
+        if might_exist is False:
+            return False
+
+        exists = db.session.execute(cpf_exists_query(cpf)).first() is not None
+        if might_exist and not exists:
+            cpf_filter.record_false_positive()
+        return exists
     except Exception as e:
         print(f"Erro ao verificar CPF: {e}")
         raise e
 
+def cpf_exists_query(cpf):
+    return select(Employee.id).where(Employee.cpf == cpf).limit(1)
+
+def find_existing_cpfs(cpfs, use_filter=False):
+    """Retorna o subconjunto de CPFs (chaves canônicas) já cadastrados, em uma única consulta"""
+    cpfs = list(set(cpfs))
+    if use_filter and cpf_filter.enabled():
+        # Versão lida uma vez para o lote; filtro desatualizado deixa todos seguirem para o banco
+        version = get_data_version(EMPLOYEE_CPFS)
+        cpfs = [cpf for cpf in cpfs if cpf_filter.lookup(cpf, version) is not False]
+    if not cpfs:
+        return set()
+
+    return set(db.session.execute(existing_cpfs_query(cpfs, db.engine.dialect.name)).scalars())
+
+def existing_cpfs_query(cpfs, dialect):
+    if dialect == 'postgresql':
+        # cpf = ANY(:array): um único parâmetro, independente da quantidade de CPFs
+        condition = Employee.cpf == any_(bindparam('cpfs', cpfs, type_=postgresql.ARRAY(db.BigInteger)))
+    else:
+        condition = Employee.cpf.in_(cpfs)
+    return select(Employee.cpf).where(condition)
+
+def insert_employees(rows):
+    """Insere funcionários e retorna os CPFs efetivamente inseridos.
+
+    Com ON CONFLICT (cpf) DO NOTHING a unicidade é decidida pelo próprio
+    INSERT, sem corrida entre verificação e inserção em cadastros paralelos.
+    """
+    statement = insert_ignoring_conflicts(Employee, Employee.cpf)
+    if statement is not None:
+        return set(db.session.execute(statement.returning(Employee.cpf), rows).scalars())
+
+    # Demais bancos: verificação prévia (a constraint única ainda barra corridas)
+    existing = find_existing_cpfs(row['cpf'] for row in rows)
+    rows = [row for row in rows if row['cpf'] not in existing]
+    if rows:
+        db.session.execute(insert(Employee), rows)
+    return {row['cpf'] for row in rows}
+
+def build_employee_rows(cpf, employee_name, company_name, documents, address=None, phone=None, emergency_phone=None):
+    """Monta as linhas de funcionário e documentos de um cadastro.
+
+    Retorna (funcionário, documentos, erro); compartilhado pelas rotas síncronas e assíncronas.
+    """
+    now = datetime.utcnow()
+    employee_id = str(uuid.uuid4())
+
+    document_rows = []
+    for doc in documents:
+        try:
+            document_rows.append({
+                'id': str(uuid.uuid4()),
+                'employee_id': employee_id,
+                'name': doc['name'],
+                'expiration_date': datetime.strptime(doc['expiration_date'], '%Y-%m-%d').date(),
+                'created_at': now,
+                'updated_at': now
+            })
+        except KeyError as e:
+            return None, None, f"Campo obrigatório do documento: {str(e)}"
+        except (TypeError, ValueError) as e:
+            return None, None, f"Data inválida no documento: {str(e)}"
+
+    status, next_change = compute_document_status(doc['expiration_date'] for doc in document_rows)
+
+    employee_row = {
+        'id': employee_id,
+        'cpf': cpf,
+        'company_name': company_name,
+        'employee_name': employee_name,
+        'address': address,
+        'phone': phone,
+        'emergency_phone': emergency_phone,
+        'document_status': status,
+        'next_status_change_at': next_change,
+        'version': 1,
+        'created_at': now,
+        'updated_at': now
+    }
+    return employee_row, document_rows, None
+
 def create_employee_with_documents(cpf, employee_name, company_name, documents, address=None, phone=None, emergency_phone=None):
     try:
-        # Verificar se CPF já existe
-        if check_cpf_exists(cpf):
-            return None, "CPF já cadastrado"
-        
-        employee = Employee(
-            id=str(uuid.uuid4()),
-            cpf=cpf,
-            company_name=company_name,
-            employee_name=employee_name,
-            address=address,
-            phone=phone,
-            emergency_phone=emergency_phone,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+        employee_row, document_rows, error = build_employee_rows(
+            cpf, employee_name, company_name, documents, address, phone, emergency_phone
         )
+        if error:
+            return None, error
 
-        db.session.add(employee)
-        db.session.flush()
+        inserted = insert_employees([employee_row])
+        if not inserted:
+            db.session.rollback()
+            return None, "CPF já cadastrado"
 
-        for doc in documents:
-            try:
-                document = Document(
-                    id=str(uuid.uuid4()),
-                    employee_id=employee.id,
-                    name=doc['name'],
-                    expiration_date=datetime.strptime(doc['expiration_date'], '%Y-%m-%d'),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
-                )
-                db.session.add(document)
-            except KeyError as e:
-                db.session.rollback()
-                return None, f"Campo obrigatório do documento: {str(e)}"
-            except ValueError as e:
-                db.session.rollback()
-                return None, f"Data inválida no documento: {str(e)}"
+        # Todos os documentos em um único INSERT com várias linhas
+        if document_rows:
+            db.session.execute(insert(Document).values(document_rows))
 
+        bump_data_version()
+        cpfs_version = bump_data_version(EMPLOYEE_CPFS)
         db.session.commit()
-        return employee, None
+        status_scheduler.schedule(employee_row['next_status_change_at'])
+        cpf_filter.add([cpf], cpfs_version)
+        return employee_row['id'], None
         
     except Exception as e:
         db.session.rollback()
         print(f"Erro ao criar funcionário: {e}")
         return None, "Erro interno ao criar funcionário"
 
-def list_employees_with_document_status():
-    try:
-        employees = Employee.query.options(joinedload(Employee.documents)).order_by(Employee.employee_name.asc()).all()
-        result = []
-        
-        today = datetime.utcnow().date()
-        expiring_threshold = today + timedelta(days=30)
+def list_employees_with_document_status(limit=DEFAULT_PAGE_SIZE, after=None, status=None):
+    """Retorna uma página de funcionários ordenada por (employee_name, id).
 
-        for emp in employees:
-            try:
-                documents = emp.documents
-                
-                has_expired = any(doc.expiration_date < today for doc in documents)
-                
-                has_expiring = any(today <= doc.expiration_date <= expiring_threshold for doc in documents)
-                
-                if has_expired:
-                    status = 'expired'
-                elif has_expiring:
-                    status = 'expiring'
-                else:
-                    status = 'valid'
-
-                result.append({
-                    'id': emp.id,
-                    'employee_name': emp.employee_name,
-                    'company_name': emp.company_name,
-                    'cpf': emp.cpf,
-                    'phone': emp.phone,
-                    'emergency_phone': emp.emergency_phone,
-                    'status': status
-                })
-            except Exception as e:
-                print(f"Erro ao processar funcionário {emp.id}: {e}")
-                # Continua processando outros funcionários
-
-        return result
+    `after` é a chave (employee_name, id) do último item da página anterior.
+    Retorna os itens da página e a chave para o próximo cursor (None na última página).
+    """
+    try:
+        rows = db.session.execute(list_employees_query(limit, after, status)).all()
+        return employees_page(rows, limit)
         
     except Exception as e:
         print(f"Erro ao listar funcionários: {e}")
         raise e
 
+def list_employees_query(limit, after=None, status=None):
+    # Status materializado em employees.document_status (ver document_status_service)
+    query = select(*LIST_COLUMNS).order_by(Employee.employee_name.asc(), Employee.id.asc())
+
+    if status:
+        query = query.where(Employee.document_status == status)
+
+    # Paginação por chave: usa o índice (employee_name, id) em vez de OFFSET
+    if after:
+        query = query.where(tuple_(Employee.employee_name, Employee.id) > tuple_(*after))
+
+    # Uma linha a mais indica se existe próxima página
+    return query.limit(limit + 1)
+
+def employees_page(rows, limit):
+    """Separa a página das linhas de list_employees_query e calcula a próxima chave"""
+    has_more = len(rows) > limit
+    result = [employee_list_item(row) for row in rows[:limit]]
+
+    next_key = (result[-1]['employee_name'], result[-1]['id']) if has_more else None
+    return result, next_key
+
+def iter_employees_with_document_status(status=None):
+    """Percorre todos os funcionários em ordem sem carregar o resultado inteiro na memória"""
+    query = select(*LIST_COLUMNS).order_by(Employee.employee_name.asc(), Employee.id.asc())
+
+    if status:
+        query = query.where(Employee.document_status == status)
+
+    # yield_per usa cursor do lado do servidor (stream_results) e busca em lotes
+    result = db.session.execute(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    for row in result:
+        yield employee_list_item(row)
+
+def iter_employee_documents():
+    """Percorre funcionários x documentos com cursor do lado do servidor, para exportação"""
+    query = (
+        select(
+            Employee.id,
+            Employee.cpf,
+            Employee.employee_name,
+            Employee.company_name,
+            Employee.phone,
+            Employee.emergency_phone,
+            Employee.address,
+            Employee.document_status,
+            Document.id,
+            Document.name,
+            Document.expiration_date
+        )
+        .outerjoin(Document, Document.employee_id == Employee.id)
+        .order_by(Employee.employee_name.asc(), Employee.id.asc(), Document.expiration_date.asc())
+    )
+
+    result = db.session.execute(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    for row in result:
+        row = list(row)
+        row[1] = format_cpf(row[1])
+        row[6] = json.dumps(row[6], ensure_ascii=False) if row[6] else ''
+        row[10] = row[10].strftime('%Y-%m-%d') if row[10] else ''
+        yield row
+
+def _cpf_digits(dialect):
+    """CPF como texto de 11 dígitos, preservando zeros à esquerda"""
+    if dialect == 'postgresql':
+        return func.lpad(cast(Employee.cpf, db.Text), literal_column('11'), literal_column("'0'"))
+    return func.substr(literal_column("'00000000000'", db.String) + cast(Employee.cpf, db.String), -11)
+
+def _search_document():
+    """Expressão indexada pelo GIN ix_employees_search_trgm (deve ser idêntica à da migration)"""
+    separator = literal_column("' '")
+    return func.immutable_unaccent(func.lower(
+        Employee.employee_name + separator + Employee.company_name + separator + _cpf_digits('postgresql')
+    ))
+
+def search_employees(term, limit=SEARCH_LIMIT):
+    """Busca funcionários por nome, empresa ou CPF, ordenados por relevância"""
+    try:
+        rows = db.session.execute(search_employees_query(term, limit, db.engine.dialect.name)).all()
+        return [employee_list_item(row) for row in rows]
+
+    except Exception as e:
+        print(f"Erro ao buscar funcionários: {e}")
+        raise e
+
+def search_employees_query(term, limit, dialect):
+    # CPF completo e válido: busca exata pela chave canônica (índice único)
+    cpf = normalize_cpf(term)
+    if cpf is not None:
+        return select(*LIST_COLUMNS).where(Employee.cpf == cpf)
+
+    # Trecho de CPF ("529.982") é comparado sem pontuação
+    term = cpf_search_digits(term) or term
+    pattern = '%' + term.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+    if dialect == 'postgresql':
+        # pg_trgm + unaccent: "joao" encontra "João" e tolera erros de digitação
+        document = _search_document()
+        query_term = func.immutable_unaccent(term.lower())
+        rank = func.word_similarity(query_term, document)
+        query = select(*LIST_COLUMNS).where(or_(
+            document.like(func.immutable_unaccent(pattern), escape='\\'),
+            query_term.op('<%')(document)
+        )).order_by(desc(rank), Employee.employee_name.asc(), Employee.id.asc())
+    else:
+        query = select(*LIST_COLUMNS).where(or_(
+            func.lower(Employee.employee_name).like(pattern, escape='\\'),
+            func.lower(Employee.company_name).like(pattern, escape='\\'),
+            _cpf_digits(dialect).like(pattern, escape='\\')
+        )).order_by(Employee.employee_name.asc(), Employee.id.asc())
+
+    return query.limit(limit)
+
+def get_employee_version(id):
+    """Versão atual do funcionário (None se não existir), usada no ETag do detalhe"""
+    return db.session.execute(employee_version_query(id)).scalar()
+
+def employee_version_query(id):
+    return select(Employee.version).where(Employee.id == id)
+
 def get_employee_detail(id):
     try:
-        employee = Employee.query.options(joinedload(Employee.documents)).filter_by(id=id).first()
+        employee = db.session.execute(employee_detail_query(id)).unique().scalar_one_or_none()
 
         if not employee:
-            return None, 'Funcionário não encontrado'
+            return None, EMPLOYEE_NOT_FOUND
 
-        result = {
-            'id': employee.id,
-            'employee_name': employee.employee_name,
-            'company_name': employee.company_name,
-            'cpf': employee.cpf,
-            'address': employee.address,
-            'phone': employee.phone,
-            'emergency_phone': employee.emergency_phone,
-            'documents': [
-                {
-                    'id': doc.id,
-                    'name': doc.name,
-                    'expiration_date': doc.expiration_date.strftime('%Y-%m-%d')
-                } for doc in employee.documents
-            ]
-        }
-
-        return result, None
+        return employee_detail_item(employee), None
         
     except Exception as e:
         print(f"Erro ao buscar funcionário {id}: {e}")
         return None, "Erro interno ao buscar funcionário"
 
+def employee_detail_query(id):
+    return select(Employee).options(joinedload(Employee.documents)).where(Employee.id == id)
+
+def employee_detail_item(employee):
+    return {
+        'id': employee.id,
+        'employee_name': employee.employee_name,
+        'company_name': employee.company_name,
+        'cpf': format_cpf(employee.cpf),
+        'address': employee.address,
+        'phone': employee.phone,
+        'emergency_phone': employee.emergency_phone,
+        'documents': [
+            {
+                'id': doc.id,
+                'name': doc.name,
+                'expiration_date': doc.expiration_date.strftime('%Y-%m-%d')
+            } for doc in employee.documents
+        ]
+    }
+
 def update_employee(id, data):
     try:
-        employee = Employee.query.get(id)
+        # Funcionário e todos os seus documentos em uma única consulta
+        employee = db.session.execute(
+            select(Employee).options(joinedload(Employee.documents)).where(Employee.id == id)
+        ).unique().scalar_one_or_none()
         if not employee:
-            return None, 'Funcionário não encontrado'
+            return None, EMPLOYEE_NOT_FOUND
 
+        now = datetime.utcnow()
         employee.employee_name = data.get('employee_name', employee.employee_name)
         employee.company_name = data.get('company_name', employee.company_name)
         if 'address' in data:
@@ -146,63 +374,148 @@ def update_employee(id, data):
             employee.phone = data.get('phone')
         if 'emergency_phone' in data:
             employee.emergency_phone = data.get('emergency_phone')
-        employee.updated_at = datetime.utcnow()
+        employee.updated_at = now
+        employee.version = Employee.version + 1
 
         documents_data = data.get('documents', [])
+        documents_by_id = {document.id: document for document in employee.documents}
+        new_documents = []
 
         for doc_data in documents_data:
             try:
                 doc_id = doc_data.get('id')
 
                 if doc_id:
-                    document = Document.query.filter_by(id=doc_id, employee_id=employee.id).first()
+                    document = documents_by_id.get(doc_id)
                     if document:
                         document.name = doc_data.get('name', document.name)
                         if 'expiration_date' in doc_data:
                             document.expiration_date = datetime.strptime(doc_data['expiration_date'], '%Y-%m-%d').date()
-                        document.updated_at = datetime.utcnow()
+                        document.updated_at = now
                     else:
+                        db.session.rollback()
                         return None, f'Documento com ID {doc_id} não encontrado para este funcionário'
                 else:
                     if 'name' in doc_data and 'expiration_date' in doc_data:
-                        new_doc = Document(
-                            id=str(uuid.uuid4()),
-                            name=doc_data['name'],
-                            expiration_date=datetime.strptime(doc_data['expiration_date'], '%Y-%m-%d').date(),
-                            employee_id=employee.id,
-                            created_at=datetime.utcnow(),
-                            updated_at=datetime.utcnow()
-                        )
-                        db.session.add(new_doc)
+                        new_documents.append({
+                            'id': str(uuid.uuid4()),
+                            'name': doc_data['name'],
+                            'expiration_date': datetime.strptime(doc_data['expiration_date'], '%Y-%m-%d').date(),
+                            'employee_id': employee.id,
+                            'created_at': now,
+                            'updated_at': now
+                        })
                     else:
+                        db.session.rollback()
                         return None, 'Nome e data de expiração são obrigatórios para novo documento'
             except ValueError as e:
                 db.session.rollback()
                 return None, f'Data inválida no documento: {str(e)}'
 
-        db.session.commit()
-        
-        # Recarregar funcionário com documentos atualizados
-        employee = Employee.query.options(joinedload(Employee.documents)).filter_by(id=id).first()
-        
+        documents = [
+            {'id': doc.id, 'name': doc.name, 'expiration_date': doc.expiration_date}
+            for doc in employee.documents
+        ] + new_documents
+
+        next_change = None
+        if documents_data:
+            # Status calculado a partir dos documentos já carregados, sem consultar o banco
+            status, next_change = compute_document_status(doc['expiration_date'] for doc in documents)
+            employee.document_status = status
+            employee.next_status_change_at = next_change
+
+        # Resposta montada antes do commit, que expira o estado carregado
         employee_data = {
             'id': employee.id,
             'employee_name': employee.employee_name,
             'company_name': employee.company_name,
-            'cpf': employee.cpf,
+            'cpf': format_cpf(employee.cpf),
             'address': employee.address,
             'documents': [
                 {
-                    'id': doc.id,
-                    'name': doc.name,
-                    'expiration_date': doc.expiration_date.strftime('%Y-%m-%d')
-                } for doc in employee.documents
+                    'id': doc['id'],
+                    'name': doc['name'],
+                    'expiration_date': doc['expiration_date'].strftime('%Y-%m-%d')
+                } for doc in documents
             ]
         }
 
+        # Novos documentos em um único INSERT (executemany)
+        if new_documents:
+            db.session.execute(insert(Document), new_documents)
+
+        bump_data_version()
+        db.session.commit()
+        status_scheduler.schedule(next_change)
+
         return employee_data, None
         
     except Exception as e:
         db.session.rollback()
         print(f"Erro ao atualizar funcionário {id}: {e}")
         return None, "Erro interno ao atualizar funcionário"
+
+def patch_employee(id, patch, expected_versions=None):
+    """Aplica um JSON Merge Patch aos campos do funcionário (sem documentos).
+
+    expected_versions vem do If-Match: a verificação e a escrita acontecem no
+    mesmo UPDATE ... WHERE version IN (...), sem janela entre leitura e escrita.
+    Retorna o funcionário alterado (com 'version', sem documentos) ou o erro.
+    """
+    try:
+        values = {field: patch[field] for field in PATCHABLE_FIELDS if field in patch}
+
+        if isinstance(values.get('address'), dict):
+            # Endereço é um objeto: o patch é mesclado ao valor atual, protegido pela versão lida
+            current = db.session.execute(
+                select(Employee.address, Employee.version).where(Employee.id == id)
+            ).first()
+            if current is None:
+                return None, EMPLOYEE_NOT_FOUND
+            if expected_versions is not None and current.version not in expected_versions:
+                return None, VERSION_CONFLICT
+
+            address = apply_merge_patch(current.address, values['address'])
+            if not validate_address(address):
+                return None, 'Formato de endereço inválido'
+            values['address'] = address or None
+            expected_versions = [current.version]
+
+        if not values:
+            row = db.session.execute(select(*PATCH_COLUMNS).where(Employee.id == id)).first()
+            if row is None:
+                return None, EMPLOYEE_NOT_FOUND
+            if expected_versions is not None and row.version not in expected_versions:
+                return None, VERSION_CONFLICT
+            return employee_list_item(row), None
+
+        statement = (
+            update(Employee)
+            .where(Employee.id == id)
+            .values(**values, updated_at=datetime.utcnow(), version=Employee.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if expected_versions is not None:
+            statement = statement.where(Employee.version.in_(expected_versions))
+
+        if db.engine.dialect.update_returning:
+            row = db.session.execute(statement.returning(*PATCH_COLUMNS)).first()
+        else:
+            row = None
+            if db.session.execute(statement).rowcount:
+                row = db.session.execute(select(*PATCH_COLUMNS).where(Employee.id == id)).first()
+
+        if row is None:
+            # Nenhuma linha alterada: funcionário inexistente ou versão diferente da esperada
+            db.session.rollback()
+            exists = db.session.execute(select(Employee.id).where(Employee.id == id)).first()
+            return None, VERSION_CONFLICT if exists else EMPLOYEE_NOT_FOUND
+
+        bump_data_version()
+        db.session.commit()
+        return employee_list_item(row), None
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Erro ao alterar funcionário {id}: {e}")
+        return None, "Erro interno ao alterar funcionário"
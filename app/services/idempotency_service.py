@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+from flask import current_app
+from app import db
+from app.models.idempotency_key import IdempotencyKey
+from app.utils.sql import insert_ignoring_conflicts
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+# Colunas devolvidas para uma chave já existente
+RECORD_COLUMNS = (
+    IdempotencyKey.request_hash,
+    IdempotencyKey.status_code,
+    IdempotencyKey.response_body,
+    IdempotencyKey.created_at
+)
+
+
+def claim_idempotency_key(user_id, key, request_hash):
+    """Reserva a chave para a requisição atual.
+
+    Retorna None se a chave foi reservada agora (o chamador deve executar a
+    requisição e gravar a resposta) ou a linha existente, com a resposta
+    gravada ou status_code nulo se a original ainda está em processamento.
+    """
+    now = datetime.utcnow()
+    row = {'user_id': user_id, 'key': key, 'request_hash': request_hash, 'created_at': now}
+
+    statement = insert_ignoring_conflicts(IdempotencyKey, IdempotencyKey.user_id, IdempotencyKey.key)
+    if statement is not None:
+        claimed = db.session.execute(statement.values(row).returning(IdempotencyKey.key)).first() is not None
+    else:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(IdempotencyKey).values(row))
+            claimed = True
+        except IntegrityError:
+            claimed = False
+
+    if claimed:
+        db.session.commit()
+        return None
+
+    where = (IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+    existing = db.session.execute(select(*RECORD_COLUMNS).where(*where)).first()
+
+    if existing is None or _is_stale(existing, now):
+        # Chave expirada ou abandonada (worker interrompido): reaproveitada se ninguém a pegou antes
+        condition = where + ((IdempotencyKey.created_at == existing.created_at,) if existing else ())
+        result = db.session.execute(
+            update(IdempotencyKey).where(*condition)
+            .values(request_hash=request_hash, status_code=None, response_body=None, created_at=now)
+        )
+        db.session.commit()
+        if result.rowcount == 1:
+            return None
+        return claim_idempotency_key(user_id, key, request_hash)
+
+    db.session.commit()
+    return existing
+
+
+def save_idempotent_response(user_id, key, status_code, body):
+    db.session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+        .values(status_code=status_code, response_body=body)
+    )
+    db.session.commit()
+
+
+def release_idempotency_key(user_id, key):
+    """Libera a chave para que o cliente possa repetir a requisição"""
+    db.session.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+    )
+    db.session.commit()
+
+
+def purge_expired_idempotency_keys():
+    """Remove as chaves com mais de IDEMPOTENCY_KEY_TTL segundos"""
+    cutoff = datetime.utcnow() - timedelta(seconds=current_app.config['IDEMPOTENCY_KEY_TTL'])
+    result = db.session.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff))
+    db.session.commit()
+    return result.rowcount
+
+
+def _is_stale(record, now):
+    age = now - record.created_at
+    if age > timedelta(seconds=current_app.config['IDEMPOTENCY_KEY_TTL']):
+        return True
+    return record.status_code is None and age > timedelta(seconds=current_app.config['IDEMPOTENCY_LOCK_TIMEOUT'])
@@ -0,0 +1,139 @@
+import csv
+import json
+from app import db
+from app.models.document import Document
+from app.services.cpf_filter_service import cpf_filter
+from app.services.data_version_service import EMPLOYEE_CPFS, bump_data_version
+from app.services.document_status_service import status_scheduler
+from app.services.employee_service import build_employee_rows, insert_employees
+from app.utils.validation import parse_employee_payload
+from sqlalchemy import insert
+
+# Funcionários validados e inseridos por transação
+IMPORT_BATCH_SIZE = 1000
+
+# Limite de erros detalhados no relatório (o total é sempre informado)
+MAX_REPORTED_ERRORS = 1000
+
+CSV_FIELDS = ('cpf', 'employee_name', 'company_name', 'phone', 'emergency_phone', 'documents')
+
+
+def read_csv_records(lines):
+    """Lê um CSV com cabeçalho; documentos no formato "nome:YYYY-MM-DD;nome:YYYY-MM-DD".
+
+    Gera (linha, registro, erro) sem carregar o arquivo inteiro na memória.
+    """
+    reader = csv.DictReader(lines)
+    missing = {'cpf', 'employee_name', 'company_name'} - set(reader.fieldnames or ())
+    if missing:
+        yield 1, None, f"Colunas obrigatórias ausentes: {', '.join(sorted(missing))}"
+        return
+
+    for row in reader:
+        record = {key: (value or '').strip() or None for key, value in row.items() if key in CSV_FIELDS}
+        documents = []
+        for item in (record.pop('documents', None) or '').split(';'):
+            if not item.strip():
+                continue
+            name, _, expiration_date = item.rpartition(':')
+            documents.append({'name': name.strip(), 'expiration_date': expiration_date.strip()})
+        record['documents'] = documents
+        yield reader.line_num, record, None
+
+
+def read_jsonl_records(lines):
+    """Lê um funcionário por linha no mesmo formato do POST /employee/register_employee"""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"JSON inválido: {str(e)}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Cada linha deve conter um objeto JSON"
+            continue
+        yield line_number, record, None
+
+
+def import_employees(records, batch_size=IMPORT_BATCH_SIZE):
+    """Valida e insere funcionários em lotes, reportando erros por linha sem abortar a importação"""
+    summary = {'imported': 0, 'error_count': 0, 'errors': []}
+    seen_cpfs = set()
+    batch = []
+
+    for line_number, record, error in records:
+        if not error:
+            # Mesma validação e montagem de linhas do POST /employee/register_employee
+            fields, error = parse_employee_payload(record)
+        if not error:
+            employee, documents, error = build_employee_rows(**fields)
+        if not error and employee['cpf'] in seen_cpfs:
+            error = "CPF duplicado no arquivo"
+        if error:
+            _report_error(summary, line_number, error)
+            continue
+
+        seen_cpfs.add(employee['cpf'])
+        batch.append((line_number, employee, documents))
+
+        if len(batch) >= batch_size:
+            _insert_batch(batch, summary)
+            batch = []
+
+    if batch:
+        _insert_batch(batch, summary)
+
+    # Erros de validação e de inserção dos lotes chegam fora de ordem
+    summary['errors'].sort(key=lambda error: error['line'])
+    return summary
+
+
+def _insert_batch(batch, summary):
+    employees = [employee for _, employee, _ in batch]
+
+    try:
+        # INSERT em lote com ON CONFLICT (cpf) DO NOTHING: importações paralelas
+        # não falham por CPFs cadastrados entre a validação e a inserção
+        inserted = insert_employees(employees)
+        documents = [
+            document
+            for _, employee, employee_documents in batch if employee['cpf'] in inserted
+            for document in employee_documents
+        ]
+        if documents:
+            db.session.execute(insert(Document), documents)
+        if inserted:
+            bump_data_version()
+            cpfs_version = bump_data_version(EMPLOYEE_CPFS)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Erro ao importar lote de funcionários: {e}")
+        for line_number, _, _ in batch:
+            _report_error(summary, line_number, "Erro interno ao inserir o lote")
+        return
+
+    for line_number, employee, _ in batch:
+        if employee['cpf'] not in inserted:
+            _report_error(summary, line_number, "CPF já cadastrado")
+
+    if not inserted:
+        return
+
+    summary['imported'] += len(inserted)
+    cpf_filter.add(inserted, cpfs_version)
+
+    next_changes = [
+        employee['next_status_change_at'] for employee in employees
+        if employee['cpf'] in inserted and employee['next_status_change_at']
+    ]
+    if next_changes:
+        status_scheduler.schedule(min(next_changes))
+
+
+def _report_error(summary, line_number, message):
+    summary['error_count'] += 1
+    if len(summary['errors']) < MAX_REPORTED_ERRORS:
+        summary['errors'].append({'line': line_number, 'message': message})
@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+# Pico de logins: a pool está cheia e o cliente deve tentar de novo (503 com Retry-After)
+PASSWORD_POOL_BUSY = 'Muitas verificações de senha em andamento. Tente novamente em instantes'
+
+
+class PasswordPoolBusy(Exception):
+    """Todas as vagas da pool de hash de senha estão ocupadas"""
+
+
+class PasswordPool:
+    """Pool limitada de threads para gerar e verificar hashes de senha.
+
+    O KDF é propositalmente caro; com no máximo `workers` hashes em paralelo
+    e `max_pending` na fila, um pico de logins recebe 503 rapidamente em vez
+    de ocupar toda a CPU e atrasar as demais requisições.
+    """
+
+    def __init__(self, workers=2, max_pending=16):
+        self.completed = 0
+        self.rejected = 0
+        self._executor = None
+        self._lock = threading.Lock()
+        self.configure(workers, max_pending)
+
+    def init_app(self, app):
+        self.configure(app.config['PASSWORD_HASH_WORKERS'], app.config['PASSWORD_HASH_MAX_PENDING'])
+
+    def configure(self, workers, max_pending):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._in_flight = 0
+
+    def submit(self, fn, *args):
+        """Agenda fn(*args) na pool e retorna o Future; PasswordPoolBusy se não houver vaga"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordPoolBusy()
+
+        slots = self._slots
+        with self._lock:
+            self._in_flight += 1
+
+        # A vaga é liberada pela própria tarefa, antes de o resultado ficar disponível
+        def task():
+            try:
+                return fn(*args)
+            finally:
+                self._release(slots)
+
+        return self._executor.submit(task)
+
+    def run(self, fn, *args):
+        """Executa fn(*args) na pool e aguarda o resultado"""
+        return self.submit(fn, *args).result()
+
+    def _release(self, slots):
+        slots.release()
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+
+    def metrics(self):
+        return {
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'in_flight': self._in_flight,
+            'completed': self.completed,
+            'rejected': self.rejected
+        }
+
+
+password_pool = PasswordPool()
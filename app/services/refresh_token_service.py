@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+import hashlib
+import secrets
+import uuid
+from app import db
+from app.models.refresh_token import RefreshToken
+from config import Config
+from sqlalchemy import delete, insert, select, update
+
+# Reapresentar um token trocado há menos que isso (duas abas renovando juntas) só falha;
+# depois disso é tratado como token vazado e a família inteira é revogada
+REUSE_GRACE = timedelta(seconds=30)
+
+
+def hash_refresh_token(token):
+    return hashlib.sha256(token.encode()).digest()
+
+
+def new_refresh_token(user_id, family_id=None, now=None):
+    """Gera um refresh token aleatório; retorna (token, linha para refresh_tokens).
+
+    O token tem 256 bits de entropia, então basta um sha256 para guardá-lo:
+    a validação não passa pelo hash de senha.
+    """
+    now = now or datetime.utcnow()
+    token = secrets.token_urlsafe(32)
+    return token, {
+        'token_hash': hash_refresh_token(token),
+        'user_id': str(user_id),
+        'family_id': family_id or str(uuid.uuid4()),
+        'expires_at': now + timedelta(seconds=Config.REFRESH_TOKEN_LIFETIME),
+        'created_at': now
+    }
+
+
+def issue_refresh_token(user_id):
+    """Inicia uma nova família de refresh tokens (login)"""
+    token, row = new_refresh_token(user_id)
+    db.session.execute(insert(RefreshToken).values(row))
+    db.session.commit()
+    return token
+
+
+def rotate_refresh_token(token):
+    """Troca um refresh token válido por um novo da mesma família.
+
+    Retorna (user_id, novo_token) ou (None, None). A troca é um UPDATE
+    condicional, então entre requisições concorrentes com o mesmo token
+    só uma consegue o novo token.
+    """
+    now = datetime.utcnow()
+    token_hash = hash_refresh_token(token)
+    statement = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now
+        )
+        .values(revoked_at=now)
+    )
+
+    if db.engine.dialect.update_returning:
+        current = db.session.execute(statement.returning(RefreshToken.user_id, RefreshToken.family_id)).first()
+    else:
+        result = db.session.execute(statement)
+        current = None
+        if result.rowcount:
+            current = db.session.execute(
+                select(RefreshToken.user_id, RefreshToken.family_id).where(RefreshToken.token_hash == token_hash)
+            ).first()
+
+    if current is None:
+        # Token já trocado fora da tolerância: revoga os tokens ainda ativos da família
+        reused_family = (
+            select(RefreshToken.family_id)
+            .where(RefreshToken.token_hash == token_hash, RefreshToken.revoked_at < now - REUSE_GRACE)
+            .scalar_subquery()
+        )
+        db.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == reused_family, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        db.session.commit()
+        return None, None
+
+    new_token, row = new_refresh_token(current.user_id, current.family_id, now)
+    db.session.execute(insert(RefreshToken).values(row))
+    db.session.commit()
+    return current.user_id, new_token
+
+
+def revoke_refresh_token(token):
+    """Revoga a família do token (logout); retorna o número de tokens revogados"""
+    family = (
+        select(RefreshToken.family_id)
+        .where(RefreshToken.token_hash == hash_refresh_token(token))
+        .scalar_subquery()
+    )
+    result = db.session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def purge_expired_refresh_tokens():
+    """Remove os refresh tokens vencidos"""
+    result = db.session.execute(delete(RefreshToken).where(RefreshToken.expires_at < datetime.utcnow()))
+    db.session.commit()
+    return result.rowcount
@@ -0,0 +1,74 @@
+from alembic.script import ScriptDirectory
+from flask import current_app
+from flask_migrate import upgrade
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+
+# 'revision': compara a revisão do banco com a do código em uma consulta (padrão)
+# 'upgrade': aplica as migrations pendentes no boot (desenvolvimento local)
+# 'skip': não consulta o banco no boot
+SCHEMA_CHECK_MODES = ('revision', 'upgrade', 'skip')
+
+# Heads das migrations por diretório, lidos uma vez por processo
+_expected_revisions = {}
+
+
+def expected_schema_revisions(directory=None):
+    """Revisões (heads) das migrations do código, lidas dos arquivos sem consultar o banco"""
+    directory = directory or current_app.extensions['migrate'].directory
+    if directory not in _expected_revisions:
+        _expected_revisions[directory] = frozenset(ScriptDirectory(directory).get_heads())
+    return _expected_revisions[directory]
+
+
+def applied_schema_revisions():
+    """Revisões registradas pelo Alembic no banco, em uma única consulta"""
+    return frozenset(db.session.execute(text('SELECT version_num FROM alembic_version')).scalars())
+
+
+def schema_is_current(expected, applied):
+    return bool(expected) and set(expected) == set(applied)
+
+
+def check_schema():
+    """Compara a revisão do banco com a das migrations.
+
+    Retorna (ok, detalhes); falha de conexão ou tabela alembic_version
+    inexistente contam como schema desatualizado.
+    """
+    expected = expected_schema_revisions()
+    try:
+        applied = applied_schema_revisions()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return False, {'expected': sorted(expected), 'applied': None, 'error': str(e).splitlines()[0]}
+
+    return schema_is_current(expected, applied), {'expected': sorted(expected), 'applied': sorted(applied)}
+
+
+def release_schema():
+    """Etapa de release: aplica as migrations pendentes e confirma a revisão resultante"""
+    upgrade()
+    return check_schema()
+
+
+def init_schema_check(app):
+    """Verificação do schema no boot de cada worker, conforme SCHEMA_CHECK_MODE"""
+    mode = app.config['SCHEMA_CHECK_MODE']
+    if mode not in SCHEMA_CHECK_MODES:
+        raise ValueError(f'SCHEMA_CHECK_MODE inválido: {mode}. Use: {", ".join(SCHEMA_CHECK_MODES)}')
+
+    if mode == 'skip':
+        return
+
+    with app.app_context():
+        ok, details = release_schema() if mode == 'upgrade' else check_schema()
+
+    if ok:
+        app.logger.info('Schema do banco na revisão %s', ', '.join(details['applied']))
+    else:
+        app.logger.error(
+            f'Schema do banco desatualizado (banco: {details["applied"]}, código: {details["expected"]}). '
+            'Execute: python manage.py release'
+        )
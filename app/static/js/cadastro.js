@@ -83,7 +83,6 @@ document.addEventListener('DOMContentLoaded', function() {
         const company_name = companyNameInput.value;
         const phone = phoneInput.value;
         const emergency_phone = emergencyPhoneInput.value;
-        const token = localStorage.getItem('token');
 
         const documents = Array.from(document.querySelectorAll('.document-entry')).map(entry => {
             const name = entry.querySelector('.document-name').value;
@@ -128,14 +127,16 @@ document.addEventListener('DOMContentLoaded', function() {
             ...(hasAddress && { address: addressData })
         };
 
+        const body = JSON.stringify(payload);
+
         try {
-            const response = await fetch('/employee/register_employee', {
+            const response = await fetchAutenticado('/employee/register_employee', {
                 method: "POST",
                 headers: {
                     "Content-Type": "application/json",
-                    "Authorization": `Bearer ${token}`
+                    "Idempotency-Key": chaveIdempotencia(body)
                 },
-                body: JSON.stringify(payload)
+                body
             });
 
             if (response.ok) {
@@ -172,13 +173,7 @@ document.addEventListener('DOMContentLoaded', function() {
         statusDiv.textContent = '🔄 Verificando CPF...';
         
         try {
-            const token = localStorage.getItem('token');
-            const response = await fetch(`/employee/check_register/${encodeURIComponent(cpfValue)}`, {
-                method: 'GET',
-                headers: {
-                    'Authorization': `Bearer ${token}`
-                }
-            });
+            const response = await fetchAutenticado(`/employee/check_register/${encodeURIComponent(cpfValue)}`);
             
             if (response.status === 200) {
                 statusDiv.style.color = '#28a745'; // verde
@@ -186,6 +181,9 @@ document.addEventListener('DOMContentLoaded', function() {
             } else if (response.status === 409) {
                 statusDiv.style.color = '#dc3545'; // vermelho
                 statusDiv.textContent = '❌ CPF já possui cadastro';
+            } else if (response.status === 400) {
+                statusDiv.style.color = '#dc3545';
+                statusDiv.textContent = '❌ CPF inválido';
             } else {
                 statusDiv.style.color = '#dc3545';
                 statusDiv.textContent = '❌ Erro ao verificar CPF';
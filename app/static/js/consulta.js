@@ -1,14 +1,23 @@
 document.addEventListener('DOMContentLoaded', function() {
-    const token = localStorage.getItem('token');
+    const PAGE_SIZE = 50;
+    const SEARCH_DEBOUNCE_MS = 300;
+    const loadMoreButton = document.getElementById('load-more');
     let allEmployees = [];
+    let nextCursor = null;
+    let loading = false;
+    let searchTimer = null;
+    let searchController = null;
 
     async function fetchEmployees() {
+        if (loading) return;
+        loading = true;
+        loadMoreButton.disabled = true;
+
         try {
-            const response = await fetch('/employee/list', {
-                headers: {
-                    "Authorization": `Bearer ${token}`
-                }
-            });
+            const params = new URLSearchParams({ limit: PAGE_SIZE });
+            if (nextCursor) params.set('cursor', nextCursor);
+
+            const response = await fetchAutenticado(`/employee/list?${params}`);
 
             const data = await response.json();
 
@@ -17,13 +26,52 @@ document.addEventListener('DOMContentLoaded', function() {
                 return;
             }
 
-            allEmployees = data;
-            displayEmployees(data);
+            allEmployees = allEmployees.concat(data.items);
+            nextCursor = data.next_cursor;
+            if (!isSearching()) displayEmployees(allEmployees);
         } catch (err) {
             alert("Erro ao conectar com o servidor.");
+        } finally {
+            loading = false;
+            loadMoreButton.disabled = false;
+            updateLoadMore();
         }
     }
 
+    async function searchEmployees(term) {
+        // Cancela a busca anterior ainda em andamento
+        if (searchController) searchController.abort();
+        searchController = new AbortController();
+
+        try {
+            const params = new URLSearchParams({ q: term });
+            const response = await fetchAutenticado(`/employee/search?${params}`, {
+                signal: searchController.signal
+            });
+
+            const data = await response.json();
+
+            if (!response.ok) {
+                alert(data.message || "Erro ao buscar funcionários.");
+                return;
+            }
+
+            displayEmployees(data.items);
+        } catch (err) {
+            if (err.name !== 'AbortError') {
+                alert("Erro ao conectar com o servidor.");
+            }
+        }
+    }
+
+    function isSearching() {
+        return searchInput.value.trim().length >= 2;
+    }
+
+    function updateLoadMore() {
+        loadMoreButton.style.display = nextCursor && !isSearching() ? '' : 'none';
+    }
+
     function displayEmployees(employees) {
         const tbody = document.getElementById('employee-body');
         tbody.innerHTML = '';
@@ -64,13 +112,6 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
 
-    function filterEmployees(searchTerm) {
-        const filteredEmployees = allEmployees.filter(emp => 
-            emp.employee_name.toLowerCase().includes(searchTerm.toLowerCase())
-        );
-        displayEmployees(filteredEmployees);
-    }
-
     window.consultarFuncionario = function(id) {
         window.location.href = `/detalhes/${id}`;
     };
@@ -81,8 +122,30 @@ document.addEventListener('DOMContentLoaded', function() {
 
     const searchInput = document.getElementById('search-input');
     searchInput.addEventListener('input', function(e) {
-        filterEmployees(e.target.value);
+        clearTimeout(searchTimer);
+        updateLoadMore();
+
+        const term = e.target.value.trim();
+        if (term.length < 2) {
+            if (searchController) searchController.abort();
+            displayEmployees(allEmployees);
+            return;
+        }
+
+        searchTimer = setTimeout(() => searchEmployees(term), SEARCH_DEBOUNCE_MS);
     });
 
+    loadMoreButton.addEventListener('click', fetchEmployees);
+
+    // Carrega a próxima página quando o botão fica visível ao rolar a tabela
+    if ('IntersectionObserver' in window) {
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting) && nextCursor && !isSearching()) {
+                fetchEmployees();
+            }
+        });
+        observer.observe(loadMoreButton);
+    }
+
     fetchEmployees();
 });
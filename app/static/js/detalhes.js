@@ -1,5 +1,4 @@
 document.addEventListener('DOMContentLoaded', function() {
-    const token = localStorage.getItem("token");
     const employeeId = window.employeeId; // Será definido no HTML
     const documentsContainer = document.getElementById("documents-container");
     const form = document.getElementById('edit-form');
@@ -81,11 +80,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
     async function carregarDados() {
         try {
-            const response = await fetch(`/employee/${employeeId}`, {
-                headers: {
-                    "Authorization": `Bearer ${token}`
-                }
-            });
+            const response = await fetchAutenticado(`/employee/${employeeId}`);
 
             const data = await response.json();
             if (!response.ok) {
@@ -182,14 +177,16 @@ document.addEventListener('DOMContentLoaded', function() {
             ...(hasAddress && { address: addressData })
         };
 
+        const body = JSON.stringify(payload);
+
         try {
-            const response = await fetch(`/employee/${employeeId}`, {
+            const response = await fetchAutenticado(`/employee/${employeeId}`, {
                 method: "PUT",
                 headers: {
                     "Content-Type": "application/json",
-                    "Authorization": `Bearer ${token}`
+                    "Idempotency-Key": chaveIdempotencia(body)
                 },
-                body: JSON.stringify(payload)
+                body
             });
 
             const data = await response.json();
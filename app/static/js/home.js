@@ -9,8 +9,21 @@ document.addEventListener('DOMContentLoaded', function() {
         window.location.href = "/consulta";
     };
     
-    window.logout = function() {
-        localStorage.removeItem("token");
+    window.logout = async function() {
+        // Revoga o refresh token no servidor; a saída local não depende da resposta
+        const refreshToken = getRefreshToken();
+        if (refreshToken) {
+            try {
+                await fetch("/auth/logout", {
+                    method: "POST",
+                    headers: { "Content-Type": "application/json" },
+                    body: JSON.stringify({ refresh_token: refreshToken })
+                });
+            } catch (err) {
+                // Sem conexão: o refresh token expira sozinho
+            }
+        }
+        limparTokens();
         window.location.href = "/";
     };
 });
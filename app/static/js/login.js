@@ -82,6 +82,7 @@ document.addEventListener('DOMContentLoaded', function() {
             const data = await response.json();
             if (response.ok) {
                 localStorage.setItem('token', data.token);
+                localStorage.setItem('refresh_token', data.refresh_token);
                 window.location.href = '/home';
             } else {
                 const backendMsg = (data && (data.message || data.error)) || '';
@@ -2,6 +2,20 @@ function getToken() {
   return localStorage.getItem("token");
 }
 
+function getRefreshToken() {
+  return localStorage.getItem("refresh_token");
+}
+
+function salvarTokens(data) {
+  localStorage.setItem("token", data.token);
+  if (data.refresh_token) localStorage.setItem("refresh_token", data.refresh_token);
+}
+
+function limparTokens() {
+  localStorage.removeItem("token");
+  localStorage.removeItem("refresh_token");
+}
+
 function checkAuth() {
   const token = getToken();
   if (!token) {
@@ -19,6 +33,55 @@ function authHeaders() {
   };
 }
 
+// ===== RENOVAÇÃO DO TOKEN =====
+// O token de acesso dura poucos minutos; ao receber 401 a requisição é repetida após
+// trocar o refresh token por um novo par, sem pedir a senha novamente
+let renovacaoEmAndamento = null;
+
+function renovarToken() {
+  // Requisições que recebem 401 ao mesmo tempo compartilham uma única renovação
+  if (!renovacaoEmAndamento) {
+    renovacaoEmAndamento = (async () => {
+      const refreshToken = getRefreshToken();
+      if (!refreshToken) return false;
+
+      const response = await fetch("/auth/refresh", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ refresh_token: refreshToken }),
+      });
+      if (response.ok) {
+        salvarTokens(await response.json());
+        return true;
+      }
+      // Outra aba pode ter renovado com o mesmo refresh token
+      return getRefreshToken() !== refreshToken;
+    })()
+      .catch(() => false)
+      .finally(() => {
+        renovacaoEmAndamento = null;
+      });
+  }
+  return renovacaoEmAndamento;
+}
+
+async function fetchAutenticado(url, options = {}) {
+  const comToken = () => ({
+    ...options,
+    headers: { ...(options.headers || {}), Authorization: `Bearer ${getToken()}` },
+  });
+
+  let response = await fetch(url, comToken());
+  if (response.status === 401 && (await renovarToken())) {
+    response = await fetch(url, comToken());
+  }
+  if (response.status === 401) {
+    limparTokens();
+    window.location.href = "/";
+  }
+  return response;
+}
+
 function showModal(message, redirectTo = null) {
   const modal = document.createElement("div");
   modal.className = "modal";
@@ -235,3 +298,25 @@ document.addEventListener('keydown', function(e) {
     e.target.click();
   }
 }, true);
+
+// ===== IDEMPOTÊNCIA =====
+// Reenviar o mesmo corpo (ex.: após falha de rede) reutiliza a chave e o servidor
+// devolve a resposta original em vez de executar a operação novamente
+const chavesIdempotencia = new Map();
+
+function chaveIdempotencia(corpo) {
+  if (!chavesIdempotencia.has(corpo)) {
+    chavesIdempotencia.clear();
+    chavesIdempotencia.set(corpo, gerarUuid());
+  }
+  return chavesIdempotencia.get(corpo);
+}
+
+function gerarUuid() {
+  if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+  const bytes = crypto.getRandomValues(new Uint8Array(16));
+  bytes[6] = (bytes[6] & 0x0f) | 0x40;
+  bytes[8] = (bytes[8] & 0x3f) | 0x80;
+  const hex = Array.from(bytes, b => b.toString(16).padStart(2, '0')).join('');
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+}
@@ -1,61 +1,88 @@
 from functools import wraps
+from datetime import datetime, timedelta
 from flask import request, jsonify, current_app
 import jwt
 from config import Config
 from uuid import UUID
+from app import db
+from app.models.user import User
+from app.utils.token_cache import TokenCache
+
+# Validade do token de acesso; depois disso o cliente usa o refresh token (/auth/refresh)
+TOKEN_LIFETIME = timedelta(seconds=Config.ACCESS_TOKEN_LIFETIME)
+
+# Tokens já verificados: requisições repetidas com o mesmo token não refazem HMAC nem parse das claims
+verified_tokens = TokenCache()
+
+def create_access_token(user_id):
+    payload = {
+        'user_id': str(user_id),
+        'exp': datetime.utcnow() + TOKEN_LIFETIME
+    }
+    return jwt.encode(payload, Config.SECRET_KEY, algorithm='HS256')
+
+def token_pair(user_id, refresh_token):
+    """Corpo da resposta de login e renovação: token de acesso curto e refresh token"""
+    return {
+        'token': create_access_token(user_id),
+        'refresh_token': refresh_token,
+        'expires_in': int(TOKEN_LIFETIME.total_seconds())
+    }
+
+def parse_authorization(auth_header):
+    """Valida o header Authorization ("Bearer <token>").
+
+    Retorna (user_id, None) ou (None, (mensagem, status)); usado pelas rotas
+    Flask e pelas rotas assíncronas.
+    """
+    if not auth_header:
+        return None, ('Token de acesso obrigatório', 401)
+
+    # Formato esperado: "Bearer <token>"
+    parts = auth_header.split(" ")
+    if len(parts) != 2 or parts[0] != "Bearer":
+        return None, ('Formato de token inválido. Use: Bearer <token>', 401)
+    token = parts[1]
+    if not token:
+        return None, ('Token de acesso obrigatório', 401)
+
+    user_id = verified_tokens.get(token)
+    if user_id is not None:
+        return user_id, None
+
+    try:
+        data = jwt.decode(token, Config.SECRET_KEY, algorithms=['HS256'])
+    except jwt.ExpiredSignatureError:
+        return None, ('Token expirado. Faça login novamente', 401)
+    except jwt.InvalidTokenError:
+        return None, ('Token inválido', 401)
+
+    user_id = data.get('user_id')
+    if not user_id:
+        return None, ('Token inválido: dados incompletos', 401)
+
+    try:
+        # Validar UUID
+        user_id = UUID(user_id)
+    except (ValueError, TypeError, AttributeError):
+        return None, ('Token contém dados inválidos', 401)
+
+    # Só tokens com 'exp' entram no cache, que os descarta nesse instante
+    if isinstance(data.get('exp'), (int, float)):
+        verified_tokens.set(token, user_id, data['exp'])
+    return user_id, None
 
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         try:
-            token = None
-            auth_header = request.headers.get('Authorization')
-            
-            current_app.logger.info(f'Verificando autenticação para {request.endpoint}')
-            current_app.logger.debug(f'Authorization header: {auth_header[:20] if auth_header else "None"}...')
-
-            if auth_header:
-                try:
-                    # Formato esperado: "Bearer <token>"
-                    parts = auth_header.split(" ")
-                    if len(parts) == 2 and parts[0] == "Bearer":
-                        token = parts[1]
-                    else:
-                        current_app.logger.warning(f'Formato de Authorization header inválido: {auth_header[:50]}')
-                        return jsonify({'message': 'Formato de token inválido. Use: Bearer <token>'}), 401
-                except Exception as e:
-                    current_app.logger.error(f'Erro ao processar Authorization header: {str(e)}')
-                    return jsonify({'message': 'Erro ao processar token'}), 401
-
-            if not token:
-                current_app.logger.warning('Token não fornecido')
-                return jsonify({'message': 'Token de acesso obrigatório'}), 401
-
-            try:
-                # Decodificar token
-                data = jwt.decode(token, Config.SECRET_KEY, algorithms=['HS256'])
-                user_id = data.get('user_id')
-                
-                if not user_id:
-                    current_app.logger.warning('Token não contém user_id')
-                    return jsonify({'message': 'Token inválido: dados incompletos'}), 401
-                
-                # Validar UUID
-                request.user_id = UUID(user_id)
-                current_app.logger.info(f'Token válido para usuário: {user_id}')
-                
-            except jwt.ExpiredSignatureError:
-                current_app.logger.warning('Token expirado')
-                return jsonify({'message': 'Token expirado. Faça login novamente'}), 401
-            except jwt.InvalidTokenError as e:
-                current_app.logger.warning(f'Token inválido: {str(e)}')
-                return jsonify({'message': 'Token inválido'}), 401
-            except ValueError as e:
-                current_app.logger.warning(f'UUID inválido no token: {str(e)}')
-                return jsonify({'message': 'Token contém dados inválidos'}), 401
-            except Exception as e:
-                current_app.logger.error(f'Erro inesperado na validação do token: {str(e)}')
-                return jsonify({'message': 'Erro interno na autenticação'}), 500
+            user_id, error = parse_authorization(request.headers.get('Authorization'))
+            if error:
+                message, status = error
+                current_app.logger.warning('Autenticação recusada em %s: %s', request.endpoint, message)
+                return jsonify({'message': message}), status
+
+            request.user_id = user_id
 
             return f(*args, **kwargs)
             
@@ -64,3 +91,23 @@ def token_required(f):
             return jsonify({'message': 'Erro interno do servidor'}), 500
 
     return decorated
+
+def admin_required(f):
+    """Rotas administrativas: usar após @token_required; o email do usuário precisa estar em ADMIN_EMAILS"""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        try:
+            admins = current_app.config['ADMIN_EMAILS']
+            user = db.session.get(User, str(request.user_id)) if admins else None
+
+            if user is None or user.email.lower() not in admins:
+                current_app.logger.warning('Acesso administrativo recusado em %s', request.endpoint)
+                return jsonify({'message': 'Acesso restrito a administradores'}), 403
+
+            return f(*args, **kwargs)
+
+        except Exception as e:
+            current_app.logger.error(f'Erro ao verificar administrador: {str(e)}')
+            return jsonify({'message': 'Erro interno do servidor'}), 500
+
+    return decorated
@@ -0,0 +1,47 @@
+def normalize_cpf(value):
+    """Converte um CPF (formatado ou não) na chave canônica de 11 dígitos.
+
+    Retorna o número inteiro ou None se o CPF for inválido: tamanho errado,
+    todos os dígitos iguais ou dígitos verificadores incorretos.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        value = f'{value:011d}'
+    if not isinstance(value, str):
+        return None
+
+    digits = value.strip().replace('.', '').replace('-', '')
+    if len(digits) != 11 or not digits.isascii() or not digits.isdigit() or digits == digits[0] * 11:
+        return None
+
+    key = int(digits)
+    if build_cpf(key // 100) != key:
+        return None
+
+    return key
+
+
+def build_cpf(number):
+    """Chave canônica do CPF cujos 9 primeiros dígitos são number, com os dígitos verificadores"""
+    numbers = [int(digit) for digit in f'{number:09d}']
+    for position in (9, 10):
+        total = sum(value * weight for value, weight in zip(numbers, range(position + 1, 1, -1)))
+        numbers.append((total * 10) % 11 % 10)
+    return int(''.join(map(str, numbers)))
+
+
+def format_cpf(value):
+    """Formata a chave canônica como 000.000.000-00"""
+    if value is None:
+        return None
+    digits = f'{int(value):011d}'
+    return f'{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}'
+
+
+def cpf_search_digits(term):
+    """Remove a pontuação de um termo de busca composto só por dígitos, pontos e hífen"""
+    stripped = term.replace('.', '').replace('-', '')
+    if stripped and stripped.isascii() and stripped.isdigit():
+        return stripped
+    return None
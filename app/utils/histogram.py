@@ -0,0 +1,76 @@
+import threading
+
+
+class Histogram:
+    """Histograma log-linear no estilo HDR para inteiros não negativos.
+
+    Cada potência de 2 é dividida em 2**precision_bits faixas, então o erro
+    relativo de qualquer percentil fica abaixo de 1 / 2**precision_bits
+    (1,6% com o padrão) e a memória não cresce com o número de amostras.
+    """
+
+    def __init__(self, precision_bits=6):
+        self.precision_bits = precision_bits
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._sub_buckets = 1 << precision_bits
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, value):
+        value = max(int(value), 0)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, fraction):
+        """Valor abaixo do qual está a fração informada das amostras (None se vazio)"""
+        with self._lock:
+            if not self.count:
+                return None
+
+            rank = max(1, round(fraction * self.count))
+            if rank >= self.count:
+                return self.max
+
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(max(self._value(index), self.min), self.max)
+
+            return self.max
+
+    def summary(self, scale=1):
+        """p50/p95/p99, média, mínimo e máximo divididos por scale (ex.: 1000 para µs -> ms)"""
+        if not self.count:
+            return {'count': 0}
+
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count / scale, 3),
+            'min': round(self.min / scale, 3),
+            'p50': round(self.percentile(0.50) / scale, 3),
+            'p95': round(self.percentile(0.95) / scale, 3),
+            'p99': round(self.percentile(0.99) / scale, 3),
+            'max': round(self.max / scale, 3)
+        }
+
+    def _index(self, value):
+        # Valores menores que 2 * sub_buckets são exatos; acima, os bits menos significativos são descartados
+        shift = max(0, value.bit_length() - self.precision_bits - 1)
+        return (shift << self.precision_bits) + (value >> shift)
+
+    def _value(self, index):
+        # Ponto médio da faixa representada pelo índice
+        shift = max(0, (index >> self.precision_bits) - 1)
+        lower = (index - (shift << self.precision_bits)) << shift
+        return lower + ((1 << shift) - 1) // 2
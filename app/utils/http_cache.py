@@ -0,0 +1,17 @@
+from flask import request, make_response
+
+
+def not_modified(etag):
+    """Retorna uma resposta 304 se o If-None-Match do cliente contém o ETag atual"""
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def with_etag(response, etag):
+    """Anexa o ETag forte e obriga o navegador a revalidar antes de reutilizar"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
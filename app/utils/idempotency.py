@@ -0,0 +1,74 @@
+from functools import wraps
+import hashlib
+from flask import request, jsonify, current_app, make_response
+from app import db
+from app.services.idempotency_service import (
+    claim_idempotency_key,
+    save_idempotent_response,
+    release_idempotency_key
+)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(method, path, body):
+    """Identifica a requisição: a mesma chave com outro conteúdo é rejeitada"""
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), body):
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def idempotent(f):
+    """Repete a resposta gravada quando o cliente reenvia o mesmo Idempotency-Key.
+
+    As chaves são por usuário: aplicar depois de @token_required.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return f(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return jsonify({'message': f'{IDEMPOTENCY_HEADER} deve ter no máximo {MAX_KEY_LENGTH} caracteres'}), 400
+
+        user_id = str(request.user_id)
+        fingerprint = request_fingerprint(request.method, request.path, request.get_data())
+
+        try:
+            existing = claim_idempotency_key(user_id, key, fingerprint)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f'Erro ao reservar {IDEMPOTENCY_HEADER}: {str(e)}')
+            return jsonify({'message': 'Erro interno do servidor'}), 500
+
+        if existing is not None:
+            if existing.request_hash != fingerprint:
+                return jsonify({'message': f'{IDEMPOTENCY_HEADER} já utilizada com outra requisição'}), 422
+            if existing.status_code is None:
+                response = jsonify({'message': 'Requisição original ainda em processamento'})
+                response.headers['Retry-After'] = '1'
+                return response, 409
+
+            current_app.logger.info('Repetindo resposta gravada para %s: %s', IDEMPOTENCY_HEADER, key)
+            response = current_app.response_class(existing.response_body, status=existing.status_code, mimetype='application/json')
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+
+        response = make_response(f(*args, **kwargs))
+
+        try:
+            # Erros internos não são gravados: o cliente pode tentar de novo com a mesma chave
+            if response.status_code >= 500:
+                release_idempotency_key(user_id, key)
+            else:
+                save_idempotent_response(user_id, key, response.status_code, response.get_data())
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f'Erro ao gravar resposta de {IDEMPOTENCY_HEADER}: {str(e)}')
+
+        return response
+
+    return decorated
@@ -0,0 +1,218 @@
+from datetime import datetime, timezone
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import time
+from flask import has_request_context, request
+from flask.logging import default_handler
+
+# Atributos padrão do LogRecord; os demais (extra=...) vão como campos do JSON
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'endpoint'}
+
+# Formata tracebacks na thread da requisição, antes de exc_info ser descartado
+_traceback_formatter = logging.Formatter()
+
+_listener = None
+_queue_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Uma linha JSON por registro: instante, nível, logger, mensagem e campos extras"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+
+        endpoint = getattr(record, 'endpoint', None)
+        if endpoint:
+            entry['endpoint'] = endpoint
+
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES and not name.startswith('_'):
+                entry[name] = value
+
+        # Registros da fila chegam com o traceback já em exc_text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        if record.stack_info:
+            entry['stack_info'] = self.formatStack(record.stack_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class LogSampler(logging.Filter):
+    """Amostragem por rota e limite de taxa para registros até INFO.
+
+    Roda na thread da requisição, antes do registro entrar na fila; avisos
+    e erros passam sempre, assim como registros fora de requisições.
+    """
+
+    def __init__(self, sample_rates=None, rate_limit=0):
+        super().__init__()
+        self.sample_rates = sample_rates or {}
+        self.rate_limit = rate_limit
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if not has_request_context():
+            return True
+
+        # Rota gravada no registro: o formatter roda em outra thread, sem contexto da requisição
+        endpoint = request.endpoint
+        record.endpoint = endpoint
+
+        if record.levelno > logging.INFO:
+            return True
+
+        rate = self.sample_rates.get(endpoint, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            self.sampled_out += 1
+            return False
+
+        if self.rate_limit and not self._take_token(endpoint):
+            self.rate_limited += 1
+            return False
+
+        return True
+
+    def _take_token(self, endpoint):
+        # Token bucket por rota: até rate_limit registros por segundo
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(endpoint, (self.rate_limit, now))
+            tokens = min(self.rate_limit, tokens + (now - updated_at) * self.rate_limit)
+            if tokens < 1:
+                self._buckets[endpoint] = (tokens, now)
+                return False
+            self._buckets[endpoint] = (tokens - 1, now)
+            return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que nunca bloqueia a requisição.
+
+    Como no QueueHandler da biblioteca padrão, a mensagem e o traceback são
+    montados antes de enfileirar e args/exc_info são descartados: o registro
+    não guarda referências a objetos da requisição, que podem mudar até o
+    QueueListener processá-lo. A thread do listener só serializa (JSON ou
+    texto) e escreve. Com a fila cheia o registro é descartado e contado.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_sample_rates(value, endpoints=None):
+    """Converte 'routes.checkRegister=0.01,routes.list=0.1' em {endpoint: taxa}
+
+    Com endpoints (app.view_functions), avisa sobre chaves que não são rotas
+    registradas: a amostragem delas nunca seria aplicada.
+    """
+    rates = {}
+    for item in filter(None, (part.strip() for part in (value or '').split(','))):
+        endpoint, _, rate = item.partition('=')
+        rate = float(rate)
+        if not endpoint or not 0 <= rate <= 1:
+            raise ValueError(f'Amostragem de log inválida: {item}')
+        rates[endpoint.strip()] = rate
+
+    if endpoints is not None:
+        for endpoint in rates:
+            if endpoint not in endpoints:
+                logging.getLogger(__name__).warning('LOG_SAMPLE_RATES: rota desconhecida %s', endpoint)
+    return rates
+
+
+def configure_logging(app):
+    """Logging da aplicação: fila em memória e uma thread que formata e escreve.
+
+    As requisições montam a mensagem e colocam o registro na fila; o
+    QueueListener serializa (JSON ou texto) e escreve na saída de erro.
+    """
+    global _listener, _queue_handler
+
+    level = getattr(logging, app.config.get('LOG_LEVEL', 'INFO'))
+    root = logging.getLogger()
+
+    # Reconfiguração (várias aplicações no mesmo processo): esvazia e substitui o pipeline anterior
+    if _listener is not None:
+        _listener.stop()
+        root.removeHandler(_queue_handler)
+
+    output = logging.StreamHandler(sys.stderr)
+    if app.config['LOG_FORMAT'] == 'json':
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    _queue_handler = NonBlockingQueueHandler(queue.Queue(app.config['LOG_QUEUE_SIZE']))
+    _queue_handler.addFilter(LogSampler(
+        parse_sample_rates(app.config['LOG_SAMPLE_RATES']),
+        app.config['LOG_INFO_RATE_LIMIT']
+    ))
+
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    # O app.logger propaga para a raiz; o handler padrão do Flask escreveria na thread da requisição
+    app.logger.removeHandler(default_handler)
+    app.logger.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def logging_stats():
+    if _queue_handler is None:
+        return {}
+
+    sampler = _queue_handler.filters[0]
+    return {
+        'queued': _queue_handler.queue.qsize(),
+        'dropped': _queue_handler.dropped,
+        'sampled_out': sampler.sampled_out,
+        'rate_limited': sampler.rate_limited
+    }
+
+
+@atexit.register
+def _flush_logs():
+    # Escreve o que ainda está na fila antes de o processo terminar
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,16 @@
+def apply_merge_patch(target, patch):
+    """Aplica um JSON Merge Patch (RFC 7386) e retorna o novo valor.
+
+    Objetos são mesclados recursivamente, null remove a chave e qualquer
+    outro valor (inclusive listas) substitui o anterior.
+    """
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
@@ -0,0 +1,71 @@
+import base64
+from datetime import date
+import json
+import uuid
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(*values):
+    """Codifica a chave do último item da página em um cursor opaco"""
+    raw = json.dumps(values, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, *fields):
+    """Decodifica um cursor gerado por encode_cursor.
+
+    Cada valor é validado e convertido pela função de mesma posição em
+    fields (cursor_text, cursor_uuid, cursor_date); número de campos ou
+    tipos divergentes geram ValueError, respondido com 400 pelas rotas.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError('Cursor inválido')
+
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise ValueError('Cursor inválido')
+
+    try:
+        return tuple(field(value) for field, value in zip(fields, values))
+    except (TypeError, ValueError):
+        raise ValueError('Cursor inválido')
+
+
+def cursor_text(value):
+    if value is not None and not isinstance(value, str):
+        raise ValueError(value)
+    return value
+
+
+def cursor_uuid(value):
+    """Id em formato UUID, mantido como texto (mesma forma das chaves primárias)"""
+    if not isinstance(value, str):
+        raise ValueError(value)
+    uuid.UUID(value)
+    return value
+
+
+def cursor_date(value):
+    if not isinstance(value, str):
+        raise ValueError(value)
+    return date.fromisoformat(value)
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Converte o parâmetro limit da query string, limitado a [1, maximum]"""
+    if value is None or value == '':
+        return default
+
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('Parâmetro limit deve ser um número inteiro')
+
+    if limit < 1:
+        raise ValueError('Parâmetro limit deve ser maior que zero')
+
+    return min(limit, maximum)
@@ -0,0 +1,152 @@
+from contextvars import ContextVar
+import random
+import threading
+import time
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.histogram import Histogram
+
+# Medições da requisição em andamento (None fora de requisições perfiladas)
+_current = ContextVar('request_profile', default=None)
+
+# Histogramas por endpoint: tempos em microssegundos, tamanho em bytes
+METRICS = ('wall_us', 'sql_count', 'sql_us', 'serialize_us', 'response_bytes')
+
+
+class RequestProfile:
+    __slots__ = ('started', 'sql_count', 'sql_time', 'serialize_time', '_cursor_started')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.serialize_time = 0.0
+        self._cursor_started = None
+
+
+class ProfilingJSONProvider(DefaultJSONProvider):
+    """Provider JSON que soma o tempo de serialização à requisição perfilada"""
+
+    def dumps(self, obj, **kwargs):
+        profile = _current.get()
+        if profile is None:
+            return super().dumps(obj, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            profile.serialize_time += time.perf_counter() - started
+
+
+class RequestProfiler:
+    """Instrumentação opcional por endpoint: tempo total, SQL, serialização e tamanho da resposta.
+
+    Desativado (PROFILING_ENABLED=false), nenhum hook ou evento é registrado
+    e o custo por requisição é zero. Ativado, uma fração das requisições
+    (PROFILING_SAMPLE_RATE) é medida e recebe o header Server-Timing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config['PROFILING_ENABLED']
+        self.sample_rate = app.config['PROFILING_SAMPLE_RATE']
+        if not self.enabled:
+            return
+
+        app.json = ProfilingJSONProvider(app)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._clear)
+
+        if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+    def snapshot(self):
+        """p50/p95/p99 por endpoint (tempos em ms)"""
+        with self._lock:
+            endpoints = dict(self._endpoints)
+
+        return {
+            endpoint: {
+                'wall_ms': histograms['wall_us'].summary(1000),
+                'sql_count': histograms['sql_count'].summary(),
+                'sql_ms': histograms['sql_us'].summary(1000),
+                'serialize_ms': histograms['serialize_us'].summary(1000),
+                'response_bytes': histograms['response_bytes'].summary()
+            }
+            for endpoint, histograms in sorted(endpoints.items())
+        }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def _histograms(self, endpoint):
+        histograms = self._endpoints.get(endpoint)
+        if histograms is None:
+            with self._lock:
+                histograms = self._endpoints.setdefault(endpoint, {name: Histogram() for name in METRICS})
+        return histograms
+
+    def _start(self):
+        if self.sample_rate >= 1.0 or random.random() < self.sample_rate:
+            request.environ['app.profile_token'] = _current.set(RequestProfile())
+
+    def _finish(self, response):
+        profile = _current.get()
+        if profile is None:
+            return response
+
+        wall = time.perf_counter() - profile.started
+        histograms = self._histograms(request.endpoint or 'not_found')
+        histograms['wall_us'].record(wall * 1e6)
+        histograms['sql_count'].record(profile.sql_count)
+        histograms['sql_us'].record(profile.sql_time * 1e6)
+        histograms['serialize_us'].record(profile.serialize_time * 1e6)
+
+        # Respostas em streaming não têm tamanho conhecido aqui
+        if not response.is_streamed:
+            histograms['response_bytes'].record(response.calculate_content_length() or 0)
+
+        response.headers['Server-Timing'] = server_timing(wall, profile)
+        return response
+
+    def _clear(self, exc=None):
+        token = request.environ.pop('app.profile_token', None)
+        if token is not None:
+            _current.reset(token)
+
+
+def server_timing(wall, profile):
+    """Header Server-Timing: total, SQL (com número de statements) e serialização JSON"""
+    return (
+        f'app;dur={wall * 1000:.2f}, '
+        f'db;dur={profile.sql_time * 1000:.2f};desc="{profile.sql_count} queries", '
+        f'json;dur={profile.serialize_time * 1000:.2f}'
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current.get()
+    if profile is not None:
+        profile._cursor_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current.get()
+    if profile is not None and profile._cursor_started is not None:
+        profile.sql_count += 1
+        profile.sql_time += time.perf_counter() - profile._cursor_started
+        profile._cursor_started = None
+
+
+request_profiler = RequestProfiler()
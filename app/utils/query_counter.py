@@ -0,0 +1,124 @@
+from collections import Counter
+from contextvars import ContextVar
+import re
+import threading
+from flask import current_app, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements executados na requisição em andamento (None fora de requisições observadas)
+_current = ContextVar('request_statements', default=None)
+
+# Parâmetros e literais de qualquer dialeto: ?, %(nome)s, $1, :nome, 'texto' e números
+_PARAMETER = re.compile(r"%\(\w+\)s|\$\d+|(?<!:):\w+|\?|'(?:[^']|'')*'|\b\d+\b")
+# Listas de parâmetros (IN expandido, VALUES com várias linhas) viram um único marcador
+_PARAMETER_LIST = re.compile(r'\(\?(?:\s*,\s*\?)*\)(?:\s*,\s*\(\?(?:\s*,\s*\?)*\))*')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def statement_shape(statement):
+    """Forma do statement: sem parâmetros, literais e tamanho das listas de valores.
+
+    Duas consultas com a mesma forma diferem apenas nos valores, como as
+    N consultas iguais de um acesso preguiçoso dentro de um laço.
+    """
+    shape = _PARAMETER.sub('?', statement)
+    shape = _PARAMETER_LIST.sub('(?...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+class QueryCounter:
+    """Conta os statements enviados ao banco dentro de um bloco with.
+
+    Só registra a thread que abriu o bloco: consultas de threads em segundo
+    plano (agendador de status, filtro de CPFs) não entram na contagem.
+    Um executemany conta como um statement, como no banco.
+    """
+
+    def __init__(self, engine=Engine):
+        self.engine = engine
+        self.statements = []
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.get_ident()
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+        return False
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def shapes(self):
+        return Counter(statement_shape(statement) for statement in self.statements)
+
+    def repeated(self, threshold=2):
+        """Formas executadas pelo menos threshold vezes: {forma: execuções}"""
+        return {shape: executions for shape, executions in self.shapes().items() if executions >= threshold}
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == self._thread:
+            self.statements.append(statement)
+
+
+class RepeatedQueryDetector:
+    """Modo de desenvolvimento: avisa quando a mesma forma de statement se repete em uma requisição.
+
+    Desativado (QUERY_DETECTOR_ENABLED=false), nenhum hook ou evento é
+    registrado. Ativado, cada forma executada QUERY_DETECTOR_THRESHOLD vezes
+    ou mais na mesma requisição gera um aviso no log, sinal típico de N+1.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold = 5
+        self.detected = 0
+
+    def init_app(self, app):
+        self.enabled = app.config['QUERY_DETECTOR_ENABLED']
+        self.threshold = app.config['QUERY_DETECTOR_THRESHOLD']
+        if not self.enabled:
+            return
+
+        app.before_request(self._start)
+        app.teardown_request(self._finish)
+
+        if not event.contains(Engine, 'before_cursor_execute', _record_statement):
+            event.listen(Engine, 'before_cursor_execute', _record_statement)
+
+    def _start(self):
+        request.environ['app.statements_token'] = _current.set(Counter())
+
+    def _finish(self, exc=None):
+        token = request.environ.pop('app.statements_token', None)
+        if token is None:
+            return
+
+        statements = _current.get()
+        _current.reset(token)
+
+        # Statements compilados pelo SQLAlchemy se repetem com o mesmo texto; a forma só é calculada aqui
+        shapes = Counter()
+        for statement, executions in statements.items():
+            shapes[statement_shape(statement)] += executions
+
+        for shape, executions in shapes.most_common():
+            if executions < self.threshold:
+                break
+            self.detected += 1
+            current_app.logger.warning(
+                'Possível N+1 em %s: %s execuções de %s', request.endpoint, executions, shape[:300]
+            )
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    statements = _current.get()
+    if statements is not None:
+        statements[statement] += 1
+
+
+query_detector = RepeatedQueryDetector()
@@ -0,0 +1,15 @@
+from app import db
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def insert_ignoring_conflicts(model, *index_elements, dialect=None):
+    """INSERT ... ON CONFLICT (index_elements) DO NOTHING, quando o banco suporta.
+
+    Retorna None nos demais bancos; o chamador decide o fallback.
+    """
+    dialect = dialect or db.engine.dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(model).on_conflict_do_nothing(index_elements=list(index_elements))
+    if dialect == 'sqlite':
+        return sqlite.insert(model).on_conflict_do_nothing(index_elements=list(index_elements))
+    return None
@@ -0,0 +1,57 @@
+from flask import current_app
+import csv
+import io
+
+# Quantidade de linhas agrupadas em cada bloco enviado ao cliente
+CHUNK_ROWS = 500
+
+
+def _chunks(pieces):
+    buffer = []
+    for piece in pieces:
+        buffer.append(piece)
+        if len(buffer) >= CHUNK_ROWS:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+def ndjson_stream(rows):
+    """Serializa cada linha como um objeto JSON por linha (application/x-ndjson)"""
+    dumps = current_app.json.dumps
+    return _chunks(dumps(row) + '\n' for row in rows)
+
+
+def json_array_stream(rows):
+    """Serializa as linhas como um único array JSON, enviado em blocos"""
+    dumps = current_app.json.dumps
+
+    def pieces():
+        yield '['
+        for index, row in enumerate(rows):
+            yield (',' if index else '') + dumps(row)
+        yield ']'
+
+    return _chunks(pieces())
+
+
+def csv_stream(header, rows):
+    """Escreve um CSV incrementalmente; o cabeçalho é enviado imediatamente"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(header)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    for index, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if index % CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
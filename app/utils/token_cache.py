@@ -0,0 +1,73 @@
+from collections import OrderedDict
+import hashlib
+import threading
+import time
+
+
+class TokenCache:
+    """Cache LRU de tokens JWT já verificados.
+
+    A chave é um hash do token (o token em si não fica em memória) e cada
+    entrada expira no 'exp' do próprio token, de modo que um token vencido
+    nunca é aceito pelo cache. O cache não revoga nada: o JWT continua válido
+    em qualquer worker até o 'exp', limitado por ACCESS_TOKEN_LIFETIME; o
+    logout revoga o refresh token, que impede a emissão de novos tokens.
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.max_entries = app.config['TOKEN_CACHE_MAX_ENTRIES']
+        self.clear()
+
+    @staticmethod
+    def key(token):
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token):
+        """Retorna o user_id de um token verificado e ainda válido, ou None"""
+        key = self.key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, token, user_id, expires_at):
+        if self.max_entries <= 0:
+            return
+
+        key = self.key(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,104 @@
+from app.utils.cpf import normalize_cpf
+
+
+def validate_address(address):
+    """Valida a estrutura do endereço JSON"""
+    if not isinstance(address, dict):
+        return False
+    
+    valid_fields = {'street', 'number', 'neighborhood', 'city', 'complement', 'zip_code'}
+    
+    for field in address.keys():
+        if field not in valid_fields:
+            return False
+    
+    for key, value in address.items():
+        if value is not None and not isinstance(value, str):
+            return False
+    
+    return True
+
+
+# Limite de CPFs por requisição na verificação em lote
+MAX_BATCH_CPFS = 5000
+
+
+def parse_employee_payload(data):
+    """Valida o corpo do cadastro de funcionário.
+
+    Retorna (argumentos de create_employee_with_documents, erro).
+    """
+    if not data or not isinstance(data, dict):
+        return None, 'Dados não fornecidos'
+
+    fields = {
+        'cpf': data.get('cpf'),
+        'employee_name': data.get('employee_name'),
+        'company_name': data.get('company_name'),
+        'documents': data.get('documents') or [],
+        'address': data.get('address'),
+        'phone': data.get('phone'),
+        'emergency_phone': data.get('emergency_phone')
+    }
+
+    # Validar campos obrigatórios
+    if not all([fields['cpf'], fields['company_name'], fields['employee_name']]):
+        return None, 'Campos obrigatórios: cpf, company_name, employee_name'
+
+    # Tipos e tamanhos das colunas conferidos aqui, não no INSERT
+    for field in ('employee_name', 'company_name'):
+        if not isinstance(fields[field], str) or len(fields[field]) > 255:
+            return None, f'Campo {field} deve ser um texto não vazio de até 255 caracteres'
+
+    for field in ('phone', 'emergency_phone'):
+        if fields[field] is not None and (not isinstance(fields[field], str) or len(fields[field]) > 20):
+            return None, f'Campo {field} deve ser um texto de até 20 caracteres'
+
+    if not isinstance(fields['documents'], list):
+        return None, 'Campo documents deve ser uma lista'
+
+    # Dígitos verificadores conferidos antes de qualquer acesso ao banco
+    fields['cpf'] = normalize_cpf(fields['cpf'])
+    if fields['cpf'] is None:
+        return None, 'CPF inválido'
+
+    # Validar endereço se fornecido
+    if fields['address'] and not validate_address(fields['address']):
+        return None, 'Formato de endereço inválido'
+
+    return fields, None
+
+
+def parse_cpf_batch(data):
+    """Valida o corpo da verificação em lote.
+
+    Retorna ({CPF informado: chave canônica ou None se inválido}, erro),
+    na ordem de entrada e sem repetições.
+    """
+    cpfs = data.get('cpfs') if isinstance(data, dict) else None
+
+    if not isinstance(cpfs, list) or not cpfs:
+        return None, 'Campo cpfs deve ser uma lista não vazia'
+    if len(cpfs) > MAX_BATCH_CPFS:
+        return None, f'Máximo de {MAX_BATCH_CPFS} CPFs por requisição'
+    if not all(isinstance(cpf, str) and cpf for cpf in cpfs):
+        return None, 'Todos os CPFs devem ser textos não vazios'
+
+    return {cpf: normalize_cpf(cpf) for cpf in cpfs}, None
+
+
+def validate_new_user(email, password):
+    """Valida email e senha do cadastro de usuário; retorna a mensagem de erro ou None"""
+    # Validar campos obrigatórios
+    if not email or not password:
+        return 'Email e senha são obrigatórios'
+
+    # Validar formato do email
+    if '@' not in email or '.' not in email:
+        return 'Formato de email inválido'
+
+    # Validar tamanho da senha
+    if len(password) < 6:
+        return 'Senha deve ter pelo menos 6 caracteres'
+
+    return None
@@ -0,0 +1,89 @@
+"""Compara o modo síncrono (gunicorn) com o assíncrono (uvicorn) sob alta concorrência.
+
+Suba as duas aplicações apontando para o mesmo banco:
+
+    gunicorn run:app --workers 2 --bind 0.0.0.0:5000
+    uvicorn asgi:app --workers 2 --port 8000
+
+e execute:
+
+    python benchmarks/async_vs_sync.py --token <JWT> --concurrency 200 --requests 5000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+
+TARGETS = {
+    'sync': 'http://localhost:5000',
+    'async': 'http://localhost:8000'
+}
+
+PATHS = [
+    '/employee/list?limit=50',
+    '/employee/search?q=silva',
+    '/employee/check_register/52998224725'
+]
+
+
+async def run_target(base_url, token, concurrency, total):
+    """Dispara total requisições com até concurrency simultâneas; retorna (latências, erros, duração)"""
+    headers = {'Authorization': f'Bearer {token}'}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            for i in counter:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(PATHS[i % len(PATHS)])
+                    if response.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return latencies, errors, elapsed
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def report(name, latencies, errors, elapsed):
+    print(
+        f'{name:>6}: {len(latencies) / elapsed:8.1f} req/s | '
+        f'p50 {percentile(latencies, 0.50) * 1000:7.1f} ms | '
+        f'p95 {percentile(latencies, 0.95) * 1000:7.1f} ms | '
+        f'p99 {percentile(latencies, 0.99) * 1000:7.1f} ms | '
+        f'média {statistics.mean(latencies) * 1000:7.1f} ms | erros {errors}'
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--token', required=True, help='JWT obtido em /auth/login')
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--sync-url', default=TARGETS['sync'])
+    parser.add_argument('--async-url', default=TARGETS['async'])
+    args = parser.parse_args()
+
+    for name, base_url in (('sync', args.sync_url), ('async', args.async_url)):
+        # Aquecimento: conexões, cache de versão dos dados e filtro de CPFs
+        await run_target(base_url, args.token, min(args.concurrency, 10), 50)
+        report(name, *await run_target(base_url, args.token, args.concurrency, args.requests))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""Latência de requisições com logging em INFO: escrita síncrona x fila x fila com amostragem.
+
+Usa um banco SQLite temporário e o test client do Flask, sem servidor:
+
+    python benchmarks/logging_overhead.py --requests 5000
+    python benchmarks/logging_overhead.py --requests 5000 --sink-latency-us 200
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+workdir = tempfile.mkdtemp()
+os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(workdir, "bench.db")}')
+os.environ.setdefault('SCHEMA_CHECK_MODE', 'upgrade')
+os.environ.setdefault('DOCUMENT_STATUS_SCHEDULER_ENABLED', 'false')
+
+from app import create_app
+from app.utils import log
+from app.utils.auth import create_access_token
+
+PATH = '/employee/check_register/52998224725'
+
+
+class SlowStream:
+    """Saída com latência fixa por escrita (pipe para um coletor de logs, disco de rede)"""
+
+    def __init__(self, stream, latency):
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, data):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(data)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def use_sync_handler(output):
+    """Pipeline anterior: formatação e escrita na thread da requisição"""
+    root = logging.getLogger()
+    log._listener.stop()
+    log._listener = None
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(output)
+    handler.setFormatter(log.JsonFormatter())
+    root.addHandler(handler)
+
+
+def measure(client, headers, total):
+    latencies = []
+    for _ in range(total):
+        start = time.perf_counter()
+        client.get(PATH, headers=headers)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name, latencies):
+    ordered = sorted(latencies)
+    print(
+        f'{name:>16}: média {statistics.mean(latencies) * 1e6:7.0f} us | '
+        f'p50 {ordered[len(ordered) // 2] * 1e6:7.0f} us | '
+        f'p99 {ordered[int(len(ordered) * 0.99)] * 1e6:7.0f} us'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--sink-latency-us', type=int, default=0, help='latência simulada de cada escrita de log')
+    args = parser.parse_args()
+
+    # Saída dos logs em arquivo, como em produção; o terminal mostra só o resultado
+    output = SlowStream(open(os.path.join(workdir, 'app.log'), 'w'), args.sink_latency_us / 1e6)
+    stderr, sys.stderr = sys.stderr, output
+    app = create_app()
+    headers = {'Authorization': f'Bearer {create_access_token("7f4bd5a2-2b9e-4a5e-9d0e-5b2a1f3c4d6e")}'}
+    client = app.test_client()
+    measure(client, headers, 200)
+
+    scenarios = [
+        ('fila', {}),
+        ('fila + amostra', {'LOG_SAMPLE_RATES': 'routes.checkRegister=0.01'}),
+        ('síncrono', None)
+    ]
+    results = []
+    for name, overrides in scenarios:
+        if overrides is None:
+            use_sync_handler(output)
+        else:
+            app.config.update({'LOG_SAMPLE_RATES': ''}, **overrides)
+            log.configure_logging(app)
+        results.append((name, measure(client, headers, args.requests)))
+
+    sys.stderr = stderr
+    for name, latencies in results:
+        report(name, latencies)
+
+
+if __name__ == '__main__':
+    main()
@@ -18,5 +18,70 @@ class Config:
     # Chave secreta - IMPORTANTE: definir no Render
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     
+    # Validade (segundos) do token de acesso e do refresh token que o renova sem nova senha
+    ACCESS_TOKEN_LIFETIME = int(os.getenv('ACCESS_TOKEN_LIFETIME', '900'))
+    REFRESH_TOKEN_LIFETIME = int(os.getenv('REFRESH_TOKEN_LIFETIME', str(30 * 24 * 3600)))
+    
+    # Threads que calculam hashes de senha e verificações aguardando vaga (além disso, 503)
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '16'))
+    
+    # Tokens JWT já verificados mantidos em memória por processo (0 desativa)
+    TOKEN_CACHE_MAX_ENTRIES = int(os.getenv('TOKEN_CACHE_MAX_ENTRIES', '10000'))
+    
+    # Verificação do schema no boot: 'revision' (uma consulta), 'upgrade' (aplica migrations) ou 'skip'
+    SCHEMA_CHECK_MODE = os.getenv('SCHEMA_CHECK_MODE', 'revision').lower()
+    
+    # Thread que atualiza o status materializado dos documentos nas datas de transição
+    # (no PostgreSQL, um advisory lock garante que só um worker a execute)
+    DOCUMENT_STATUS_SCHEDULER_ENABLED = os.getenv('DOCUMENT_STATUS_SCHEDULER_ENABLED', 'true').lower() == 'true'
+    
+    # Cache em memória das respostas da listagem de funcionários
+    LIST_CACHE_MAX_ENTRIES = int(os.getenv('LIST_CACHE_MAX_ENTRIES', '256'))
+    LIST_CACHE_TTL = int(os.getenv('LIST_CACHE_TTL', '300'))
+    
+    # Segundos em que a versão dos dados lida do banco é reaproveitada pelo processo
+    DATA_VERSION_MAX_AGE = float(os.getenv('DATA_VERSION_MAX_AGE', '1'))
+    
+    # Filtro de Bloom com os CPFs cadastrados, consultado antes do banco na verificação de CPF.
+    # Cadastros feitos em outro worker (ou direto no banco sem incrementar o contador employee_cpfs)
+    # só invalidam o filtro quando a versão é relida: um "CPF disponível" pode ficar desatualizado por
+    # até DATA_VERSION_MAX_AGE segundos; o cadastro em si continua barrado pela constraint única.
+    CPF_FILTER_ENABLED = os.getenv('CPF_FILTER_ENABLED', 'true').lower() == 'true'
+    CPF_FILTER_WARM_ON_START = os.getenv('CPF_FILTER_WARM_ON_START', 'true').lower() == 'true'
+    CPF_FILTER_ERROR_RATE = float(os.getenv('CPF_FILTER_ERROR_RATE', '0.001'))
+    # Cadastros de outros workers entram no filtro de forma incremental, pelo created_at. A folga (segundos)
+    # deve cobrir o tempo entre montar a linha e o commit (lotes de importação) e a diferença de relógio entre workers
+    CPF_FILTER_CATCH_UP_OVERLAP = int(os.getenv('CPF_FILTER_CATCH_UP_OVERLAP', '300'))
+    
+    # Respostas gravadas por Idempotency-Key: validade e tempo até uma reserva abandonada ser liberada
+    IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', '86400'))
+    IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv('IDEMPOTENCY_LOCK_TIMEOUT', '60'))
+    
+    # Modo ASGI (uvicorn asgi:app): pool do engine asyncio e threads que atendem as rotas do Flask
+    ASYNC_DB_POOL_SIZE = int(os.getenv('ASYNC_DB_POOL_SIZE', '20'))
+    ASYNC_DB_MAX_OVERFLOW = int(os.getenv('ASYNC_DB_MAX_OVERFLOW', '10'))
+    ASGI_WSGI_THREADS = int(os.getenv('ASGI_WSGI_THREADS', '10'))
+    
+    # Emails (separados por vírgula) com acesso às rotas /admin; vazio bloqueia todas
+    ADMIN_EMAILS = frozenset(
+        email.strip().lower() for email in os.getenv('ADMIN_EMAILS', '').split(',') if email.strip()
+    )
+    
+    # Perfil por endpoint (tempo, SQL, serialização, tamanho) e header Server-Timing; desligado não tem custo
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+    PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '1'))
+    
+    # Desenvolvimento: avisa no log quando a mesma consulta roda THRESHOLD vezes ou mais em uma requisição (N+1)
+    QUERY_DETECTOR_ENABLED = os.getenv('QUERY_DETECTOR_ENABLED', 'false').lower() == 'true'
+    QUERY_DETECTOR_THRESHOLD = int(os.getenv('QUERY_DETECTOR_THRESHOLD', '5'))
+    
     # Configurações de logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()
+    # Registros aguardando a thread de escrita; com a fila cheia são descartados
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    # Amostragem de logs INFO por rota, ex.: 'routes.checkRegister=0.01,routes.list=0.1'
+    LOG_SAMPLE_RATES = os.getenv('LOG_SAMPLE_RATES', '')
+    # Máximo de logs INFO por segundo em cada rota (0 = sem limite)
+    LOG_INFO_RATE_LIMIT = int(os.getenv('LOG_INFO_RATE_LIMIT', '0'))
@@ -10,23 +10,9 @@ while ! nc -z db 5432; do
 done
 echo "✅ Banco de dados disponível!"
 
-# Executar migrations
+# Etapa de release: aplica as migrations uma única vez, antes de subir o servidor
 echo "🔄 Executando migrations..."
-
-# Inicializar migrations se não existir
-if [ ! -d "migrations" ]; then
-    echo "📁 Inicializando migrations..."
-    flask db init
-fi
-
-# Gerar e aplicar migrations
-echo "📝 Gerando migrations..."
-flask db migrate -m "Auto migration" || echo "⚠️  Nenhuma mudança detectada"
-
-echo "⬆️  Aplicando migrations..."
-flask db upgrade
-
-echo "✅ Migrations concluídas!"
+python manage.py release || exit 1
 
 # Iniciar aplicação
 echo "🌟 Iniciando servidor Flask..."
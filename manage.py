@@ -5,11 +5,22 @@ Usado para executar migrations e outras tarefas administrativas
 """
 
 import os
+import click
+
+# Comandos administrativos não precisam da verificação de schema do boot nem das
+# threads de segundo plano (agendador de status e filtro de CPFs), que leriam e
+# atualizariam as tabelas enquanto as migrations são aplicadas
+os.environ.setdefault('SCHEMA_CHECK_MODE', 'skip')
+os.environ.setdefault('DOCUMENT_STATUS_SCHEDULER_ENABLED', 'false')
+os.environ.setdefault('CPF_FILTER_WARM_ON_START', 'false')
+
 from flask.cli import FlaskGroup
 from app import create_app, db
 from app.models.user import User
 from app.models.employee import Employee
 from app.models.document import Document
+from app.services.data_version_service import EMPLOYEE_CPFS, bump_data_version
+from app.utils.cpf import normalize_cpf
 
 app = create_app()
 cli = FlaskGroup(app)
@@ -27,6 +38,69 @@ def reset_db():
     db.create_all()
     print("✅ Banco de dados resetado!")
 
+@cli.command("release")
+def release():
+    """Etapa de release: aplica as migrations e confirma a revisão do banco (uma vez por deploy)"""
+    from app.services.schema_service import release_schema
+    ok, details = release_schema()
+    if not ok:
+        print(f"❌ Banco na revisão {details['applied']}, esperado {details['expected']}")
+        raise SystemExit(1)
+    print(f"✅ Banco na revisão {', '.join(details['applied'])}!")
+
+@cli.command("refresh-document-status")
+def refresh_document_status():
+    """Atualiza o status dos documentos dos funcionários com transição vencida"""
+    from app.services.document_status_service import refresh_due_document_status
+    updated = refresh_due_document_status()
+    print(f"✅ Status atualizado para {updated} funcionários!")
+
+@cli.command("purge-idempotency-keys")
+def purge_idempotency_keys():
+    """Remove as respostas gravadas por Idempotency-Key já expiradas"""
+    from app.services.idempotency_service import purge_expired_idempotency_keys
+    removed = purge_expired_idempotency_keys()
+    print(f"✅ {removed} chaves de idempotência removidas!")
+
+@cli.command("purge-refresh-tokens")
+def purge_refresh_tokens():
+    """Remove os refresh tokens vencidos"""
+    from app.services.refresh_token_service import purge_expired_refresh_tokens
+    removed = purge_expired_refresh_tokens()
+    print(f"✅ {removed} refresh tokens removidos!")
+
+@cli.command("import-employees")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+def import_employees_command(path):
+    """Importa funcionários de um arquivo CSV ou JSONL"""
+    from app.services.import_service import import_employees, read_csv_records, read_jsonl_records
+
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            summary = import_employees(read_csv_records(f))
+        else:
+            summary = import_employees(read_jsonl_records(f))
+
+    for error in summary['errors']:
+        print(f"⚠️  Linha {error['line']}: {error['message']}")
+    print(f"✅ {summary['imported']} funcionários importados, {summary['error_count']} erros")
+
+@cli.command("export-employees")
+@click.argument("path", required=False, type=click.Path(dir_okay=False, writable=True))
+def export_employees_command(path):
+    """Exporta funcionários e documentos em CSV (arquivo ou saída padrão)"""
+    import sys
+    from app.services.employee_service import iter_employee_documents, EXPORT_HEADER
+    from app.utils.streaming import csv_stream
+
+    output = open(path, 'w', encoding='utf-8', newline='') if path else sys.stdout
+    try:
+        for chunk in csv_stream(EXPORT_HEADER, iter_employee_documents()):
+            output.write(chunk)
+    finally:
+        if path:
+            output.close()
+
 @cli.command("seed-db")
 def seed_db():
     """Popula o banco com dados de exemplo"""
@@ -37,12 +111,15 @@ def seed_db():
     
     # Criar funcionário de exemplo
     employee = Employee(
-        cpf="123.456.789-00",
+        cpf=normalize_cpf("123.456.789-09"),
         employee_name="João Silva",
         company_name="Empresa Exemplo"
     )
     db.session.add(employee)
     
+    # Workers em execução descartam o cache da listagem e reconstroem o filtro de CPFs
+    bump_data_version()
+    bump_data_version(EMPLOYEE_CPFS)
     db.session.commit()
     print("✅ Dados de exemplo inseridos!")
 
@@ -0,0 +1,45 @@
+"""Add employee trigram search index
+
+Revision ID: 40cf207a1ecd
+Revises: 71267c401860
+Create Date: 2026-10-18 12:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '40cf207a1ecd'
+down_revision = '71267c401860'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # pg_trgm/unaccent só existem no PostgreSQL; nos demais bancos a busca usa LIKE
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+
+    # unaccent() é STABLE; o wrapper IMMUTABLE permite usá-lo em índice de expressão
+    op.execute("""
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text AS $$
+            SELECT public.unaccent('public.unaccent', $1)
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """)
+
+    op.execute("""
+        CREATE INDEX ix_employees_search_trgm ON employees
+        USING gin (immutable_unaccent(lower(employee_name || ' ' || company_name || ' ' || cpf)) gin_trgm_ops)
+    """)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_employees_search_trgm')
+    op.execute('DROP FUNCTION IF EXISTS immutable_unaccent(text)')
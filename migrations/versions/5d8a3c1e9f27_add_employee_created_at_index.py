@@ -0,0 +1,27 @@
+"""Add employee created_at index
+
+Revision ID: 5d8a3c1e9f27
+Revises: bdc5cbcd730e
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8a3c1e9f27'
+down_revision = 'bdc5cbcd730e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Atualização incremental do filtro de CPFs: só os funcionários criados desde a última leitura
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_employees_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_employees_created_at'))
@@ -0,0 +1,62 @@
+"""Add materialized document status to Employee
+
+Revision ID: 71267c401860
+Revises: e68e761822a7
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from datetime import date, datetime, timedelta
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '71267c401860'
+down_revision = 'e68e761822a7'
+branch_labels = None
+depends_on = None
+
+EXPIRING_WINDOW_DAYS = 30
+
+
+def upgrade():
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('document_status', sa.String(length=10), server_default='valid', nullable=False))
+        batch_op.add_column(sa.Column('next_status_change_at', sa.Date(), nullable=True))
+        batch_op.create_index('ix_employees_document_status_name_id', ['document_status', 'employee_name', 'id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_employees_next_status_change_at'), ['next_status_change_at'], unique=False)
+
+    # Preencher o status a partir do vencimento mais próximo de cada funcionário
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        'SELECT employee_id, MIN(expiration_date) FROM documents GROUP BY employee_id'
+    )).all()
+
+    # Mesmo "hoje" (UTC) de compute_document_status no app
+    today = datetime.utcnow().date()
+    changes = []
+    for employee_id, first_expiration in rows:
+        if isinstance(first_expiration, str):
+            first_expiration = date.fromisoformat(first_expiration)
+
+        if first_expiration < today:
+            status, next_change = 'expired', None
+        elif first_expiration <= today + timedelta(days=EXPIRING_WINDOW_DAYS):
+            status, next_change = 'expiring', first_expiration + timedelta(days=1)
+        else:
+            status, next_change = 'valid', first_expiration - timedelta(days=EXPIRING_WINDOW_DAYS)
+
+        changes.append({'id': employee_id, 'status': status, 'next_change': next_change})
+
+    if changes:
+        connection.execute(sa.text(
+            'UPDATE employees SET document_status = :status, next_status_change_at = :next_change WHERE id = :id'
+        ), changes)
+
+
+def downgrade():
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_employees_next_status_change_at'))
+        batch_op.drop_index('ix_employees_document_status_name_id')
+        batch_op.drop_column('next_status_change_at')
+        batch_op.drop_column('document_status')
@@ -0,0 +1,27 @@
+"""Add employee name keyset index
+
+Revision ID: 9653a7185f9d
+Revises: 42695d6fc514, b1234567890a
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9653a7185f9d'
+down_revision = ('42695d6fc514', 'b1234567890a')
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Também une os dois heads existentes (telefones e tipo do endereço)
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.create_index('ix_employees_employee_name_id', ['employee_name', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.drop_index('ix_employees_employee_name_id')
@@ -0,0 +1,93 @@
+"""Store employee CPF as canonical BIGINT
+
+Revision ID: a68b18b5e911
+Revises: e8e58af490d9
+Create Date: 2026-10-18 16:30:00.000000
+
+"""
+import re
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a68b18b5e911'
+down_revision = 'e8e58af490d9'
+branch_labels = None
+depends_on = None
+
+SEARCH_INDEX = """
+    CREATE INDEX ix_employees_search_trgm ON employees
+    USING gin (immutable_unaccent(lower(employee_name || ' ' || company_name || ' ' || {cpf})) gin_trgm_ops)
+"""
+
+
+def _has_search_function(connection):
+    return connection.execute(sa.text(
+        "SELECT 1 FROM pg_proc WHERE proname = 'immutable_unaccent'"
+    )).first() is not None
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    # Conferir os dados antes de alterar o tipo: CPFs sem 11 dígitos ou variantes
+    # formatadas do mesmo CPF precisam ser corrigidos manualmente
+    rows = connection.execute(sa.text('SELECT id, cpf FROM employees')).all()
+    canonical = {}
+    invalid = []
+    for employee_id, cpf in rows:
+        digits = re.sub(r'\D', '', cpf or '')
+        if len(digits) != 11:
+            invalid.append(cpf)
+        else:
+            canonical.setdefault(digits, []).append((employee_id, cpf))
+
+    duplicates = [cpfs for cpfs in canonical.values() if len(cpfs) > 1]
+    if invalid or duplicates:
+        raise RuntimeError(
+            'Não é possível converter employees.cpf para BIGINT. '
+            f'CPFs sem 11 dígitos: {invalid[:20]}; '
+            f'CPFs duplicados após normalização: {[[cpf for _, cpf in cpfs] for cpfs in duplicates[:20]]}'
+        )
+
+    if connection.dialect.name == 'postgresql':
+        # O índice de busca depende do texto do CPF: recriado com o CPF preenchido com zeros
+        op.execute('DROP INDEX IF EXISTS ix_employees_search_trgm')
+        op.execute(r"ALTER TABLE employees ALTER COLUMN cpf TYPE BIGINT USING regexp_replace(cpf, '\D', '', 'g')::bigint")
+        if _has_search_function(connection):
+            op.execute(SEARCH_INDEX.format(cpf="lpad(CAST(cpf AS TEXT), 11, '0')"))
+        return
+
+    changes = [{'id': employee_id, 'cpf': int(digits)} for digits, cpfs in canonical.items() for employee_id, _ in cpfs]
+    if changes:
+        connection.execute(sa.text('UPDATE employees SET cpf = :cpf WHERE id = :id'), changes)
+
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.alter_column('cpf', existing_type=sa.String(length=14), type_=sa.BigInteger(), existing_nullable=False)
+
+
+def downgrade():
+    connection = op.get_bind()
+
+    if connection.dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_employees_search_trgm')
+        op.execute(
+            "ALTER TABLE employees ALTER COLUMN cpf TYPE VARCHAR(14) USING "
+            r"regexp_replace(lpad(cpf::text, 11, '0'), '^(\d{3})(\d{3})(\d{3})(\d{2})$', '\1.\2.\3-\4')"
+        )
+        if _has_search_function(connection):
+            op.execute(SEARCH_INDEX.format(cpf='cpf'))
+        return
+
+    rows = connection.execute(sa.text('SELECT id, cpf FROM employees')).all()
+
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.alter_column('cpf', existing_type=sa.BigInteger(), type_=sa.String(length=14), existing_nullable=False)
+
+    changes = []
+    for employee_id, cpf in rows:
+        digits = f'{int(cpf):011d}'
+        changes.append({'id': employee_id, 'cpf': f'{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}'})
+    if changes:
+        connection.execute(sa.text('UPDATE employees SET cpf = :cpf WHERE id = :id'), changes)
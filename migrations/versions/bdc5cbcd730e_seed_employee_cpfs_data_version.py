@@ -0,0 +1,30 @@
+"""Seed employee_cpfs data version
+
+Revision ID: bdc5cbcd730e
+Revises: 4f5f63662b7f
+Create Date: 2026-10-18 19:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'bdc5cbcd730e'
+down_revision = '4f5f63662b7f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Bases em uso podem já ter a linha, criada no primeiro cadastro
+    op.execute(
+        "INSERT INTO data_versions (name, version) "
+        "SELECT 'employee_cpfs', 0 "
+        "WHERE NOT EXISTS (SELECT 1 FROM data_versions WHERE name = 'employee_cpfs')"
+    )
+
+
+def downgrade():
+    # A linha é mantida: sem ela o contador voltaria a ser criado pela aplicação
+    pass
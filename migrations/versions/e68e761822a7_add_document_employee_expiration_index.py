@@ -0,0 +1,26 @@
+"""Add document employee/expiration index
+
+Revision ID: e68e761822a7
+Revises: 9653a7185f9d
+Create Date: 2026-10-18 10:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e68e761822a7'
+down_revision = '9653a7185f9d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.create_index('ix_documents_employee_id_expiration_date', ['employee_id', 'expiration_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.drop_index('ix_documents_employee_id_expiration_date')
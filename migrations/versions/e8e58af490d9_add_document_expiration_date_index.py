@@ -0,0 +1,26 @@
+"""Add document expiration date index
+
+Revision ID: e8e58af490d9
+Revises: 3731e561e178
+Create Date: 2026-10-18 14:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8e58af490d9'
+down_revision = '3731e561e178'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.create_index('ix_documents_expiration_date_id', ['expiration_date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.drop_index('ix_documents_expiration_date_id')
@@ -9,7 +9,24 @@ def run_tests():
     test_files = [
         'tests/test_models.py',
         'tests/test_services.py', 
-        'tests/test_utils.py'
+        'tests/test_utils.py',
+        'tests/test_pagination.py',
+        'tests/test_response_cache.py',
+        'tests/test_bloom.py',
+        'tests/test_cpf.py',
+        'tests/test_idempotency.py',
+        'tests/test_merge_patch.py',
+        'tests/test_schema.py',
+        'tests/test_token_cache.py',
+        'tests/test_log.py',
+        'tests/test_auth_tokens.py',
+        'tests/test_histogram.py',
+        'tests/test_query_budget.py',
+        'tests/test_admin.py',
+        'tests/test_list_etag.py',
+        'tests/test_import.py',
+        'tests/test_employee_patch.py',
+        'tests/test_asgi.py'
     ]
     
     print("🧪 Executando todos os testes...\n")
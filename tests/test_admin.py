@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Testes do acesso às rotas administrativas."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+
+ADMIN = {'email': 'admin@example.com', 'password': 'senha-admin'}
+USER = {'email': 'usuario@example.com', 'password': 'senha-usuario'}
+
+
+class TestAdminRoutes(unittest.TestCase):
+    """Métricas acessíveis apenas aos emails de ADMIN_EMAILS."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "admin.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'ADMIN_EMAILS': frozenset({ADMIN['email']}),
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+        cls.client = cls.app.test_client()
+        cls.headers = {}
+        for name, credentials in (('admin', ADMIN), ('user', USER)):
+            cls.client.post('/auth/register', json=credentials)
+            token = cls.client.post('/auth/login', json=credentials).get_json()['token']
+            cls.headers[name] = {'Authorization': f'Bearer {token}'}
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def test_admin_reads_and_resets_metrics(self):
+        """Teste acesso do administrador às métricas."""
+        headers = self.headers['admin']
+        self.assertEqual(self.client.get('/admin/metrics', headers=headers).status_code, 200)
+        self.assertEqual(self.client.get('/admin/metrics/endpoints', headers=headers).status_code, 200)
+        self.assertEqual(self.client.delete('/admin/metrics/endpoints', headers=headers).status_code, 200)
+
+    def test_regular_user_is_forbidden(self):
+        """Teste que um usuário autenticado sem permissão recebe 403."""
+        headers = self.headers['user']
+        self.assertEqual(self.client.get('/admin/metrics', headers=headers).status_code, 403)
+        self.assertEqual(self.client.get('/admin/metrics/endpoints', headers=headers).status_code, 403)
+        self.assertEqual(self.client.delete('/admin/metrics/endpoints', headers=headers).status_code, 403)
+
+    def test_anonymous_is_unauthorized(self):
+        """Teste que sem token a resposta continua 401."""
+        self.assertEqual(self.client.delete('/admin/metrics/endpoints').status_code, 401)
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes das rotas administrativas...")
+    unittest.main(verbosity=2)
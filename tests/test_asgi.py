@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Testes das rotas assíncronas (Starlette + SQLAlchemy asyncio) do modo ASGI."""
+
+import unittest
+import sys
+import os
+import tempfile
+import uuid
+from importlib.util import find_spec
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.utils.auth import create_access_token
+
+# Dependências de requirements-async.txt
+ASYNC_INSTALLED = all(find_spec(module) for module in ('starlette', 'a2wsgi', 'aiosqlite', 'httpx'))
+
+if ASYNC_INSTALLED:
+    from starlette.testclient import TestClient
+    from app.asgi import AsyncDispatcher, create_asgi_app
+
+EMPLOYEE = {
+    'cpf': '529.982.247-25',
+    'employee_name': 'Ana',
+    'company_name': 'ACME',
+    'documents': [{'name': 'ASO', 'expiration_date': '2030-01-01'}]
+}
+
+
+def http_scope(method, path, query_string=b'', headers=()):
+    return {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'root_path': '',
+        'query_string': query_string,
+        'headers': [(name.lower().encode(), value.encode()) for name, value in headers]
+    }
+
+
+@unittest.skipUnless(ASYNC_INSTALLED, 'requirements-async.txt não instalado')
+class TestAsgiRoutes(unittest.TestCase):
+    """Rotas assíncronas contra SQLite (aiosqlite), com o lifespan do Starlette."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.flask_app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "asgi.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'DATA_VERSION_MAX_AGE': 0,
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.flask_app.app_context():
+            db.create_all()
+
+        # O lifespan descarta o engine assíncrono ao sair; sem ele o processo não termina
+        cls.client = TestClient(create_asgi_app(cls.flask_app))
+        cls.client.__enter__()
+        cls.headers = {'Authorization': f'Bearer {create_access_token(uuid.uuid4())}'}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+        with cls.flask_app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def tearDown(self):
+        with self.flask_app.app_context():
+            for table in reversed(db.metadata.sorted_tables):
+                db.session.execute(table.delete())
+            db.session.commit()
+
+    def create(self, body=EMPLOYEE, **headers):
+        return self.client.post('/employee/register_employee', json=body, headers={**self.headers, **headers})
+
+    def test_register_and_login(self):
+        """Teste cadastro de usuário e login com par de tokens."""
+        credentials = {'email': 'ana@example.com', 'password': 'senha-segura'}
+        self.assertEqual(self.client.post('/auth/register', json=credentials).status_code, 201)
+        self.assertEqual(self.client.post('/auth/register', json=credentials).status_code, 400)
+
+        response = self.client.post('/auth/login', json=credentials)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('token', response.json())
+
+        wrong = self.client.post('/auth/login', json={**credentials, 'password': 'outra-senha'})
+        self.assertEqual(wrong.status_code, 401)
+
+    def test_requires_token(self):
+        """Teste 401 sem o cabeçalho Authorization."""
+        self.assertEqual(self.client.get('/employee/list').status_code, 401)
+
+    def test_create_employee(self):
+        """Teste cadastro, CPF repetido e corpo que não é JSON."""
+        self.assertEqual(self.create().status_code, 201)
+        self.assertEqual(self.create().json()['message'], 'CPF já cadastrado')
+        response = self.client.post('/employee/register_employee', content='cpf', headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_etag(self):
+        """Teste ETag igual ao do Flask, 304 e novo ETag após um cadastro."""
+        self.create()
+        response = self.client.get('/employee/list', headers=self.headers)
+        etag = response.headers['ETag']
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Accept', response.headers['Vary'])
+        self.assertEqual([item['employee_name'] for item in response.json()['items']], ['Ana'])
+        with self.flask_app.test_client() as flask_client:
+            self.assertEqual(flask_client.get('/employee/list', headers=self.headers).headers['ETag'], etag)
+
+        unchanged = self.client.get('/employee/list', headers={**self.headers, 'If-None-Match': etag})
+        self.assertEqual(unchanged.status_code, 304)
+
+        self.create({**EMPLOYEE, 'cpf': '111.444.777-35'})
+        self.assertNotEqual(self.client.get('/employee/list', headers=self.headers).headers['ETag'], etag)
+
+    def test_list_invalid_parameters(self):
+        """Teste 400 para cursor e status inválidos."""
+        self.assertEqual(self.client.get('/employee/list?cursor=x', headers=self.headers).status_code, 400)
+        self.assertEqual(self.client.get('/employee/list?status=outro', headers=self.headers).status_code, 400)
+
+    def test_search(self):
+        """Teste busca por nome e termo curto."""
+        self.create()
+        response = self.client.get('/employee/search?q=An', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['items']), 1)
+        self.assertEqual(self.client.get('/employee/search?q=A', headers=self.headers).status_code, 400)
+
+    def test_check_register(self):
+        """Teste CPF cadastrado, disponível e inválido, individual e em lote."""
+        self.create()
+        self.assertEqual(self.client.get('/employee/check_register/52998224725', headers=self.headers).status_code, 409)
+        self.assertEqual(self.client.get('/employee/check_register/12345678909', headers=self.headers).status_code, 200)
+        self.assertEqual(self.client.get('/employee/check_register/123', headers=self.headers).status_code, 400)
+
+        response = self.client.post('/employee/check_register/batch', json={
+            'cpfs': ['529.982.247-25', '123.456.789-09', 'x']
+        }, headers=self.headers)
+        self.assertEqual(response.json(), {
+            'taken': ['529.982.247-25'], 'available': ['123.456.789-09'], 'invalid': ['x']
+        })
+
+    def test_detail_etag(self):
+        """Teste detalhe com ETag, 304 e 404 para id inexistente."""
+        employee_id = self.create().json()['employeeId']
+        response = self.client.get(f'/employee/{employee_id}', headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['employee_name'], 'Ana')
+        unchanged = self.client.get(f'/employee/{employee_id}', headers={**self.headers, 'If-None-Match': response.headers['ETag']})
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(self.client.get(f'/employee/{uuid.uuid4()}', headers=self.headers).status_code, 404)
+
+    def test_idempotency_key_falls_through_to_flask(self):
+        """Teste que o cadastro com Idempotency-Key é atendido pelo @idempotent do Flask."""
+        first = self.create(**{'Idempotency-Key': 'cadastro'})
+        replay = self.create(**{'Idempotency-Key': 'cadastro'})
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(replay.headers['Idempotent-Replayed'], 'true')
+        self.assertEqual(replay.json()['employeeId'], first.json()['employeeId'])
+
+    def test_streaming_falls_through_to_flask(self):
+        """Teste que NDJSON e stream=1 são atendidos pelo Flask."""
+        self.create()
+        ndjson = self.client.get('/employee/list', headers={**self.headers, 'Accept': 'application/x-ndjson'})
+        self.assertEqual(ndjson.headers['Content-Type'], 'application/x-ndjson')
+        self.assertTrue(ndjson.headers['ETag'].endswith('-ndjson"'))
+
+        stream = self.client.get('/employee/list?stream=1', headers=self.headers)
+        self.assertEqual(stream.status_code, 200)
+        self.assertIsInstance(stream.json(), list)
+
+
+@unittest.skipUnless(ASYNC_INSTALLED, 'requirements-async.txt não instalado')
+class TestAsyncDispatcher(unittest.TestCase):
+    """Escolha entre as rotas assíncronas e o Flask (sync_when)."""
+
+    def assert_async(self, expected, *args, **kwargs):
+        self.assertEqual(AsyncDispatcher._is_async(http_scope(*args, **kwargs)), expected)
+
+    def test_async_routes(self):
+        """Teste rotas atendidas pelo Starlette."""
+        self.assert_async(True, 'GET', '/employee/list')
+        self.assert_async(True, 'POST', '/employee/register_employee')
+        self.assert_async(True, 'GET', f'/employee/{uuid.uuid4()}')
+
+    def test_flask_routes(self):
+        """Teste Idempotency-Key, streaming e rotas sem versão assíncrona seguem para o Flask."""
+        self.assert_async(False, 'POST', '/employee/register_employee', headers=[('Idempotency-Key', 'k1')])
+        self.assert_async(False, 'GET', '/employee/list', b'stream=1')
+        self.assert_async(False, 'GET', '/employee/list', headers=[('Accept', 'application/x-ndjson')])
+        self.assert_async(False, 'GET', '/employee/export.csv')
+        self.assert_async(False, 'PUT', f'/employee/{uuid.uuid4()}')
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes do modo ASGI...")
+    unittest.main(verbosity=2)
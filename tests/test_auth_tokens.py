@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Testes para o par de tokens de acesso/refresh e a pool de hash de senha."""
+
+import unittest
+import sys
+import os
+import threading
+import uuid
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.password_service import PasswordPool, PasswordPoolBusy
+from app.services.refresh_token_service import hash_refresh_token, new_refresh_token
+from app.utils.auth import parse_authorization, token_pair
+
+
+class TestTokenPair(unittest.TestCase):
+    """Testes da resposta de login e renovação."""
+
+    def test_token_pair(self):
+        """Teste par com token de acesso válido, refresh token e validade."""
+        user_id = uuid.uuid4()
+        pair = token_pair(user_id, 'refresh')
+
+        self.assertEqual(pair['refresh_token'], 'refresh')
+        self.assertGreater(pair['expires_in'], 0)
+        self.assertEqual(parse_authorization(f'Bearer {pair["token"]}'), (user_id, None))
+
+    def test_refresh_token_row(self):
+        """Teste que só o hash do refresh token é guardado."""
+        user_id = uuid.uuid4()
+        token, row = new_refresh_token(user_id)
+
+        self.assertNotIn(token.encode(), row.values())
+        self.assertEqual(row['token_hash'], hash_refresh_token(token))
+        self.assertEqual(row['user_id'], str(user_id))
+        self.assertGreater(row['expires_at'], row['created_at'])
+
+    def test_rotation_keeps_family(self):
+        """Teste que o token renovado continua na mesma família."""
+        first_token, first = new_refresh_token('u1')
+        second_token, second = new_refresh_token('u1', first['family_id'])
+
+        self.assertNotEqual(first_token, second_token)
+        self.assertEqual(first['family_id'], second['family_id'])
+
+
+class TestPasswordPool(unittest.TestCase):
+    """Testes da pool limitada de hash de senha."""
+
+    def test_run(self):
+        """Teste execução na pool."""
+        pool = PasswordPool(workers=1, max_pending=0)
+        self.assertEqual(pool.run(lambda a, b: a + b, 2, 3), 5)
+        self.assertEqual(pool.metrics()['completed'], 1)
+
+    def test_rejects_when_full(self):
+        """Teste que sem vagas a pool recusa em vez de enfileirar."""
+        pool = PasswordPool(workers=1, max_pending=1)
+        release = threading.Event()
+        futures = [pool.submit(release.wait), pool.submit(release.wait)]
+
+        with self.assertRaises(PasswordPoolBusy):
+            pool.submit(release.wait)
+
+        release.set()
+        for future in futures:
+            future.result()
+        self.assertEqual(pool.metrics()['rejected'], 1)
+        self.assertEqual(pool.run(lambda: 'ok'), 'ok')
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de tokens de autenticação...")
+    unittest.main(verbosity=2)
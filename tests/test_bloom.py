@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Testes para o filtro de Bloom de CPFs."""
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert
+from app import create_app, db
+from app.models.employee import Employee
+from app.services import cpf_filter_service
+from app.services.cpf_filter_service import CpfFilter
+from app.services.data_version_service import EMPLOYEE_CPFS, bump_data_version, get_data_version
+from app.services.employee_service import build_employee_rows
+from app.utils.bloom import BloomFilter
+from app.utils.cpf import build_cpf
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Testes de pertinência e taxa de falso positivo."""
+
+    def test_added_items_are_always_found(self):
+        """Teste ausência de falsos negativos."""
+        bloom = BloomFilter(1000)
+        cpfs = [f'{i:011d}' for i in range(1000)]
+        for cpf in cpfs:
+            bloom.add(cpf)
+
+        self.assertTrue(all(cpf in bloom for cpf in cpfs))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_false_positive_rate_within_target(self):
+        """Teste taxa de falso positivo próxima da configurada."""
+        bloom = BloomFilter(5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f'cadastrado-{i}')
+
+        false_positives = sum(f'ausente-{i}' in bloom for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.02)
+        self.assertAlmostEqual(bloom.false_positive_rate, 0.01, delta=0.005)
+
+    def test_empty_filter(self):
+        """Teste filtro vazio não contém nada."""
+        bloom = BloomFilter(10)
+        self.assertNotIn('529.982.247-25', bloom)
+        self.assertEqual(bloom.false_positive_rate, 0)
+        self.assertGreater(bloom.size_bytes, 0)
+
+
+class TestCpfFilter(unittest.TestCase):
+    """Testes da consulta ao filtro de CPFs conforme a versão."""
+
+    def setUp(self):
+        self.cpf_filter = CpfFilter()
+        self.cpf_filter.app = SimpleNamespace(config={'CPF_FILTER_ENABLED': True})
+        self.cpf_filter._filter = BloomFilter(100)
+        self.cpf_filter._filter.add(52998224725)
+        self.cpf_filter._version = 3
+        self.rebuilds = []
+        self.cpf_filter._refresh_in_background = lambda: self.rebuilds.append(True)
+
+    def test_current_version(self):
+        """Teste negativo definitivo e positivo com o filtro na versão lida."""
+        self.assertTrue(self.cpf_filter.lookup(52998224725, 3))
+        self.assertFalse(self.cpf_filter.lookup(11144477735, 3))
+        self.assertEqual(self.rebuilds, [])
+
+    def test_stale_version_defers_to_database(self):
+        """Teste que o filtro desatualizado não responde e reconstrói em segundo plano."""
+        self.assertIsNone(self.cpf_filter.lookup(11144477735, 4))
+        self.assertEqual(self.rebuilds, [True])
+
+    def test_single_background_refresh(self):
+        """Teste que chamadas simultâneas disparam uma única thread de atualização."""
+        cpf_filter = CpfFilter()
+        with mock.patch.object(cpf_filter_service.threading, 'Thread') as thread:
+            cpf_filter._refresh_in_background()
+            cpf_filter._refresh_in_background()
+        self.assertEqual(thread.call_count, 1)
+
+
+class TestCpfFilterRefresh(unittest.TestCase):
+    """Atualização incremental quando outro worker cadastra CPFs."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "cpf_filter.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': True,
+            'CPF_FILTER_WARM_ON_START': False,
+            'DATA_VERSION_MAX_AGE': 0,
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.context = self.app.app_context()
+        self.context.push()
+        self.cpf_filter = CpfFilter(self.app)
+        self.insert_from_other_worker(1, 2)
+        self.cpf_filter.rebuild()
+
+    def tearDown(self):
+        db.session.execute(Employee.__table__.delete())
+        db.session.commit()
+        db.session.remove()
+        self.context.pop()
+
+    def insert_from_other_worker(self, *numbers, created_at=None):
+        rows = [build_employee_rows(build_cpf(number), f'Funcionário {number}', 'ACME', [])[0] for number in numbers]
+        if created_at:
+            for row in rows:
+                row['created_at'] = created_at
+        db.session.execute(insert(Employee), rows)
+        bump_data_version(EMPLOYEE_CPFS)
+        db.session.commit()
+
+    def test_refresh_adds_only_new_rows(self):
+        """Teste que a versão nova é alcançada sem reler todos os CPFs."""
+        self.insert_from_other_worker(3)
+        self.cpf_filter.refresh()
+
+        self.assertEqual(self.cpf_filter.rebuilds, 1)
+        self.assertEqual(self.cpf_filter.catch_ups, 1)
+        self.assertFalse(self.cpf_filter.lookup(build_cpf(4), get_data_version(EMPLOYEE_CPFS)))
+        self.assertTrue(self.cpf_filter.lookup(build_cpf(3), get_data_version(EMPLOYEE_CPFS)))
+        self.assertEqual(self.cpf_filter.metrics()['items'], 3)
+
+    def test_late_commit_within_overlap(self):
+        """Teste linha com created_at anterior ao último lido (commit atrasado) dentro da folga."""
+        seen_until = self.cpf_filter._seen_until
+        self.insert_from_other_worker(5, created_at=seen_until - timedelta(seconds=60))
+        self.cpf_filter.refresh()
+
+        self.assertTrue(self.cpf_filter.lookup(build_cpf(5), get_data_version(EMPLOYEE_CPFS)))
+        self.assertEqual(self.cpf_filter._seen_until, seen_until)
+
+    def test_capacity_exceeded_rebuilds(self):
+        """Teste reconstrução completa quando os novos CPFs excedem a capacidade."""
+        self.cpf_filter._filter.count = self.cpf_filter._filter.capacity
+        self.insert_from_other_worker(6)
+        self.cpf_filter.refresh()
+
+        self.assertEqual(self.cpf_filter.rebuilds, 2)
+        self.assertEqual(self.cpf_filter.metrics()['items'], 3)
+        self.assertTrue(self.cpf_filter.lookup(build_cpf(6), get_data_version(EMPLOYEE_CPFS)))
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes do filtro de Bloom...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Testes para normalização e formatação de CPF."""
+
+import unittest
+import sys
+import os
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.cpf import build_cpf, cpf_search_digits, format_cpf, normalize_cpf
+
+
+class TestCpf(unittest.TestCase):
+    """Testes da chave canônica de CPF."""
+
+    def test_formatted_and_digits_share_key(self):
+        """Teste variantes formatadas do mesmo CPF geram a mesma chave."""
+        self.assertEqual(normalize_cpf('529.982.247-25'), 52998224725)
+        self.assertEqual(normalize_cpf('52998224725'), 52998224725)
+        self.assertEqual(normalize_cpf(' 529.982.247-25 '), 52998224725)
+
+    def test_invalid_cpfs(self):
+        """Teste rejeição de dígitos verificadores, tamanho e repetições."""
+        for cpf in ('123.456.789-00', '111.111.111-11', '1234567890', '529.982.247-2a', '', None, True):
+            self.assertIsNone(normalize_cpf(cpf), cpf)
+
+    def test_leading_zeros(self):
+        """Teste CPF com zeros à esquerda."""
+        key = normalize_cpf('012.345.678-90')
+        self.assertEqual(key, 1234567890)
+        self.assertEqual(format_cpf(key), '012.345.678-90')
+        self.assertEqual(normalize_cpf(key), key)
+
+    def test_build_cpf(self):
+        """Teste cálculo dos dígitos verificadores."""
+        self.assertEqual(build_cpf(529982247), 52998224725)
+        self.assertEqual(build_cpf(12345678), 1234567890)
+        for number in (1, 111444777, 999999998):
+            self.assertEqual(normalize_cpf(build_cpf(number)), build_cpf(number))
+
+    def test_search_digits(self):
+        """Teste extração de dígitos de termos de busca."""
+        self.assertEqual(cpf_search_digits('529.982'), '529982')
+        self.assertIsNone(cpf_search_digits('João'))
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de CPF...")
+    unittest.main(verbosity=2)
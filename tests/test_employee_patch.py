@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Testes do PATCH /employee/<id> (JSON Merge Patch com If-Match)."""
+
+import unittest
+import sys
+import os
+import tempfile
+import uuid
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.utils.auth import create_access_token
+
+MERGE_PATCH = 'application/merge-patch+json'
+
+
+class TestPatchEmployee(unittest.TestCase):
+    """Pré-condição If-Match, Content-Type e Prefer: return=minimal."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "patch.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+        cls.client = cls.app.test_client()
+        cls.headers = {'Authorization': f'Bearer {create_access_token(uuid.uuid4())}'}
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        response = self.client.post('/employee/register_employee', json={
+            'cpf': '529.982.247-25', 'employee_name': 'Ana', 'company_name': 'ACME'
+        }, headers=self.headers)
+        self.assertEqual(response.status_code, 201)
+        self.url = f"/employee/{response.get_json()['employeeId']}"
+
+    def tearDown(self):
+        with self.app.app_context():
+            for table in reversed(db.metadata.sorted_tables):
+                db.session.execute(table.delete())
+            db.session.commit()
+
+    def patch(self, body, content_type=MERGE_PATCH, **headers):
+        return self.client.patch(self.url, json=body, content_type=content_type, headers={**self.headers, **headers})
+
+    def test_stale_if_match(self):
+        """Teste 412 quando o If-Match é de uma versão anterior."""
+        etag = self.client.get(self.url, headers=self.headers).headers['ETag']
+        self.assertEqual(self.patch({'phone': '11999990000'}, **{'If-Match': etag}).status_code, 200)
+
+        response = self.patch({'phone': '11999990001'}, **{'If-Match': etag})
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.client.get(self.url, headers=self.headers).get_json()['phone'], '11999990000')
+
+    def test_wrong_content_type(self):
+        """Teste 415 para corpo que não é JSON."""
+        response = self.patch({'phone': '11999990000'}, content_type='text/plain')
+        self.assertEqual(response.status_code, 415)
+
+    def test_return_minimal(self):
+        """Teste 204 sem corpo e sem Content-Type, com o novo ETag."""
+        etag = self.client.get(self.url, headers=self.headers).headers['ETag']
+        response = self.patch({'employee_name': 'Ana Maria'}, **{'If-Match': etag, 'Prefer': 'return=minimal'})
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.get_data(), b'')
+        self.assertNotIn('Content-Type', response.headers)
+        self.assertEqual(response.headers['Preference-Applied'], 'return=minimal')
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(self.client.get(self.url, headers=self.headers).headers['ETag'], response.headers['ETag'])
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes do PATCH de funcionários...")
+    unittest.main(verbosity=2)
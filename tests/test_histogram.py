@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Testes para o histograma log-linear e o header Server-Timing."""
+
+import unittest
+import sys
+import os
+import random
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.histogram import Histogram
+from app.utils.profiling import RequestProfile, server_timing
+
+
+class TestHistogram(unittest.TestCase):
+    """Testes de percentis com erro relativo limitado."""
+
+    def test_empty(self):
+        """Teste histograma sem amostras."""
+        histogram = Histogram()
+        self.assertIsNone(histogram.percentile(0.5))
+        self.assertEqual(histogram.summary(), {'count': 0})
+
+    def test_small_values_are_exact(self):
+        """Teste valores pequenos registrados sem perda."""
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        self.assertEqual(histogram.percentile(0.5), 50)
+        self.assertEqual(histogram.percentile(0.99), 99)
+        self.assertEqual(histogram.percentile(1.0), 100)
+
+    def test_relative_error(self):
+        """Teste erro relativo dos percentis abaixo da precisão configurada."""
+        rng = random.Random(42)
+        values = sorted(int(rng.lognormvariate(10, 2)) for _ in range(20000))
+        histogram = Histogram(precision_bits=6)
+        for value in values:
+            histogram.record(value)
+
+        for fraction in (0.5, 0.95, 0.99):
+            exact = values[round(fraction * len(values)) - 1]
+            self.assertLessEqual(abs(histogram.percentile(fraction) - exact) / exact, 1 / 64)
+
+    def test_summary_scale(self):
+        """Teste resumo convertido de microssegundos para milissegundos."""
+        histogram = Histogram()
+        histogram.record(1500)
+        summary = histogram.summary(1000)
+
+        self.assertEqual(summary['count'], 1)
+        self.assertEqual(summary['p99'], 1.5)
+        self.assertEqual(summary['max'], 1.5)
+
+
+class TestServerTiming(unittest.TestCase):
+    """Testes do header Server-Timing."""
+
+    def test_format(self):
+        """Teste métricas total, banco e serialização."""
+        profile = RequestProfile()
+        profile.sql_count = 3
+        profile.sql_time = 0.004
+        profile.serialize_time = 0.0005
+
+        self.assertEqual(
+            server_timing(0.0123, profile),
+            'app;dur=12.30, db;dur=4.00;desc="3 queries", json;dur=0.50'
+        )
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes do histograma...")
+    unittest.main(verbosity=2)
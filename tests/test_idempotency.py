@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Testes para as requisições com Idempotency-Key."""
+
+import unittest
+import sys
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from unittest import mock
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, insert, select
+from app import create_app, db
+from app.models.employee import Employee
+from app.models.idempotency_key import IdempotencyKey
+from app.services import idempotency_service
+from app.services.employee_service import update_employee
+from app.services.idempotency_service import claim_idempotency_key
+from app.utils.auth import create_access_token
+from app.utils.idempotency import request_fingerprint
+
+EMPLOYEE = {'cpf': '529.982.247-25', 'employee_name': 'Ana', 'company_name': 'ACME'}
+
+
+class TestRequestFingerprint(unittest.TestCase):
+    """Testes da impressão digital de método, caminho e corpo."""
+
+    def test_same_request_same_fingerprint(self):
+        """Teste reenvio idêntico gera a mesma impressão digital."""
+        body = b'{"cpf": "529.982.247-25"}'
+        self.assertEqual(
+            request_fingerprint('POST', '/employee/register_employee', body),
+            request_fingerprint('POST', '/employee/register_employee', body)
+        )
+
+    def test_different_requests(self):
+        """Teste corpo, caminho ou método diferentes mudam a impressão digital."""
+        base = request_fingerprint('PUT', '/employee/1', b'{}')
+        self.assertNotEqual(base, request_fingerprint('PUT', '/employee/1', b'{"a": 1}'))
+        self.assertNotEqual(base, request_fingerprint('PUT', '/employee/2', b'{}'))
+        self.assertNotEqual(base, request_fingerprint('POST', '/employee/1', b'{}'))
+
+    def test_parts_are_delimited(self):
+        """Teste que o limite entre caminho e corpo não é ambíguo."""
+        self.assertNotEqual(
+            request_fingerprint('PUT', '/employee/1', b'2{}'),
+            request_fingerprint('PUT', '/employee/12', b'{}')
+        )
+
+
+class TestIdempotentRequests(unittest.TestCase):
+    """Idempotency-Key no cadastro e na atualização de funcionários."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "idempotency.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+        cls.client = cls.app.test_client()
+        cls.user_id = str(uuid.uuid4())
+        cls.token = create_access_token(cls.user_id)
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def tearDown(self):
+        with self.app.app_context():
+            for table in reversed(db.metadata.sorted_tables):
+                db.session.execute(table.delete())
+            db.session.commit()
+
+    def headers(self, key):
+        return {'Authorization': f'Bearer {self.token}', 'Idempotency-Key': key}
+
+    def register(self, key, body=EMPLOYEE):
+        return self.client.post('/employee/register_employee', json=body, headers=self.headers(key))
+
+    def employee_count(self):
+        with self.app.app_context():
+            return db.session.scalar(select(func.count()).select_from(Employee))
+
+    def claim_in_progress(self, key, age=timedelta(0)):
+        """Chave reservada por um cadastro de EMPLOYEE que ainda não gravou a resposta"""
+        # Mesmo corpo que o cliente de testes envia em register()
+        fingerprint = request_fingerprint('POST', '/employee/register_employee', self.app.json.dumps(EMPLOYEE).encode())
+        with self.app.app_context():
+            db.session.execute(insert(IdempotencyKey).values(
+                user_id=self.user_id, key=key, request_hash=fingerprint, created_at=datetime.utcnow() - age
+            ))
+            db.session.commit()
+
+    def assert_replays_register(self):
+        first = self.register('cadastro-1')
+        replay = self.register('cadastro-1')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(replay.status_code, 201)
+        self.assertEqual(replay.headers['Idempotent-Replayed'], 'true')
+        self.assertEqual(replay.get_json()['employeeId'], first.get_json()['employeeId'])
+        self.assertEqual(self.employee_count(), 1)
+
+    def test_register_replay(self):
+        """Teste reenvio do cadastro: mesma resposta, sem novo funcionário (ON CONFLICT)."""
+        self.assert_replays_register()
+
+    def test_register_replay_with_savepoint(self):
+        """Teste o mesmo reenvio em bancos sem ON CONFLICT (INSERT em SAVEPOINT)."""
+        with mock.patch.object(idempotency_service, 'insert_ignoring_conflicts', return_value=None):
+            self.assert_replays_register()
+            self.claim_in_progress('em-andamento')
+            self.assertEqual(self.register('em-andamento').status_code, 409)
+
+    def test_update_replay(self):
+        """Teste reenvio do PUT: resposta gravada, serviço executado uma vez."""
+        employee_id = self.register('cadastro').get_json()['employeeId']
+        update = {'employee_name': 'Ana Maria'}
+
+        with mock.patch('app.controllers.employee_controller.update_employee', wraps=update_employee) as service:
+            first = self.client.put(f'/employee/{employee_id}', json=update, headers=self.headers('alteracao'))
+            replay = self.client.put(f'/employee/{employee_id}', json=update, headers=self.headers('alteracao'))
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(replay.get_data(), first.get_data())
+        self.assertEqual(replay.headers['Idempotent-Replayed'], 'true')
+        self.assertEqual(service.call_count, 1)
+
+    def test_key_reused_with_other_body(self):
+        """Teste 422 para a mesma chave com outro corpo."""
+        self.register('cadastro')
+        response = self.register('cadastro', {**EMPLOYEE, 'employee_name': 'Bia'})
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self.employee_count(), 1)
+
+    def test_original_still_running(self):
+        """Teste 409 com Retry-After enquanto a requisição original não terminou."""
+        self.claim_in_progress('cadastro')
+        response = self.register('cadastro')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.headers['Retry-After'], '1')
+        self.assertEqual(self.employee_count(), 0)
+
+    def test_stale_key_taken_over(self):
+        """Teste reaproveitamento de chave abandonada (IDEMPOTENCY_LOCK_TIMEOUT=0)."""
+        self.claim_in_progress('cadastro', age=timedelta(seconds=1))
+        with mock.patch.dict(self.app.config, {'IDEMPOTENCY_LOCK_TIMEOUT': 0}):
+            response = self.register('cadastro')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.register('cadastro').headers['Idempotent-Replayed'], 'true')
+        self.assertEqual(self.employee_count(), 1)
+
+    def test_stale_takeover_race(self):
+        """Teste que só um worker reaproveita a chave: o UPDATE confere o created_at lido."""
+        self.claim_in_progress('cadastro', age=timedelta(seconds=1))
+
+        is_stale = idempotency_service._is_stale
+        checks = []
+
+        def taken_over_before_update(record, now):
+            # Outro worker reaproveita a chave entre a leitura e o UPDATE deste
+            checks.append(record)
+            if len(checks) > 1:
+                return is_stale(record, now)
+            with mock.patch.object(idempotency_service, '_is_stale', is_stale), \
+                    mock.patch.dict(self.app.config, {'IDEMPOTENCY_LOCK_TIMEOUT': 0}):
+                self.assertIsNone(claim_idempotency_key(self.user_id, 'cadastro', 'f' * 64))
+            return True
+
+        with self.app.app_context(), mock.patch.object(idempotency_service, '_is_stale', taken_over_before_update):
+            existing = claim_idempotency_key(self.user_id, 'cadastro', 'a' * 64)
+
+        self.assertIsNotNone(existing)
+        self.assertEqual(existing.request_hash, 'f' * 64)
+        self.assertIsNone(existing.status_code)
+
+    def test_key_released_after_server_error(self):
+        """Teste que um 5xx não é gravado e a chave pode ser usada de novo."""
+        with mock.patch('app.controllers.employee_controller.create_employee_with_documents', side_effect=RuntimeError):
+            self.assertEqual(self.register('cadastro').status_code, 500)
+
+        with self.app.app_context():
+            self.assertIsNone(db.session.get(IdempotencyKey, (self.user_id, 'cadastro')))
+
+        response = self.register('cadastro')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', response.headers)
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de idempotência...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Testes da importação de funcionários em lote."""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.services.import_service import import_employees, read_jsonl_records
+from app.utils.validation import parse_employee_payload
+
+
+def jsonl(*records):
+    return [json.dumps(record) for record in records]
+
+
+class TestImportEmployees(unittest.TestCase):
+    """Importação com a mesma validação do cadastro e erros ordenados por linha."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "import.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def run_import(self, lines):
+        with self.app.app_context():
+            summary = import_employees(read_jsonl_records(lines))
+            db.session.remove()
+        return summary
+
+    def test_same_messages_as_register(self):
+        """Teste que registros inválidos recebem as mensagens do cadastro."""
+        records = [
+            {'cpf': '529.982.247-26', 'employee_name': 'Ana', 'company_name': 'ACME'},
+            {'cpf': '529.982.247-25', 'employee_name': 'A' * 256, 'company_name': 'ACME'},
+            {'cpf': '529.982.247-25', 'employee_name': 'Ana', 'company_name': 'ACME', 'phone': 123},
+            {'cpf': '529.982.247-25', 'employee_name': 'Ana', 'company_name': 'ACME', 'documents': 'ASO'},
+        ]
+        summary = self.run_import(jsonl(*records))
+
+        self.assertEqual(summary['imported'], 0)
+        self.assertEqual(
+            [error['message'] for error in summary['errors']],
+            [parse_employee_payload(record)[1] for record in records]
+        )
+
+    def test_errors_sorted_by_line(self):
+        """Teste ordem das linhas quando erros de inserção chegam depois dos de validação."""
+        self.run_import(jsonl({'cpf': '111.444.777-35', 'employee_name': 'Bia', 'company_name': 'ACME'}))
+
+        summary = self.run_import(jsonl(
+            {'cpf': '111.444.777-35', 'employee_name': 'Bia', 'company_name': 'ACME'},
+            {'cpf': '123.456.789-09', 'employee_name': 'Caio', 'company_name': 'ACME',
+             'documents': [{'name': 'ASO', 'expiration_date': '2030-13-01'}]},
+            {'cpf': '123.456.789-09', 'employee_name': 'Caio', 'company_name': 'ACME'},
+        ))
+
+        self.assertEqual(summary['imported'], 1)
+        self.assertEqual([error['line'] for error in summary['errors']], [1, 2])
+        self.assertEqual(summary['errors'][0]['message'], 'CPF já cadastrado')
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de importação...")
+    unittest.main(verbosity=2)
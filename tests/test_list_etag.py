@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Testes do ETag e do Vary da listagem de funcionários."""
+
+import unittest
+import sys
+import os
+import tempfile
+import uuid
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.utils.auth import create_access_token
+
+
+class TestListEtag(unittest.TestCase):
+    """Cada representação da listagem (JSON, NDJSON, stream=1) tem seu próprio ETag."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "etag.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'LOG_LEVEL': 'ERROR'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+        cls.client = cls.app.test_client()
+        cls.headers = {'Authorization': f'Bearer {create_access_token(uuid.uuid4())}'}
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    def get(self, url='/employee/list', **headers):
+        response = self.client.get(url, headers={**self.headers, **headers})
+        response.get_data()
+        return response
+
+    def test_representations_have_distinct_etags(self):
+        """Teste ETags diferentes para JSON, NDJSON e array em streaming."""
+        etags = {
+            self.get().headers['ETag'],
+            self.get(Accept='application/x-ndjson').headers['ETag'],
+            self.get('/employee/list?stream=1').headers['ETag'],
+        }
+        self.assertEqual(len(etags), 3)
+
+    def test_vary_accept(self):
+        """Teste Vary: Accept nas respostas 200 e 304."""
+        response = self.get(Accept='application/x-ndjson')
+        self.assertIn('Accept', response.headers['Vary'])
+
+        unchanged = self.get(**{'Accept': 'application/x-ndjson', 'If-None-Match': response.headers['ETag']})
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertIn('Accept', unchanged.headers['Vary'])
+
+    def test_etag_of_other_representation_does_not_match(self):
+        """Teste que o ETag do NDJSON não gera 304 para o JSON."""
+        etag = self.get(Accept='application/x-ndjson').headers['ETag']
+        self.assertEqual(self.get(**{'If-None-Match': etag}).status_code, 200)
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de ETag da listagem...")
+    unittest.main(verbosity=2)
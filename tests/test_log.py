@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Testes para o pipeline de logging estruturado."""
+
+import unittest
+import sys
+import os
+import json
+import logging
+import queue
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from app.utils.log import JsonFormatter, LogSampler, NonBlockingQueueHandler, parse_sample_rates
+
+
+def make_record(level=logging.INFO, msg='Verificando CPF: %s', args=('529.982.247-25',), **extra):
+    record = logging.LogRecord('app', level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Testes da formatação de uma linha JSON por registro."""
+
+    def test_message_and_extras(self):
+        """Teste mensagem formatada só na saída e campos extras no JSON."""
+        entry = json.loads(JsonFormatter().format(make_record(endpoint='routes.checkRegister', user='u1')))
+
+        self.assertEqual(entry['level'], 'INFO')
+        self.assertEqual(entry['logger'], 'app')
+        self.assertEqual(entry['message'], 'Verificando CPF: 529.982.247-25')
+        self.assertEqual(entry['endpoint'], 'routes.checkRegister')
+        self.assertEqual(entry['user'], 'u1')
+        self.assertNotIn('args', entry)
+
+
+class TestLogSampler(unittest.TestCase):
+    """Testes da amostragem por rota e do limite de taxa."""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.add_url_rule('/check', 'checkRegister', lambda: '')
+
+    def test_parse_sample_rates(self):
+        """Teste leitura da configuração de amostragem."""
+        self.assertEqual(parse_sample_rates('routes.a=0.1, routes.b=1'), {'routes.a': 0.1, 'routes.b': 1.0})
+        self.assertEqual(parse_sample_rates(''), {})
+        with self.assertRaises(ValueError):
+            parse_sample_rates('routes.a=2')
+
+    def test_unknown_endpoint_warns(self):
+        """Teste aviso para chave de amostragem que não é uma rota registrada."""
+        with self.assertLogs('app.utils.log', 'WARNING') as logs:
+            parse_sample_rates('checkRegister=0.1,routes.listEmployees=0.1', self.app.view_functions)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('routes.listEmployees', logs.output[0])
+
+    def test_sampled_route_drops_info_but_not_warnings(self):
+        """Teste rota com taxa 0 descarta INFO e mantém avisos."""
+        sampler = LogSampler({'checkRegister': 0.0})
+        with self.app.test_request_context('/check'):
+            self.assertFalse(sampler.filter(make_record()))
+            self.assertTrue(sampler.filter(make_record(level=logging.WARNING)))
+        self.assertEqual(sampler.sampled_out, 1)
+
+    def test_rate_limit_per_route(self):
+        """Teste limite de registros INFO por segundo."""
+        sampler = LogSampler(rate_limit=2)
+        with self.app.test_request_context('/check'):
+            results = [sampler.filter(make_record()) for _ in range(5)]
+        self.assertEqual(results[:2], [True, True])
+        self.assertGreaterEqual(sampler.rate_limited, 2)
+
+    def test_outside_request_passes(self):
+        """Teste registros fora de requisições (threads de fundo) não são amostrados."""
+        self.assertTrue(LogSampler({'checkRegister': 0.0}, rate_limit=1).filter(make_record()))
+
+
+class TestNonBlockingQueueHandler(unittest.TestCase):
+    """Testes do handler que enfileira sem bloquear."""
+
+    def test_full_queue_drops(self):
+        """Teste fila cheia descarta o registro em vez de bloquear."""
+        handler = NonBlockingQueueHandler(queue.Queue(1))
+        handler.handle(make_record())
+        handler.handle(make_record())
+
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(handler.dropped, 1)
+
+    def test_message_rendered_before_enqueue(self):
+        """Teste mensagem montada e args descartados ao enfileirar."""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        handler.handle(make_record())
+
+        record = handler.queue.get_nowait()
+        self.assertEqual(record.msg, 'Verificando CPF: 529.982.247-25')
+        self.assertIsNone(record.args)
+        self.assertEqual(json.loads(JsonFormatter().format(record))['message'], record.msg)
+
+    def test_traceback_kept_without_exc_info(self):
+        """Teste traceback preservado em exc_text e exc_info descartado."""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        try:
+            raise ValueError('falha')
+        except ValueError:
+            record = make_record(logging.ERROR, exc_info=sys.exc_info())
+        handler.handle(record)
+
+        queued = handler.queue.get_nowait()
+        self.assertIsNone(queued.exc_info)
+        self.assertIn('ValueError: falha', json.loads(JsonFormatter().format(queued))['exc_info'])
+        self.assertIn('ValueError: falha', logging.Formatter().format(queued))
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de logging...")
+    unittest.main(verbosity=2)
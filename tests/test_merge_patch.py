@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Testes para JSON Merge Patch (RFC 7386)."""
+
+import unittest
+import sys
+import os
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.merge_patch import apply_merge_patch
+
+
+class TestMergePatch(unittest.TestCase):
+    """Testes de mesclagem, remoção e substituição."""
+
+    def test_merge_and_remove(self):
+        """Teste mesclagem de chaves e remoção com null."""
+        target = {'street': 'Rua A', 'number': '1', 'city': 'SP'}
+        result = apply_merge_patch(target, {'number': '2', 'city': None, 'zip_code': '01000-000'})
+        self.assertEqual(result, {'street': 'Rua A', 'number': '2', 'zip_code': '01000-000'})
+        self.assertEqual(target['number'], '1')
+
+    def test_nested_objects(self):
+        """Teste mesclagem recursiva de objetos."""
+        result = apply_merge_patch({'a': {'b': 1, 'c': 2}}, {'a': {'c': None, 'd': 3}})
+        self.assertEqual(result, {'a': {'b': 1, 'd': 3}})
+
+    def test_non_object_values_replace(self):
+        """Teste listas e valores simples substituem o valor anterior."""
+        self.assertEqual(apply_merge_patch({'a': [1, 2]}, {'a': [3]}), {'a': [3]})
+        self.assertEqual(apply_merge_patch(None, {'a': 1}), {'a': 1})
+        self.assertEqual(apply_merge_patch({'a': 1}, 'texto'), 'texto')
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de JSON Merge Patch...")
+    unittest.main(verbosity=2)
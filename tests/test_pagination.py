@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Testes para os helpers de paginação por cursor."""
+
+import unittest
+import sys
+import os
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import date
+from app.utils.pagination import encode_cursor, decode_cursor, cursor_date, cursor_text, cursor_uuid, parse_limit, MAX_PAGE_SIZE
+
+
+class TestPagination(unittest.TestCase):
+    """Testes para cursor e limite da listagem paginada."""
+
+    def test_cursor_round_trip(self):
+        """Teste codificação e decodificação do cursor."""
+        cursor = encode_cursor('João da Silva', '123e4567-e89b-12d3-a456-426614174000')
+
+        # Cursor deve ser seguro para query string
+        self.assertNotIn('=', cursor)
+        self.assertNotIn('/', cursor)
+
+        values = decode_cursor(cursor, cursor_text, cursor_uuid)
+        self.assertEqual(values, ('João da Silva', '123e4567-e89b-12d3-a456-426614174000'))
+
+    def test_date_cursor(self):
+        """Teste cursor de documentos: data ISO convertida para date."""
+        cursor = encode_cursor(date(2025, 6, 30), '123e4567-e89b-12d3-a456-426614174000')
+        self.assertEqual(
+            decode_cursor(cursor, cursor_date, cursor_uuid),
+            (date(2025, 6, 30), '123e4567-e89b-12d3-a456-426614174000')
+        )
+
+    def test_invalid_cursor(self):
+        """Teste cursor inválido ou com número errado de campos."""
+        with self.assertRaises(ValueError):
+            decode_cursor('não-é-base64!', cursor_text, cursor_uuid)
+
+        with self.assertRaises(ValueError):
+            decode_cursor(encode_cursor('apenas um campo'), cursor_text, cursor_uuid)
+
+    def test_cursor_field_types(self):
+        """Teste campos com tipo errado geram ValueError (400), não erro no SQL."""
+        invalid = (
+            ([1], {'a': 2}),
+            ('João', 'não-é-uuid'),
+            ('João', None),
+            (['lista'], '123e4567-e89b-12d3-a456-426614174000'),
+        )
+        for values in invalid:
+            with self.subTest(values=values), self.assertRaises(ValueError):
+                decode_cursor(encode_cursor(*values), cursor_text, cursor_uuid)
+
+        for values in (('2025-13-01', '123e4567-e89b-12d3-a456-426614174000'), (20250601, '123e4567-e89b-12d3-a456-426614174000')):
+            with self.subTest(values=values), self.assertRaises(ValueError):
+                decode_cursor(encode_cursor(*values), cursor_date, cursor_uuid)
+
+    def test_parse_limit(self):
+        """Teste conversão do parâmetro limit."""
+        self.assertEqual(parse_limit(None), 50)
+        self.assertEqual(parse_limit('10'), 10)
+        self.assertEqual(parse_limit('100000'), MAX_PAGE_SIZE)
+
+        with self.assertRaises(ValueError):
+            parse_limit('0')
+
+        with self.assertRaises(ValueError):
+            parse_limit('abc')
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de paginação...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Testes do número de consultas por endpoint conforme a base cresce (detector de N+1)."""
+
+import unittest
+import sys
+import os
+import tempfile
+import uuid
+from datetime import date, timedelta
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert, select
+from app import create_app, db
+from app.models.employee import Employee
+from app.models.document import Document
+from app.services.data_version_service import EMPLOYEE_CPFS, bump_data_version
+from app.services.employee_service import build_employee_rows
+from app.utils.auth import create_access_token
+from app.utils.cpf import build_cpf, format_cpf
+from app.utils.query_counter import QueryCounter, query_detector, statement_shape
+
+# Máximo de statements por endpoint, independente do número de funcionários e documentos
+QUERY_BUDGETS = {
+    'list': 2,
+    'list_by_status': 2,
+    'detail': 2,
+    'search': 1,
+    'check_register': 1,
+    'check_register_batch': 1,
+    'documents_expiring': 1,
+    'export_csv': 1,
+    'update': 5,
+}
+
+SMALL = 10
+LARGE = 1000
+
+
+class TestStatementShape(unittest.TestCase):
+    """Testes da normalização de statements."""
+
+    def test_parameters_and_literals(self):
+        """Teste que valores diferentes geram a mesma forma."""
+        self.assertEqual(
+            statement_shape("SELECT * FROM employees WHERE id = 'a' LIMIT 10"),
+            statement_shape('SELECT *\n  FROM employees WHERE id = ? LIMIT ?')
+        )
+        self.assertEqual(
+            statement_shape('SELECT * FROM documents WHERE employee_id = %(id_1)s'),
+            'SELECT * FROM documents WHERE employee_id = ?'
+        )
+
+    def test_parameter_lists(self):
+        """Teste que listas IN e VALUES de tamanhos diferentes geram a mesma forma."""
+        self.assertEqual(
+            statement_shape('SELECT cpf FROM employees WHERE cpf IN (?, ?, ?)'),
+            statement_shape('SELECT cpf FROM employees WHERE cpf IN (?)')
+        )
+        self.assertEqual(
+            statement_shape('INSERT INTO documents (id, name) VALUES (?, ?), (?, ?), (?, ?)'),
+            statement_shape('INSERT INTO documents (id, name) VALUES (?, ?)')
+        )
+
+    def test_postgresql_cast_is_kept(self):
+        """Teste que o cast :: do PostgreSQL não é tratado como parâmetro."""
+        self.assertIn('::', statement_shape('SELECT id::text FROM employees'))
+
+
+class TestQueryBudget(unittest.TestCase):
+    """Mesmo número de consultas com 10 e 1000 funcionários, dentro do orçamento."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(cls.directory.name, "budget.db")}',
+            'SQLALCHEMY_ENGINE_OPTIONS': {},
+            'SCHEMA_CHECK_MODE': 'skip',
+            'DOCUMENT_STATUS_SCHEDULER_ENABLED': False,
+            'CPF_FILTER_ENABLED': False,
+            'LIST_CACHE_MAX_ENTRIES': 0,
+            'DATA_VERSION_MAX_AGE': 0,
+            'QUERY_DETECTOR_ENABLED': True,
+            'QUERY_DETECTOR_THRESHOLD': 3,
+            'LOG_LEVEL': 'WARNING'
+        })
+        with cls.app.app_context():
+            db.create_all()
+
+        cls.client = cls.app.test_client()
+        cls.headers = {'Authorization': f'Bearer {create_access_token(uuid.uuid4())}'}
+        cls.counts = {size: cls.measure(size) for size in (SMALL, LARGE)}
+        cls.detected = query_detector.detected
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.directory.cleanup()
+
+    @classmethod
+    def seed(cls, size):
+        """Recria a base com size funcionários; cada um com mais documentos na base maior."""
+        documents_per_employee = 1 if size == SMALL else 5
+        today = date.today()
+
+        employees, documents = [], []
+        for number in range(size):
+            employee, employee_documents, _ = build_employee_rows(
+                build_cpf(number + 1),
+                f'Funcionário {number:05d}',
+                f'Empresa {number % 7}',
+                [
+                    {'name': f'Documento {index}', 'expiration_date': (today + timedelta(days=index * 20 + number % 60)).isoformat()}
+                    for index in range(documents_per_employee)
+                ]
+            )
+            employees.append(employee)
+            documents.extend(employee_documents)
+
+        db.session.execute(delete(Document))
+        db.session.execute(delete(Employee))
+        db.session.execute(insert(Employee), employees)
+        db.session.execute(insert(Document), documents)
+        # Contadores de versão já existentes, como em uma base em uso
+        bump_data_version()
+        bump_data_version(EMPLOYEE_CPFS)
+        db.session.commit()
+
+    @classmethod
+    def measure(cls, size):
+        """Statements executados por cada endpoint com a base de size funcionários."""
+        with cls.app.app_context():
+            cls.seed(size)
+            employee_id, cpf = db.session.execute(
+                select(Employee.id, Employee.cpf).order_by(Employee.employee_name).limit(1)
+            ).one()
+            document_ids = db.session.execute(
+                select(Document.id).where(Document.employee_id == employee_id)
+            ).scalars().all()
+            db.session.remove()
+
+        batch = [format_cpf(build_cpf(number + 1)) for number in range(size)]
+        requests = {
+            'list': lambda: cls.client.get('/employee/list?limit=50', headers=cls.headers),
+            'list_by_status': lambda: cls.client.get('/employee/list?status=expiring', headers=cls.headers),
+            'detail': lambda: cls.client.get(f'/employee/{employee_id}', headers=cls.headers),
+            'search': lambda: cls.client.get('/employee/search?q=Funcion', headers=cls.headers),
+            'check_register': lambda: cls.client.get(f'/employee/check_register/{format_cpf(cpf)}', headers=cls.headers),
+            'check_register_batch': lambda: cls.client.post('/employee/check_register/batch', json={'cpfs': batch}, headers=cls.headers),
+            'documents_expiring': lambda: cls.client.get('/documents/expiring', headers=cls.headers),
+            'export_csv': lambda: cls.client.get('/employee/export.csv', headers=cls.headers),
+            'update': lambda: cls.client.put(f'/employee/{employee_id}', json={
+                'employee_name': 'Funcionário Atualizado',
+                'documents': [{'id': doc_id, 'expiration_date': '2030-01-01'} for doc_id in document_ids]
+                + [{'name': 'Novo documento', 'expiration_date': '2031-01-01'}]
+            }, headers=cls.headers),
+        }
+
+        counts = {}
+        for name, send in requests.items():
+            with cls.app.app_context():
+                engine = db.engine
+            with QueryCounter(engine) as queries:
+                response = send()
+                # Respostas em streaming consultam o banco enquanto o corpo é lido
+                response.get_data()
+            # 409: CPF consultado já está cadastrado
+            if response.status_code not in (200, 409):
+                raise AssertionError(f'{name}: status {response.status_code} {response.get_data(as_text=True)}')
+            counts[name] = queries
+        return counts
+
+    def test_query_count_does_not_grow_with_data(self):
+        """Teste que nenhum endpoint faz consultas proporcionais ao número de linhas."""
+        for name in QUERY_BUDGETS:
+            with self.subTest(endpoint=name):
+                small, large = self.counts[SMALL][name], self.counts[LARGE][name]
+                self.assertEqual(small.count, large.count, large.statements)
+
+    def test_query_budget(self):
+        """Teste que cada endpoint fica dentro do orçamento de statements."""
+        for name, budget in QUERY_BUDGETS.items():
+            with self.subTest(endpoint=name):
+                queries = self.counts[LARGE][name]
+                self.assertLessEqual(queries.count, budget, queries.statements)
+
+    def test_no_repeated_statements(self):
+        """Teste que nenhuma forma de statement se repete dentro da mesma requisição."""
+        for name in QUERY_BUDGETS:
+            with self.subTest(endpoint=name):
+                self.assertEqual(self.counts[LARGE][name].repeated(), {})
+
+    def test_detector_silent_on_endpoints(self):
+        """Teste que o detector não avisou em nenhuma requisição medida."""
+        self.assertEqual(self.detected, 0)
+
+    def test_detector_warns_on_lazy_loading_loop(self):
+        """Teste que documentos carregados um funcionário por vez geram o aviso de N+1."""
+        with self.app.test_request_context('/employee/list'):
+            query_detector._start()
+            with QueryCounter(db.engine) as queries:
+                employees = db.session.execute(select(Employee).limit(5)).scalars().all()
+                for employee in employees:
+                    employee.documents
+            with self.assertLogs(self.app.logger, 'WARNING') as logs:
+                query_detector._finish()
+            db.session.remove()
+
+        self.assertEqual(queries.count, 6)
+        self.assertEqual(list(queries.repeated().values()), [5])
+        self.assertIn('Possível N+1', logs.output[0])
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de orçamento de consultas...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Testes para o cache de respostas da listagem."""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Testes de LRU, TTL e invalidação por versão."""
+
+    def test_hit_and_miss(self):
+        """Teste leitura de entrada existente e inexistente."""
+        cache = ResponseCache()
+        self.assertIsNone(cache.get(1, 'a'))
+
+        cache.set(1, 'a', b'[]')
+        self.assertEqual(cache.get(1, 'a'), b'[]')
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_version_change_clears_entries(self):
+        """Teste descarte das entradas quando a versão dos dados muda."""
+        cache = ResponseCache()
+        cache.set(1, 'a', b'v1')
+
+        self.assertIsNone(cache.get(2, 'a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_lru_eviction(self):
+        """Teste remoção da entrada menos usada ao exceder o limite."""
+        cache = ResponseCache(max_entries=2)
+        cache.set(1, 'a', b'a')
+        cache.set(1, 'b', b'b')
+        cache.get(1, 'a')
+        cache.set(1, 'c', b'c')
+
+        self.assertEqual(cache.get(1, 'a'), b'a')
+        self.assertIsNone(cache.get(1, 'b'))
+        self.assertEqual(cache.get(1, 'c'), b'c')
+
+    def test_ttl_expiration(self):
+        """Teste expiração de entradas antigas."""
+        cache = ResponseCache(ttl=10)
+
+        with mock.patch('app.utils.response_cache.time.monotonic', return_value=100):
+            cache.set(1, 'a', b'a')
+        with mock.patch('app.utils.response_cache.time.monotonic', return_value=105):
+            self.assertEqual(cache.get(1, 'a'), b'a')
+        with mock.patch('app.utils.response_cache.time.monotonic', return_value=111):
+            self.assertIsNone(cache.get(1, 'a'))
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes do cache de respostas...")
+    unittest.main(verbosity=2)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Testes para a verificação de revisão do schema."""
+
+import unittest
+import sys
+import os
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.schema_service import expected_schema_revisions, schema_is_current
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+class TestSchemaRevision(unittest.TestCase):
+    """Testes da comparação entre a revisão do banco e a das migrations."""
+
+    def test_migrations_have_single_head(self):
+        """Teste que as migrations terminam em uma única revisão."""
+        self.assertEqual(len(expected_schema_revisions(MIGRATIONS_DIR)), 1)
+
+    def test_matching_revision(self):
+        """Teste banco na mesma revisão do código."""
+        self.assertTrue(schema_is_current({'c2f094b7442f'}, {'c2f094b7442f'}))
+
+    def test_outdated_or_missing_revision(self):
+        """Teste banco em revisão anterior ou sem revisão registrada."""
+        self.assertFalse(schema_is_current({'c2f094b7442f'}, {'a68b18b5e911'}))
+        self.assertFalse(schema_is_current({'c2f094b7442f'}, set()))
+        self.assertFalse(schema_is_current(set(), set()))
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes de schema...")
+    unittest.main(verbosity=2)
@@ -111,6 +111,59 @@ class TestEmployeeServiceFunctions(unittest.TestCase):
         self.assertEqual(status, 'invalid_date')
 
 
+class TestDocumentStatusService(unittest.TestCase):
+    """Testes para o cálculo do status materializado dos documentos."""
+
+    def test_compute_document_status(self):
+        """Teste status e próxima transição a partir dos vencimentos."""
+        from datetime import date
+        from app.services.document_status_service import compute_document_status
+
+        today = date(2025, 6, 1)
+
+        # Sem documentos: vigente e sem transição
+        self.assertEqual(compute_document_status([], today), ('valid', None))
+
+        # Vigente: passa a 'expiring' 30 dias antes do vencimento mais próximo
+        self.assertEqual(
+            compute_document_status([date(2025, 12, 31), date(2025, 9, 30)], today),
+            ('valid', date(2025, 8, 31))
+        )
+
+        # Próximo a vencer: passa a 'expired' no dia seguinte ao vencimento
+        self.assertEqual(
+            compute_document_status([date(2025, 6, 1), date(2026, 1, 1)], today),
+            ('expiring', date(2025, 6, 2))
+        )
+
+        # Vencido: não há mais transições
+        self.assertEqual(compute_document_status([date(2025, 5, 31)], today), ('expired', None))
+
+
+class TestDocumentService(unittest.TestCase):
+    """Testes do relatório de documentos a vencer."""
+
+    def test_expiring_document_item_formats_cpf(self):
+        """Teste que o CPF guardado como número sai formatado no relatório."""
+        from datetime import date
+        from sqlalchemy import BigInteger, Date, create_engine, literal, select
+        from app.services.document_service import expiring_document_item
+
+        engine = create_engine('sqlite://')
+        with engine.connect() as connection:
+            row = connection.execute(select(
+                literal('doc-1').label('id'),
+                literal('ASO').label('name'),
+                literal(date(2025, 6, 30), Date).label('expiration_date'),
+                literal(52998224725, BigInteger).label('cpf')
+            )).one()
+        engine.dispose()
+
+        item = expiring_document_item(row)
+        self.assertEqual(item['cpf'], '529.982.247-25')
+        self.assertEqual(item['expiration_date'], '2025-06-30')
+
+
 if __name__ == '__main__':
     print("🧪 Executando testes de serviços...")
     unittest.main(verbosity=2)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Testes para o cache de tokens JWT verificados."""
+
+import unittest
+import sys
+import os
+import time
+import uuid
+from types import SimpleNamespace
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.token_cache import TokenCache
+from app.utils.auth import create_access_token, parse_authorization, verified_tokens
+
+
+class TestTokenCache(unittest.TestCase):
+    """Testes do LRU com expiração pelo 'exp' do token."""
+
+    def test_hit_and_miss(self):
+        """Teste token verificado é encontrado e desconhecido não."""
+        cache = TokenCache(max_entries=10)
+        user_id = uuid.uuid4()
+        cache.set('token-a', user_id, time.time() + 60)
+
+        self.assertEqual(cache.get('token-a'), user_id)
+        self.assertIsNone(cache.get('token-b'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_expired_token_is_dropped(self):
+        """Teste token vencido não é aceito pelo cache."""
+        cache = TokenCache(max_entries=10)
+        cache.set('token-a', uuid.uuid4(), time.time() - 1)
+
+        self.assertIsNone(cache.get('token-a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_lru_eviction(self):
+        """Teste que o token menos usado sai primeiro."""
+        cache = TokenCache(max_entries=2)
+        expires_at = time.time() + 60
+        cache.set('a', 1, expires_at)
+        cache.set('b', 2, expires_at)
+        cache.get('a')
+        cache.set('c', 3, expires_at)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_init_app_uses_app_config(self):
+        """Teste tamanho definido pela configuração da aplicação."""
+        cache = TokenCache(max_entries=10)
+        cache.set('a', 1, time.time() + 60)
+
+        cache.init_app(SimpleNamespace(config={'TOKEN_CACHE_MAX_ENTRIES': 0}))
+        cache.set('b', 2, time.time() + 60)
+
+        self.assertEqual(cache.max_entries, 0)
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+
+class TestParseAuthorization(unittest.TestCase):
+    """Testes da verificação do header Authorization com cache."""
+
+    def setUp(self):
+        verified_tokens.clear()
+
+    def test_repeated_token_uses_cache(self):
+        """Teste segunda requisição com o mesmo token não refaz a verificação."""
+        user_id = uuid.uuid4()
+        header = f'Bearer {create_access_token(user_id)}'
+        hits = verified_tokens.hits
+
+        self.assertEqual(parse_authorization(header), (user_id, None))
+        self.assertEqual(parse_authorization(header), (user_id, None))
+        self.assertEqual(verified_tokens.hits, hits + 1)
+
+    def test_invalid_token_not_cached(self):
+        """Teste token inválido é recusado e não entra no cache."""
+        user_id, error = parse_authorization('Bearer abc.def.ghi')
+
+        self.assertIsNone(user_id)
+        self.assertEqual(error, ('Token inválido', 401))
+        self.assertEqual(verified_tokens.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    print("🧪 Executando testes do cache de tokens...")
+    unittest.main(verbosity=2)